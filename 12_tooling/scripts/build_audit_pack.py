@@ -4,23 +4,120 @@ from __future__ import annotations
 
 import json
 import hashlib
+import os
+import sys
 import tarfile
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 
+# Sibling helper modules live next to this script
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
 
-def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+from deterministic_tar import COMPRESSIONS, DeterministicTarWriter  # noqa: E402
+from hash_engine import FileEntry, HashCache, hash_files, sha256_file  # noqa: E402,F401
 
+PACK_SECTIONS = ("evidence_files", "policy_files")
 
-def build_audit_pack(repo_root: Path | str = ".") -> dict:
+# File suffix -> pack section
+SECTION_SUFFIXES = {".json": "evidence_files", ".yaml": "policy_files"}
+
+# Directories never descended into during discovery
+PRUNED_DIRS = {
+    ".git",
+    "node_modules",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    ".tox",
+    ".venv",
+}
+
+
+def discover_files(
+    root: Path,
+    suffixes: dict = SECTION_SUFFIXES,
+    pruned: set = PRUNED_DIRS,
+    exclude: Optional[Path] = None,
+) -> dict[str, list[FileEntry]]:
+    """Find pack files in one os.scandir pass, classified by suffix.
+
+    Pruned directories are skipped before descending and symlinked
+    directories are not followed. Each file is stat'ed once and the result
+    travels with its FileEntry. Sections are sorted by relative path.
+    """
+    excluded = None
+    if exclude is not None:
+        try:
+            st = os.stat(exclude)
+            excluded = (st.st_dev, st.st_ino)
+        except OSError:
+            pass
+
+    found: dict[str, list[FileEntry]] = {section: [] for section in suffixes.values()}
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in pruned:
+                    stack.append(entry.path)
+                continue
+            section = suffixes.get(os.path.splitext(entry.name)[1])
+            if section is None:
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            if excluded is not None and (st.st_dev, st.st_ino) == excluded:
+                continue
+            found[section].append(FileEntry(Path(entry.path), st.st_size, st.st_mtime_ns))
+
+    for section_entries in found.values():
+        section_entries.sort(key=lambda e: e.path.relative_to(root).as_posix())
+    return found
+
+
+def combined_hash(hashes) -> str:
+    """Order-independent digest over a collection of file hashes."""
+    return hashlib.sha256("\n".join(sorted(hashes)).encode()).hexdigest()
+
+
+def build_audit_pack(
+    repo_root: Path | str = ".",
+    workers: Optional[int] = None,
+    hash_cache: Optional[Path | str] = None,
+    previous: Optional[dict] = None,
+) -> dict:
+    """Index and hash every evidence (*.json) and policy (*.yaml) file.
+
+    Files are listed by a single pruned walk (see ``discover_files``) in
+    sorted path order. Each entry records the file's size and mtime_ns.
+
+    Digests of files whose size and mtime are unchanged are taken from the
+    ``hash_cache`` sidecar and from the entries of a ``previous`` pack, so
+    only new or modified files are read. The sidecar itself is never indexed.
+    """
     root = Path(repo_root)
-    evidence_files = list(root.rglob("*.json"))
-    policy_files = list(root.rglob("*.yaml"))
+    cache = HashCache(hash_cache) if hash_cache is not None else None
+    if previous is not None:
+        if cache is None:
+            cache = HashCache(None)
+        for section in PACK_SECTIONS:
+            for e in previous.get(section, []):
+                if "mtime_ns" in e:
+                    cache.seed(FileEntry(root / e["path"], e["size"], e["mtime_ns"]), e["sha256"])
+    found = discover_files(root, exclude=cache.path if cache is not None else None)
 
     pack = {
         "build_id": f"audit-pack-{datetime.now(timezone.utc).isoformat()}",
@@ -31,34 +128,199 @@ def build_audit_pack(repo_root: Path | str = ".") -> dict:
         "combined_hash": "",
     }
 
-    for f in evidence_files:
-        pack["evidence_files"].append({
-            "path": str(f.relative_to(root)),
-            "sha256": sha256_file(f),
-            "size": f.stat().st_size,
-        })
+    # Discovery already stat'ed every file; hash everything on the thread pool
+    entries = [(section, entry) for section in PACK_SECTIONS for entry in found[section]]
+    digests, stats = hash_files((entry for _, entry in entries), workers, cache)
+    if cache is not None:
+        cache.save()
 
-    for f in policy_files:
-        pack["policy_files"].append({
-            "path": str(f.relative_to(root)),
-            "sha256": sha256_file(f),
-            "size": f.stat().st_size,
+    for (section, entry), digest in zip(entries, digests):
+        pack[section].append({
+            "path": str(entry.path.relative_to(root)),
+            "sha256": digest,
+            "size": entry.size,
+            "mtime_ns": entry.mtime_ns,
         })
 
     pack["total_files"] = len(pack["evidence_files"]) + len(pack["policy_files"])
 
     # Combined hash of all file hashes
-    all_hashes = sorted(
+    pack["combined_hash"] = combined_hash(
         [e["sha256"] for e in pack["evidence_files"]]
         + [p["sha256"] for p in pack["policy_files"]]
     )
-    pack["combined_hash"] = hashlib.sha256("\n".join(all_hashes).encode()).hexdigest()
+    pack["hash_stats"] = stats.to_dict()
 
     return pack
 
 
+def check_pack(pack: dict) -> None:
+    """Raise ValueError unless the pack's combined_hash matches its entries."""
+    hashes = [e["sha256"] for section in PACK_SECTIONS for e in pack.get(section, [])]
+    if combined_hash(hashes) != pack.get("combined_hash"):
+        raise ValueError("Previous pack's combined_hash does not match its entries")
+
+
+def delta_pack(previous: dict, current: dict) -> dict:
+    """Describe ``current`` relative to ``previous`` as added/changed/removed entries.
+
+    ``current`` should be built with ``previous=`` so untouched files carry
+    the hashes recorded in the previous pack instead of being rehashed.
+    """
+    check_pack(previous)
+    old = {(s, e["path"]): e for s in PACK_SECTIONS for e in previous.get(s, [])}
+    new = {(s, e["path"]): e for s in PACK_SECTIONS for e in current.get(s, [])}
+
+    added, changed, removed = [], [], []
+    for key, entry in new.items():
+        before = old.get(key)
+        if before is None:
+            added.append(dict(entry, section=key[0]))
+        elif before["sha256"] != entry["sha256"] or before["size"] != entry["size"]:
+            changed.append(dict(entry, section=key[0], previous_sha256=before["sha256"]))
+    for key, entry in old.items():
+        if key not in new:
+            removed.append({"path": entry["path"], "section": key[0], "sha256": entry["sha256"]})
+
+    return {
+        "build_id": current["build_id"],
+        "created_at_utc": current["created_at_utc"],
+        "since_build_id": previous.get("build_id"),
+        "since_combined_hash": previous.get("combined_hash"),
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+        "unchanged": len(new) - len(added) - len(changed),
+        "total_files": current["total_files"],
+        "combined_hash": current["combined_hash"],
+        "hash_stats": current.get("hash_stats", {}),
+    }
+
+
+INDEX_MEMBER = "audit_pack.json"
+ARCHIVE_COMPRESSIONS = COMPRESSIONS
+
+# Build-local fields left out of the archived index so identical trees give
+# identical archives
+VOLATILE_INDEX_KEYS = ("build_id", "created_at_utc", "hash_stats")
+
+
+def archive_index(pack: dict) -> dict:
+    """The pack index as embedded in an archive, without build-local fields."""
+    index = {k: v for k, v in pack.items() if k not in VOLATILE_INDEX_KEYS}
+    for section in PACK_SECTIONS:
+        index[section] = [
+            {k: v for k, v in entry.items() if k != "mtime_ns"} for entry in pack[section]
+        ]
+    return index
+
+
+def write_archive(
+    pack: dict,
+    repo_root: Path | str,
+    archive_path: Path | str,
+    compression: str = "gz",
+) -> dict:
+    """Stream the pack index and every indexed file into one compressed tar.
+
+    The index (see ``archive_index``) is the first member, so consumers can
+    validate the archive in one sequential read. File data is hashed while
+    it is copied into the archive and must match the index. On mismatch the
+    partial archive is removed and ValueError is raised.
+    """
+    root = Path(repo_root)
+    archive_path = Path(archive_path)
+    index_bytes = json.dumps(archive_index(pack), indent=2).encode()
+
+    members = 0
+    total = len(index_bytes)
+    writer = DeterministicTarWriter(archive_path, compression)
+    try:
+        writer.add(INDEX_MEMBER, len(index_bytes), [index_bytes])
+        for section in PACK_SECTIONS:
+            for entry in pack[section]:
+                rel = Path(entry["path"])
+                if writer.add_file(rel.as_posix(), root / rel, entry["size"]) != entry["sha256"]:
+                    raise ValueError(f"{rel}: content changed after it was indexed")
+                members += 1
+                total += entry["size"]
+        archive_sha256 = writer.close()
+    except BaseException:
+        writer.abort()
+        archive_path.unlink(missing_ok=True)
+        raise
+    return {
+        "path": str(archive_path),
+        "compression": compression,
+        "members": members + 1,
+        "bytes": total,
+        "archive_sha256": archive_sha256,
+    }
+
+
+def verify_archive(archive_path: Path | str) -> dict:
+    """Check every member of a pack archive against its embedded index in one pass."""
+    mismatches = []
+    seen = set()
+    index = None
+    with tarfile.open(archive_path, mode="r|*") as tar:
+        for member in tar:
+            data = tar.extractfile(member)
+            if index is None:
+                if member.name != INDEX_MEMBER:
+                    raise ValueError(f"First member is {member.name}, expected {INDEX_MEMBER}")
+                index = json.load(data)
+                expected = {
+                    Path(e["path"]).as_posix(): e["sha256"]
+                    for section in PACK_SECTIONS for e in index.get(section, [])
+                }
+                continue
+            h = hashlib.sha256()
+            for chunk in iter(lambda: data.read(1024 * 1024), b""):
+                h.update(chunk)
+            seen.add(member.name)
+            if expected.get(member.name) != h.hexdigest():
+                mismatches.append(member.name)
+    if index is None:
+        raise ValueError("Empty archive")
+    missing = sorted(set(expected) - seen)
+    return {
+        "combined_hash": index.get("combined_hash"),
+        "members_checked": len(seen),
+        "mismatches": mismatches,
+        "missing": missing,
+        "status": "PASS" if not mismatches and not missing else "FAIL",
+    }
+
+
 if __name__ == "__main__":
-    import sys
-    repo = sys.argv[1] if len(sys.argv) > 1 else "."
-    pack = build_audit_pack(repo)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the compliance audit pack index")
+    parser.add_argument("repo", nargs="?", default=".", help="Repository root (default: .)")
+    parser.add_argument("--workers", type=int, help="Hashing threads (default: CPU count + 4, max 32)")
+    parser.add_argument("--hash-cache", metavar="PATH", help="Sidecar of (path, size, mtime_ns) -> sha256; skips unchanged files")
+    parser.add_argument("--since", metavar="PACK", help="Previous pack JSON; reuse its hashes for unchanged files and emit only added/changed/removed entries")
+    parser.add_argument("--archive", metavar="PATH", help="Also write index and files into a deterministic tar archive")
+    parser.add_argument("--compression", choices=ARCHIVE_COMPRESSIONS, default="gz", help="Archive compression (default: gz)")
+    parser.add_argument("--verify-archive", metavar="PATH", help="Verify an existing pack archive against its index and exit")
+    args = parser.parse_args()
+    if args.archive and args.since:
+        parser.error("--archive needs a full pack and cannot be combined with --since")
+
+    if args.verify_archive:
+        result = verify_archive(args.verify_archive)
+        print(json.dumps(result, indent=2))
+        sys.exit(0 if result["status"] == "PASS" else 1)
+
+    previous = None
+    if args.since:
+        with open(args.since, encoding="utf-8") as f:
+            previous = json.load(f)
+        check_pack(previous)
+    pack = build_audit_pack(args.repo, workers=args.workers, hash_cache=args.hash_cache, previous=previous)
+    if args.archive:
+        pack["archive"] = write_archive(pack, args.repo, args.archive, args.compression)
+    if previous is not None:
+        pack = delta_pack(previous, pack)
     print(json.dumps(pack, indent=2))
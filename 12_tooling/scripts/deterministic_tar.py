@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Deterministic streaming tar writer for the audit pack archive.
+
+Members are written straight into the gzip/xz compressor with fixed mtime,
+owner and mode, member data is hashed as it is written, and no temporary
+files are created. Identical inputs produce byte-identical archives.
+
+The tooling scripts are exported without the ``src`` package, so this
+module must not import from it.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import lzma
+import tarfile
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+
+COMPRESSIONS = ("gz", "xz")
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+class _HashingWriter:
+    """Pass-through writer that hashes the compressed archive bytes."""
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        return self._raw.write(data)
+
+    def flush(self) -> None:
+        self._raw.flush()
+
+
+def iter_chunks(stream: BinaryIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield fixed-size byte chunks from a binary stream."""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class DeterministicTarWriter:
+    """Streaming GNU tar writer with reproducible headers."""
+
+    def __init__(self, archive_path: Path | str, compression: str = "gz") -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        self._raw = open(archive_path, "wb")
+        self._hashing = _HashingWriter(self._raw)
+        if compression == "gz":
+            # Fixed gzip header mtime and no embedded filename
+            self._stream = gzip.GzipFile(filename="", mode="wb", fileobj=self._hashing, mtime=0)
+        else:
+            self._stream = lzma.LZMAFile(self._hashing, "wb", format=lzma.FORMAT_XZ)
+        self._offset = 0
+        self.archive_sha256 = ""
+
+    def add(self, name: str, size: int, pieces: Iterable[bytes]) -> str:
+        """Write one regular-file member of exactly ``size`` bytes; return its sha256."""
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = 0
+        info.mode = 0o644
+        info.uid = info.gid = 0
+        info.uname = info.gname = ""
+        self._write(info.tobuf(tarfile.GNU_FORMAT, "utf-8", "surrogateescape"))
+
+        h = hashlib.sha256()
+        written = 0
+        for piece in pieces:
+            h.update(piece)
+            written += len(piece)
+            if written > size:
+                raise ValueError(f"{name}: content grew beyond {size} bytes while archiving")
+            self._write(piece)
+        if written != size:
+            raise ValueError(f"{name}: expected {size} bytes, got {written}")
+        remainder = size % tarfile.BLOCKSIZE
+        if remainder:
+            self._write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+        return h.hexdigest()
+
+    def add_file(self, name: str, path: Path | str, size: int) -> str:
+        """Copy a file into the archive in fixed-size chunks; return its sha256."""
+        with open(path, "rb") as f:
+            return self.add(name, size, iter_chunks(f))
+
+    def close(self) -> str:
+        """Write the end-of-archive marker and return the archive's sha256."""
+        if self._raw.closed:
+            return self.archive_sha256
+        try:
+            self._write(tarfile.NUL * (tarfile.BLOCKSIZE * 2))
+            remainder = self._offset % tarfile.RECORDSIZE
+            if remainder:
+                self._write(tarfile.NUL * (tarfile.RECORDSIZE - remainder))
+            self._stream.close()
+        finally:
+            self._raw.close()
+        self.archive_sha256 = self._hashing.sha256.hexdigest()
+        return self.archive_sha256
+
+    def abort(self) -> None:
+        """Close the underlying file without finishing the archive."""
+        try:
+            self._stream.close()
+        finally:
+            self._raw.close()
+
+    def _write(self, data: bytes) -> None:
+        self._stream.write(data)
+        self._offset += len(data)
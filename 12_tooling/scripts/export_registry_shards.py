@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Sharded, append-only layout for the OpenCore export registry.
+
+Manifests are appended as one JSON object per line to monthly shards
+(``export_shards/YYYY-MM.jsonl``, keyed by ``created_at_utc``). A small
+``index.json`` next to them records each shard's manifest count and byte
+size, so verifiers can stream shards independently and detect truncation.
+The legacy ``opencore_export_registry.json`` keeps the registry header and
+any manifests written before the migration.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+
+REGISTRY_DIR = Path("24_meta_orchestration") / "registry"
+LEGACY_REGISTRY = REGISTRY_DIR / "opencore_export_registry.json"
+SHARD_DIR = REGISTRY_DIR / "export_shards"
+SHARD_INDEX = "index.json"
+SHARD_LAYOUT_VERSION = 1
+
+_MONTH_RE = re.compile(r"^\d{4}-\d{2}")
+
+
+def shard_name(manifest: dict) -> str:
+    """Monthly shard file for a manifest; undated manifests share one shard."""
+    created = manifest.get("created_at_utc")
+    if isinstance(created, str) and _MONTH_RE.match(created):
+        return f"{created[:7]}.jsonl"
+    return "undated.jsonl"
+
+
+def load_index(shard_dir: Path | str) -> Optional[dict]:
+    """Return the shard index, or None if the registry is not sharded."""
+    path = Path(shard_dir) / SHARD_INDEX
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class ShardedRegistry:
+    """Appends manifests to monthly JSONL shards and maintains the index."""
+
+    def __init__(self, shard_dir: Path | str) -> None:
+        self.shard_dir = Path(shard_dir)
+        self.index = load_index(self.shard_dir) or {
+            "layout": "sharded-jsonl",
+            "layout_version": SHARD_LAYOUT_VERSION,
+            "shards": [],
+            "total_manifests": 0,
+        }
+
+    def append(self, manifest: dict) -> None:
+        """Append one manifest."""
+        self.append_many([manifest])
+
+    def append_many(self, manifests: Iterable[dict]) -> int:
+        """Append manifests, opening each touched shard once; returns the count.
+
+        Shard lines are written before the index, so a crash can only leave
+        the index behind its shards, which the verifier reports and
+        ``reindex`` repairs.
+        """
+        by_shard: dict[str, list[bytes]] = {}
+        for manifest in manifests:
+            line = json.dumps(manifest, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+            by_shard.setdefault(shard_name(manifest), []).append(line)
+        if not by_shard:
+            return 0
+
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        entries = {entry["name"]: entry for entry in self.index["shards"]}
+        count = 0
+        for name, lines in by_shard.items():
+            with open(self.shard_dir / name, "ab") as f:
+                f.writelines(lines)
+            entry = entries.get(name)
+            if entry is None:
+                entry = entries[name] = {"name": name, "manifests": 0, "bytes": 0}
+            entry["manifests"] += len(lines)
+            entry["bytes"] += sum(len(line) for line in lines)
+            count += len(lines)
+
+        self.index["shards"] = sorted(entries.values(), key=lambda e: e["name"])
+        self.index["total_manifests"] = sum(e["manifests"] for e in self.index["shards"])
+        self.index["updated_at_utc"] = datetime.now(timezone.utc).isoformat()
+        self._save_index()
+        return count
+
+    def iter_manifests(self) -> Iterator[dict]:
+        """Stream every manifest, shard by shard, in append order."""
+        for entry in self.index["shards"]:
+            for _, line in iter_shard_lines(self.shard_dir / entry["name"]):
+                yield json.loads(line)
+
+    def reindex(self) -> dict:
+        """Rebuild the index from the shard files on disk.
+
+        Repairs an index left behind its shards by a crash, or one that no
+        longer matches edited shards. A torn last line (no trailing newline)
+        from an interrupted append is cut off first. Returns the shard count,
+        manifest total and the names of truncated shards.
+        """
+        entries = []
+        truncated = []
+        for path in sorted(self.shard_dir.glob("*.jsonl")):
+            manifests = 0
+            end = 0
+            torn = False
+            with open(path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        torn = True
+                        break
+                    end += len(line)
+                    if line.strip():
+                        manifests += 1
+            if torn:
+                os.truncate(path, end)
+                truncated.append(path.name)
+            entries.append({"name": path.name, "manifests": manifests, "bytes": end})
+
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        self.index["shards"] = entries
+        self.index["total_manifests"] = sum(e["manifests"] for e in entries)
+        self.index["updated_at_utc"] = datetime.now(timezone.utc).isoformat()
+        self._save_index()
+        return {"shards": len(entries), "total_manifests": self.index["total_manifests"], "truncated": truncated}
+
+    def _save_index(self) -> None:
+        path = self.shard_dir / SHARD_INDEX
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2)
+            f.write("\n")
+        os.replace(tmp, path)
+
+
+def iter_shard_lines(path: Path | str) -> Iterator[tuple[int, bytes]]:
+    """Yield (line_no, line) for the non-blank lines of a shard."""
+    with open(path, "rb") as f:
+        for line_no, line in enumerate(f, 1):
+            if line.strip():
+                yield line_no, line
+
+
+def migrate_legacy(repo_root: Path | str = ".") -> int:
+    """Move manifests from the legacy registry document into shards.
+
+    The legacy document keeps its header fields, an empty ``manifests``
+    list and a pointer to the shard index. Returns the number moved.
+    """
+    root = Path(repo_root)
+    legacy_path = root / LEGACY_REGISTRY
+    with open(legacy_path, encoding="utf-8") as f:
+        document = json.load(f)
+    manifests = document.get("manifests", [])
+    moved = ShardedRegistry(root / SHARD_DIR).append_many(manifests)
+
+    document["manifests"] = []
+    document["manifest_shards"] = (SHARD_DIR / SHARD_INDEX).relative_to(REGISTRY_DIR).as_posix()
+    tmp = legacy_path.with_name(legacy_path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, legacy_path)
+    return moved
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the sharded OpenCore export registry")
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate = sub.add_parser("migrate", help="Move legacy registry manifests into monthly shards")
+    migrate.add_argument("repo", nargs="?", default=".", help="Repository root (default: .)")
+    append = sub.add_parser("append", help="Append manifests from JSON files (object or list)")
+    append.add_argument("manifests", nargs="+", help="Manifest JSON files")
+    append.add_argument("--repo", default=".", help="Repository root (default: .)")
+    reindex = sub.add_parser("reindex", help="Rebuild the shard index from the shard files")
+    reindex.add_argument("repo", nargs="?", default=".", help="Repository root (default: .)")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        print(f"Migrated {migrate_legacy(args.repo)} manifest(s)")
+    elif args.command == "reindex":
+        result = ShardedRegistry(Path(args.repo) / SHARD_DIR).reindex()
+        print(f"Indexed {result['total_manifests']} manifest(s) in {result['shards']} shard(s)")
+        for name in result["truncated"]:
+            print(f"  - {name}: dropped a torn last line")
+    else:
+        registry = ShardedRegistry(Path(args.repo) / SHARD_DIR)
+        total = 0
+        for name in args.manifests:
+            with open(name, encoding="utf-8") as f:
+                data = json.load(f)
+            total += registry.append_many(data if isinstance(data, list) else [data])
+        print(f"Appended {total} manifest(s)")
+    sys.exit(0)
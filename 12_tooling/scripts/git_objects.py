@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Git object access for the boundary and leakage validators.
+
+Tracked files are enumerated from the index with ``git ls-files -s -z`` and
+their contents are streamed through one long-lived ``git cat-file --batch``
+process, so a scan sees exactly what gets published and reads each unique
+blob once.
+"""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import IO, Iterable, Iterator, NamedTuple, Optional
+
+# Symlinks and submodule entries carry no scannable file content
+_SKIPPED_MODES = {"120000", "160000"}
+
+_NULL_OID = "0" * 40
+
+
+class TrackedFile(NamedTuple):
+    path: str
+    blob: str
+    mode: str
+
+
+def list_tracked_files(repo_root: Path | str, pathspecs: Iterable[str] = ()) -> list[TrackedFile]:
+    """Return tracked regular files under ``pathspecs`` in index (path) order."""
+    out = subprocess.run(
+        ["git", "-c", "core.quotePath=false", "ls-files", "-s", "-z", "--", *pathspecs],
+        cwd=str(repo_root),
+        capture_output=True,
+        check=True,
+    ).stdout
+    files = []
+    seen = set()
+    for record in out.split(b"\0"):
+        if not record:
+            continue
+        meta, _, path = record.partition(b"\t")
+        mode, blob, _stage = meta.decode().split(" ")
+        name = path.decode("utf-8", errors="surrogateescape")
+        # Unmerged paths appear once per stage; keep the first
+        if mode in _SKIPPED_MODES or name in seen:
+            continue
+        seen.add(name)
+        files.append(TrackedFile(name, blob, mode))
+    return files
+
+
+class BlobIntroduction(NamedTuple):
+    commit: str
+    path: str
+    blob: str
+
+
+def _iter_nul_fields(stream: IO[bytes], chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """Yield NUL-separated fields from a byte stream without buffering it whole."""
+    pending = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        fields = (pending + chunk).split(b"\0")
+        pending = fields.pop()
+        yield from fields
+    if pending:
+        yield pending
+
+
+def iter_history_blobs(repo_root: Path | str) -> Iterator[BlobIntroduction]:
+    """Yield every blob written by every reachable commit, oldest first.
+
+    Walks ``git log --all --reverse --topo-order -m --raw --no-abbrev -z``:
+    parents come before children and merges are diffed against each parent,
+    so the first time a blob id is yielded names the commit that introduced
+    it. Deletions, symlinks and submodule entries are skipped.
+    """
+    proc = subprocess.Popen(
+        [
+            "git", "-c", "core.quotePath=false", "log", "--all", "--reverse", "--topo-order",
+            "-m", "--raw", "--no-abbrev", "-z", "--format=%x01%H",
+        ],
+        cwd=str(repo_root),
+        stdout=subprocess.PIPE,
+    )
+    commit = ""
+    fields = _iter_nul_fields(proc.stdout)
+    try:
+        for field in fields:
+            field = field.lstrip(b"\n")
+            if field.startswith(b"\x01"):
+                commit = field[1:].decode()
+                continue
+            if not field.startswith(b":"):
+                continue
+            _, new_mode, _, new_blob, status = field[1:].decode().split(" ")
+            path = next(fields)
+            if status[0] in "RC":
+                # Renames and copies name the source first, then the destination
+                path = next(fields)
+            if status[0] == "D" or new_mode in _SKIPPED_MODES or new_blob == _NULL_OID:
+                continue
+            yield BlobIntroduction(commit, path.decode("utf-8", errors="surrogateescape"), new_blob)
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.terminate()
+        if proc.wait() not in (0, -15):
+            raise subprocess.CalledProcessError(proc.returncode, "git log")
+
+
+class BlobContent(NamedTuple):
+    size: int
+    # None when the blob was larger than the caller's size cap
+    data: Optional[bytes]
+
+
+# Bytes per read when draining an oversized blob from the cat-file pipe
+_DRAIN_CHUNK = 1 << 16
+
+
+class BlobReader:
+    """Read blob contents through a single ``git cat-file --batch`` process."""
+
+    def __init__(self, repo_root: Path | str) -> None:
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=str(repo_root),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def __enter__(self) -> "BlobReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def read(self, blob: str) -> Optional[bytes]:
+        """Return the raw content of ``blob``, or None if it is missing."""
+        content = self.read_capped(blob)
+        return content.data if content is not None else None
+
+    def read_capped(self, blob: str, max_size: Optional[int] = None) -> Optional[BlobContent]:
+        """Return the size and content of ``blob``, or None if it is missing.
+
+        The size comes from the cat-file header, so a blob larger than
+        ``max_size`` is drained from the pipe in fixed chunks without being
+        buffered, and comes back with ``data`` set to None.
+        """
+        stdin, stdout = self._proc.stdin, self._proc.stdout
+        stdin.write(blob.encode() + b"\n")
+        stdin.flush()
+        header = stdout.readline().split()
+        if len(header) != 3:
+            # "<oid> missing" or "<oid> ambiguous"
+            return None
+        size = int(header[2])
+        if max_size is not None and size > max_size:
+            remaining = size + 1  # content and trailing newline
+            while remaining:
+                chunk = stdout.read(min(remaining, _DRAIN_CHUNK))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+            return BlobContent(size, None)
+        data = stdout.read(size)
+        stdout.read(1)  # trailing newline
+        return BlobContent(size, data)
+
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        if self._proc.poll() is None:
+            self._proc.stdin.close()
+            self._proc.wait()
+        self._proc.stdout.close()
+
+
+def decode_blob_text(data: bytes) -> str:
+    """Decode blob bytes the way ``Path.read_text(errors="ignore")`` would.
+
+    Text-mode reads translate CRLF and CR line endings, so do the same to
+    keep line numbers and matches identical to working-tree scans.
+    """
+    text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
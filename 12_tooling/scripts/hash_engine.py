@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Parallel SHA-256 engine for audit packs and manifest verification.
+
+Files are hashed on a thread pool: hashlib releases the GIL while digesting,
+so threads scale with cores and disk bandwidth. Reads go through a reusable
+1 MiB buffer, and files above the mmap threshold are digested straight from
+the page cache. An optional JSON sidecar cache keyed by (path, size,
+mtime_ns) skips files that have not changed since they were last hashed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+
+HASH_BUFFER_SIZE = 1024 * 1024
+MMAP_THRESHOLD = 64 * 1024 * 1024
+HASH_CACHE_VERSION = 1
+
+
+class FileEntry(NamedTuple):
+    path: Path
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def from_path(cls, path: Path) -> "FileEntry":
+        st = path.stat()
+        return cls(path, st.st_size, st.st_mtime_ns)
+
+
+def default_workers() -> int:
+    """Thread count for hashing; I/O bound, so more threads than cores."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def sha256_file(path: Path | str, size: Optional[int] = None) -> str:
+    """Return the hex SHA-256 of one file.
+
+    ``size`` (when already known from a stat) decides whether to mmap.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+            return h.hexdigest()
+        buf = bytearray(HASH_BUFFER_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+class HashCache:
+    """JSON sidecar mapping absolute path -> (size, mtime_ns, sha256).
+
+    Entries are never pruned on save, so one sidecar can be shared by
+    several tools hashing different trees. With ``path`` None the cache
+    lives in memory only.
+    """
+
+    def __init__(self, path: Optional[Path | str]) -> None:
+        self.path = Path(path) if path is not None else None
+        self.entries: dict[str, list] = {}
+        self._dirty = False
+        if self.path is None:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") == HASH_CACHE_VERSION:
+            self.entries = data.get("entries", {})
+
+    def get(self, entry: FileEntry) -> Optional[str]:
+        """Return the cached digest if the file's size and mtime are unchanged."""
+        cached = self.entries.get(os.path.abspath(entry.path))
+        if cached is not None and cached[0] == entry.size and cached[1] == entry.mtime_ns:
+            return cached[2]
+        return None
+
+    def put(self, entry: FileEntry, digest: str) -> None:
+        self.entries[os.path.abspath(entry.path)] = [entry.size, entry.mtime_ns, digest]
+        self._dirty = True
+
+    def seed(self, entry: FileEntry, digest: str) -> None:
+        """Add a digest recorded elsewhere (e.g. a previous pack) unless one is cached."""
+        self.entries.setdefault(os.path.abspath(entry.path), [entry.size, entry.mtime_ns, digest])
+
+    def save(self) -> None:
+        """Atomically write the sidecar if anything changed."""
+        if not self._dirty or self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": HASH_CACHE_VERSION, "entries": self.entries}, f)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+class HashStats:
+    """Throughput counters for one hashing run."""
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.files = 0
+        self.bytes = 0
+        self.cache_hits = 0
+        self.seconds = 0.0
+
+    def to_dict(self) -> dict:
+        seconds = self.seconds
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "cache_hits": self.cache_hits,
+            "workers": self.workers,
+            "elapsed_seconds": round(seconds, 6),
+            "files_per_second": round(self.files / seconds, 2) if seconds > 0 else 0.0,
+            "mb_per_second": round(self.bytes / seconds / (1024 * 1024), 2) if seconds > 0 else 0.0,
+        }
+
+
+def _hash_entry(entry: FileEntry, catch: bool) -> str | OSError:
+    try:
+        return sha256_file(entry.path, entry.size)
+    except OSError as e:
+        if not catch:
+            raise
+        return e
+
+
+def hash_files(
+    entries: Iterable[FileEntry],
+    workers: Optional[int] = None,
+    cache: Optional[HashCache] = None,
+    errors: Optional[dict] = None,
+) -> tuple[list[Optional[str]], HashStats]:
+    """Hash files in parallel; digests come back in input order.
+
+    With ``cache``, unchanged files reuse their recorded digest and only the
+    rest are read. ``files``/``bytes`` in the stats count what was hashed.
+    With ``errors``, a file that cannot be read gets digest None and its
+    OSError is stored under its path instead of being raised.
+    """
+    entries = list(entries)
+    workers = workers or default_workers()
+    stats = HashStats(workers)
+    start = time.perf_counter()
+
+    digests: list = [None] * len(entries)
+    pending = []
+    for i, entry in enumerate(entries):
+        cached = cache.get(entry) if cache is not None else None
+        if cached is None:
+            pending.append(i)
+        else:
+            digests[i] = cached
+    stats.cache_hits = len(entries) - len(pending)
+
+    todo = [entries[i] for i in pending]
+    catch = errors is not None
+    if workers <= 1 or len(todo) < 2:
+        fresh = [_hash_entry(entry, catch) for entry in todo]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(lambda entry: _hash_entry(entry, catch), todo))
+    for i, entry, digest in zip(pending, todo, fresh):
+        if isinstance(digest, OSError):
+            errors[entry.path] = digest
+            continue
+        digests[i] = digest
+        if cache is not None:
+            cache.put(entry, digest)
+
+    stats.seconds = time.perf_counter() - start
+    stats.files = len(todo)
+    stats.bytes = sum(entry.size for entry in todo)
+    return digests, stats
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Persistent per-file scan cache for the public boundary and leakage validators.
+
+Findings are stored per relative path together with the file's size and
+mtime_ns (or git blob id). A rerun replays cached findings for unchanged
+files and rescans only the rest. The whole cache is discarded when the
+rule-set hash changes, so editing any rule list invalidates every entry.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+
+CACHE_VERSION = 1
+
+
+def ruleset_hash(*parts: Any) -> str:
+    """Stable hash over rule definitions (pattern lists, keywords, versions)."""
+    encoded = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ScanCache:
+    """JSON-backed map of relative path -> (size, mtime_ns, blob, scope, findings)."""
+
+    def __init__(self, path: Path | str, rules: str) -> None:
+        self.path = Path(path)
+        self.rules = rules
+        self.entries: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._seen: set[str] = set()
+        self._dirty = False
+        self._load()
+
+    def get(
+        self,
+        rel_path: str,
+        size: int,
+        mtime_ns: int,
+        scope: Optional[str] = None,
+        blob: Optional[str] = None,
+    ) -> Optional[Any]:
+        """Return cached findings if the file and scan scope are unchanged.
+
+        ``scope`` names the rule subset the findings were produced for. When
+        ``blob`` is given the git blob id decides freshness instead of size
+        and mtime.
+        """
+        self._seen.add(rel_path)
+        entry = self.entries.get(rel_path)
+        if entry is not None and entry.get("scope") == scope:
+            if blob is not None:
+                fresh = entry.get("blob") == blob
+            else:
+                fresh = entry.get("size") == size and entry.get("mtime_ns") == mtime_ns
+            if fresh:
+                self.hits += 1
+                return entry["findings"]
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        rel_path: str,
+        size: int,
+        mtime_ns: int,
+        findings: Any,
+        scope: Optional[str] = None,
+        blob: Optional[str] = None,
+    ) -> None:
+        """Store findings for a freshly scanned file."""
+        self._seen.add(rel_path)
+        self.entries[rel_path] = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "blob": blob,
+            "scope": scope,
+            "findings": findings,
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache, dropping entries for files not seen in this run."""
+        stale = set(self.entries) - self._seen
+        if not self._dirty and not stale:
+            return
+        for rel_path in stale:
+            del self.entries[rel_path]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "rules": self.rules, "entries": self.entries}, f)
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != CACHE_VERSION or data.get("rules") != self.rules:
+            # Rule lists changed: every cached finding is suspect
+            return
+        self.entries = data.get("entries", {})
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Scan profiling and SARIF output for the boundary and leakage validators.
+
+ScanProfile accumulates time per rule, per root and per file (keeping only
+the top-N slowest files), plus bytes scanned and files skipped. Slow rules
+stand out by their seconds-per-call, which is how catastrophic backtracking
+shows up before it reaches CI. Findings are written as SARIF 2.1.0.
+"""
+from __future__ import annotations
+
+import heapq
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+
+SARIF_VERSION = "2.1.0"
+
+
+class ScanProfile:
+    """Timing and volume counters for one validator run."""
+
+    def __init__(self, top_n: int = 20) -> None:
+        self.top_n = top_n
+        self.rules: dict[str, dict] = {}
+        self.roots: dict[str, dict] = {}
+        self._slowest: list[tuple[float, str]] = []
+        self.files_scanned = 0
+        self.files_skipped = 0
+        self.files_cached = 0
+        self.bytes_scanned = 0
+
+    def add_rule(self, rule_id: str, seconds: float, hit: bool, pattern: Optional[str] = None) -> None:
+        """Record one evaluation of a rule against one file."""
+        entry = self.rules.get(rule_id)
+        if entry is None:
+            entry = self.rules[rule_id] = {"pattern": pattern, "seconds": 0.0, "calls": 0, "hits": 0}
+        entry["seconds"] += seconds
+        entry["calls"] += 1
+        entry["hits"] += int(hit)
+
+    def add_file(self, path: str, root: str, seconds: float, size: int) -> None:
+        """Record a scanned file's total scan time and size."""
+        self.files_scanned += 1
+        self.bytes_scanned += size
+        entry = self.roots.setdefault(root, {"seconds": 0.0, "files": 0, "bytes": 0})
+        entry["seconds"] += seconds
+        entry["files"] += 1
+        entry["bytes"] += size
+        item = (seconds, path)
+        if len(self._slowest) < self.top_n:
+            heapq.heappush(self._slowest, item)
+        elif item > self._slowest[0]:
+            heapq.heapreplace(self._slowest, item)
+
+    def skip(self) -> None:
+        """Count a file that was walked but not read."""
+        self.files_skipped += 1
+
+    def cached(self) -> None:
+        """Count a file whose findings were replayed from a cache."""
+        self.files_cached += 1
+
+    def to_dict(self) -> dict:
+        """Profile as a JSON-ready dict; rules and roots sorted slowest first."""
+        rules = {}
+        for rule_id, entry in sorted(self.rules.items(), key=lambda kv: -kv[1]["seconds"]):
+            rules[rule_id] = dict(entry, seconds=round(entry["seconds"], 6))
+            rules[rule_id]["us_per_call"] = round(entry["seconds"] / entry["calls"] * 1e6, 2) if entry["calls"] else 0.0
+        roots = {
+            root: dict(entry, seconds=round(entry["seconds"], 6))
+            for root, entry in sorted(self.roots.items(), key=lambda kv: -kv[1]["seconds"])
+        }
+        slowest = [
+            {"path": path, "seconds": round(seconds, 6)}
+            for seconds, path in sorted(self._slowest, reverse=True)
+        ]
+        return {
+            "files_scanned": self.files_scanned,
+            "files_skipped": self.files_skipped,
+            "files_cached": self.files_cached,
+            "bytes_scanned": self.bytes_scanned,
+            "rules": rules,
+            "roots": roots,
+            "slowest_files": slowest,
+        }
+
+
+def sarif_result(rule_id: str, message: str, uri: str, line: Optional[int] = None, level: str = "error") -> dict:
+    """Build one SARIF result located at ``uri`` (and ``line`` when known)."""
+    location: dict[str, Any] = {"artifactLocation": {"uri": uri}}
+    if line is not None:
+        location["region"] = {"startLine": line}
+    return {
+        "ruleId": rule_id,
+        "level": level,
+        "message": {"text": message},
+        "locations": [{"physicalLocation": location}],
+    }
+
+
+def sarif_log(tool_name: str, tool_version: str, rules: dict[str, str], results: list[dict]) -> dict:
+    """Wrap results in a single-run SARIF 2.1.0 log; ``rules`` maps id -> description."""
+    return {
+        "version": SARIF_VERSION,
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": tool_name,
+                        "version": tool_version,
+                        "rules": [
+                            {"id": rule_id, "shortDescription": {"text": text}}
+                            for rule_id, text in rules.items()
+                        ],
+                    }
+                },
+                "results": results,
+            }
+        ],
+    }
+
+
+def write_json(path: Path | str, data: Any) -> None:
+    """Write a JSON document (profile or SARIF log) to ``path``."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
@@ -15,10 +15,24 @@ Version: 1.0.0
 
 import re
 import sys
+import time
+from collections import deque
 from pathlib import Path
+from typing import Iterable, Iterator
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
+# Sibling helper modules live next to this script
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from git_objects import BlobReader, decode_blob_text, list_tracked_files  # noqa: E402
+from scan_cache import ScanCache, ruleset_hash  # noqa: E402
+from scan_report import ScanProfile, sarif_log, sarif_result, write_json  # noqa: E402
+
+VALIDATOR_VERSION = "1.0.0"
+
 # Boundary rules
 PRIVATE_REPO_PATTERNS = [
     r"(?i)ssid-private",  # SSID-private repo specifically
@@ -113,177 +127,468 @@ def is_in_exported_root(file_path: Path) -> bool:
     return any(rel_path.startswith(root + "/") for root in EXPORTED_ROOTS)
 
 
-def validate_no_private_repo_refs(repo_root: Path) -> list[str]:
-    """Check for private repo references (except in definition files)."""
-    violations = []
-    repo_abs = repo_root.resolve()
+# Suffixes whose content is scanned by the text rule families
+SCANNED_SUFFIXES = {".py", ".md", ".yaml", ".yml", ".json", ".sh"}
+SECRET_SCAN_SUFFIXES = {".py", ".md", ".yaml", ".yml", ".json"}
+
+# Rule families checked by the single-walk scanner, in report order
+RULE_FAMILIES = ("private_repo_refs", "local_paths", "secrets", "mainnet_claims")
+
+_BLOCKED_FILE_RES = [re.compile(p) for p in BLOCKED_FILE_PATTERNS]
+
+# Precompiled content rules per pattern family; replaced once per worker
+# process by _init_scan_worker in --jobs mode
+_RULESET = {
+    "private_repo_refs": [re.compile(p) for p in PRIVATE_REPO_PATTERNS],
+    "local_paths": [re.compile(p) for p in ABSOLUTE_PATH_PATTERNS],
+    "secrets": [re.compile(p) for p in SECRET_PATTERNS],
+}
+
+MAINNET_TRIGGER_WORDS = ["mainnet", "production", "live"]
+MAINNET_ALLOWED_CONTEXT = [
+    "testnet",
+    "readiness",
+    "planned",
+    "future",
+    "will",
+    "https://",
+    "http://",
+    "link",
+    "reference",
+]
 
-    # Only scan exported roots
-    for root in EXPORTED_ROOTS:
-        root_path = repo_root / root
-        if not root_path.exists():
-            continue
 
-        for file in root_path.rglob("*"):
-            if not file.is_file():
+def _content_families(file: Path, families: tuple) -> tuple:
+    """Return the content rule families that apply to ``file``."""
+    suffix = file.suffix
+    posix = str(file).replace("\\", "/")
+    in_tests = "/tests/" in posix
+    definition = None
+    applicable = []
+    for family in families:
+        if family == "mainnet_claims":
+            # Markdown only; definition files are not exempt here
+            if suffix == ".md" and not in_tests:
+                applicable.append(family)
+            continue
+        if family == "private_repo_refs":
+            if suffix not in SCANNED_SUFFIXES:
                 continue
-            if is_pattern_definition_file(file):
+        elif family == "local_paths":
+            # Allow paths in test files
+            if suffix not in SCANNED_SUFFIXES or in_tests or "test_" in file.name:
                 continue
-            if file.suffix not in [".py", ".md", ".yaml", ".yml", ".json", ".sh"]:
+        elif family == "secrets":
+            # Skip test files
+            if suffix not in SECRET_SCAN_SUFFIXES or in_tests or "test" in file.name:
                 continue
+        # Allow patterns in pattern definition files
+        if definition is None:
+            definition = is_pattern_definition_file(file)
+        if not definition:
+            applicable.append(family)
+    return tuple(applicable)
 
-            try:
-                content = file.read_text(encoding="utf-8", errors="ignore")
-                for pattern in PRIVATE_REPO_PATTERNS:
-                    if re.search(pattern, content):
-                        rel_path = file.resolve().relative_to(repo_abs)
-                        violations.append(f"{rel_path}: private repo reference")
-                        break
-            except Exception:
-                pass
 
-    return violations
+def scan_file_content(content: str, families: tuple) -> dict:
+    """Run the given content rule families over one file's text.
+
+    Returns a dict mapping each family to its findings: a bool for the
+    pattern families and a list of 1-based line numbers for mainnet claims.
+    """
+    findings = {}
+    for family in families:
+        if family == "mainnet_claims":
+            findings[family] = find_mainnet_claims(content)
+        else:
+            findings[family] = any(p.search(content) for p in _RULESET[family])
+    return findings
+
+
+def _iter_lines(content: str) -> Iterator[str]:
+    """Yield the pieces of ``content.split("\n")`` without building the list."""
+    start = 0
+    while True:
+        end = content.find("\n", start)
+        if end < 0:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
+def iter_mainnet_claims(lines: Iterable[str]) -> Iterator[int]:
+    """Yield 1-based line numbers of unbacked mainnet claims in one pass.
+
+    Each line is lowercased once and reduced to two flags (trigger word,
+    allowed context). A rolling window of five flag pairs decides line i as
+    soon as line i + 2 has been seen, so memory stays constant per file. A
+    claim is a trigger line with no allowed-context keyword anywhere within
+    two lines of it.
+    """
+    window: deque = deque(maxlen=5)  # (line_no, trigger, allowed)
+    line_no = 0
+    for line_no, line in enumerate(lines, 1):
+        lowered = line.lower()
+        window.append((
+            line_no,
+            any(word in lowered for word in MAINNET_TRIGGER_WORDS),
+            any(keyword in lowered for keyword in MAINNET_ALLOWED_CONTEXT),
+        ))
+        if len(window) >= 3:
+            # The window now holds exactly lines target - 2 .. target + 2
+            target, trigger, _ = window[-3]
+            if trigger and not any(allowed for _, _, allowed in window):
+                yield target
+
+    # The last two lines have a truncated trailing context
+    for target, trigger, _ in list(window)[-2:]:
+        if target <= line_no - 2:
+            continue
+        if trigger and not any(allowed for n, _, allowed in window if n >= target - 2):
+            yield target
 
 
-def validate_no_local_paths(repo_root: Path) -> list[str]:
-    """Check for absolute local paths (except in definition/test files)."""
-    violations = []
-    repo_abs = repo_root.resolve()
+def find_mainnet_claims(content: str) -> list[int]:
+    """Return 1-based line numbers of mainnet/production claims without backing context."""
+    return list(iter_mainnet_claims(_iter_lines(content)))
+
 
-    # Only scan exported roots
+def collect_scan_tasks(repo_root: Path, families: tuple = RULE_FAMILIES) -> list[tuple]:
+    """Walk each exported root once and plan the work for every file.
+
+    Returns (root, file, content_families, blocked) tuples in walk order.
+    """
+    tasks = []
+    check_blocked = "secrets" in families
     for root in EXPORTED_ROOTS:
         root_path = repo_root / root
         if not root_path.exists():
             continue
-
         for file in root_path.rglob("*"):
             if not file.is_file():
                 continue
-            if file.suffix not in [".py", ".md", ".yaml", ".yml", ".json", ".sh"]:
-                continue
+            blocked = check_blocked and any(p.match(file.name) for p in _BLOCKED_FILE_RES)
+            tasks.append((root, file, _content_families(file, families), blocked))
+    return tasks
 
-            # Allow paths in pattern definition files
-            if is_pattern_definition_file(file):
-                continue
-            # Allow paths in test files
-            if "/tests/" in str(file).replace("\\", "/"):
-                continue
-            if "test_" in file.name:
-                continue
 
-            try:
-                content = file.read_text(encoding="utf-8", errors="ignore")
-                for pattern in ABSOLUTE_PATH_PATTERNS:
-                    if re.search(pattern, content):
-                        rel_path = file.resolve().relative_to(repo_abs)
-                        violations.append(f"{rel_path}: absolute local path")
-                        break
-            except Exception:
-                pass
+def collect_git_scan_tasks(repo_root: Path, families: tuple = RULE_FAMILIES) -> tuple[list[tuple], list[str]]:
+    """Plan the scan from the files tracked in the exported roots.
 
-    return violations
+    Returns the tasks in index order plus the blob id of each task's file.
+    """
+    tasks = []
+    blobs = []
+    check_blocked = "secrets" in families
+    for tracked in list_tracked_files(repo_root, EXPORTED_ROOTS):
+        file = repo_root / tracked.path
+        blocked = check_blocked and any(p.match(file.name) for p in _BLOCKED_FILE_RES)
+        tasks.append((tracked.path.split("/", 1)[0], file, _content_families(file, families), blocked))
+        blobs.append(tracked.blob)
+    return tasks, blobs
+
+
+def scan_task(task: tuple) -> dict:
+    """Read one planned file (at most once) and return its content findings."""
+    _, file, content_families, _ = task
+    if not content_families:
+        return {}
+    try:
+        content = file.read_text(encoding="utf-8", errors="ignore")
+    except Exception:
+        return {}
+    return scan_file_content(content, content_families)
 
 
-def validate_no_secrets(repo_root: Path) -> list[str]:
-    """Check for secret patterns and blocked file types."""
-    violations = []
+def assemble_violations(repo_root: Path, tasks: list[tuple], results: list[dict], families: tuple) -> dict:
+    """Turn per-file findings into per-family violation lists.
+
+    Ordering matches the historical one-walk-per-validator output: walk order
+    per root, with blocked file types listed before secret matches.
+    """
     repo_abs = repo_root.resolve()
+    violations = {family: [] for family in families}
+    secret_hits = []
+    current_root = None
+
+    for (root, file, _, blocked), findings in zip(tasks, results):
+        if root != current_root:
+            if "secrets" in violations:
+                violations["secrets"].extend(secret_hits)
+            secret_hits = []
+            current_root = root
+        if blocked or findings:
+            rel_path = file.resolve().relative_to(repo_abs)
+        if blocked:
+            violations["secrets"].append(f"{rel_path}: blocked file type")
+        if findings.get("private_repo_refs"):
+            violations["private_repo_refs"].append(f"{rel_path}: private repo reference")
+        if findings.get("local_paths"):
+            violations["local_paths"].append(f"{rel_path}: absolute local path")
+        if findings.get("secrets"):
+            secret_hits.append(f"{rel_path}: secret pattern detected")
+        for line_no in findings.get("mainnet_claims", ()):
+            violations["mainnet_claims"].append(f"{rel_path}:{line_no}: unbacked mainnet claim")
+    if "secrets" in violations:
+        violations["secrets"].extend(secret_hits)
+    return violations
 
-    # Only scan exported roots
-    for root in EXPORTED_ROOTS:
-        root_path = repo_root / root
-        if not root_path.exists():
-            continue
 
-        # Check for blocked file extensions
-        for file in root_path.rglob("*"):
-            if not file.is_file():
-                continue
+def _init_scan_worker(ruleset: dict) -> None:
+    """Process-pool initializer: install the compiled rule set once per worker."""
+    global _RULESET
+    _RULESET = ruleset
 
-            # Blocked extensions
-            for pattern in BLOCKED_FILE_PATTERNS:
-                if re.match(pattern, file.name):
-                    rel_path = file.resolve().relative_to(repo_abs)
-                    violations.append(f"{rel_path}: blocked file type")
-                    break
 
-        # Check for secret patterns in source files
-        for file in root_path.rglob("*"):
-            if not file.is_file():
-                continue
-            if file.suffix not in [".py", ".md", ".yaml", ".yml", ".json"]:
-                continue
+def run_scan_tasks(tasks: list[tuple], jobs: int = 1) -> list[dict]:
+    """Scan planned files serially or across ``jobs`` worker processes.
 
-            # Skip pattern definition files
-            if is_pattern_definition_file(file):
-                continue
-            # Skip test files
-            if "test" in file.name or "/tests/" in str(file).replace("\\", "/"):
-                continue
+    Results are returned in task order either way, so reports are identical.
+    """
+    if jobs <= 1 or len(tasks) < 2:
+        return [scan_task(task) for task in tasks]
+    from concurrent.futures import ProcessPoolExecutor
 
-            try:
-                content = file.read_text(encoding="utf-8", errors="ignore")
-                for pattern in SECRET_PATTERNS:
-                    if re.search(pattern, content):
-                        rel_path = file.resolve().relative_to(repo_abs)
-                        violations.append(f"{rel_path}: secret pattern detected")
-                        break
-            except Exception:
-                pass
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_scan_worker, initargs=(_RULESET,)) as pool:
+        return list(pool.map(scan_task, tasks, chunksize=chunksize))
 
-    return violations
 
+def _scan_text(item: tuple) -> dict:
+    """Scan one decoded blob; ``item`` is (text or None, content_families)."""
+    text, content_families = item
+    if text is None:
+        return {}
+    return scan_file_content(text, content_families)
 
-def validate_no_mainnet_false_claims(repo_root: Path) -> list[str]:
-    """Check for unbacked mainnet/production claims."""
-    violations = []
-    repo_abs = repo_root.resolve()
 
-    # Only scan exported roots
-    for root in EXPORTED_ROOTS:
-        root_path = repo_root / root
-        if not root_path.exists():
-            continue
+def run_blob_scans(repo_root: Path, items: list[tuple], jobs: int = 1) -> list[dict]:
+    """Scan (blob, content_families) items, reading blobs via one cat-file process.
+
+    Blobs are read serially in the parent; with ``jobs`` > 1 the decoded text
+    is scanned in a process pool. Results are returned in item order.
+    """
+    if not items:
+        return []
+    with BlobReader(repo_root) as reader:
+
+        def texts():
+            for blob, content_families in items:
+                data = reader.read(blob)
+                yield (None if data is None else decode_blob_text(data), content_families)
+
+        if jobs <= 1 or len(items) < 2:
+            return [_scan_text(item) for item in texts()]
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(items) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_scan_worker, initargs=(_RULESET,)) as pool:
+            return list(pool.map(_scan_text, texts(), chunksize=chunksize))
+
+
+def run_git_scan_tasks(
+    repo_root: Path,
+    tasks: list[tuple],
+    blobs: list[str],
+    jobs: int = 1,
+    cache: ScanCache | None = None,
+) -> list[dict]:
+    """Scan each unique (blob, rule scope) pair once and fan results out to its paths.
+
+    Identical files (vendored copies, repeated schemas) share one scan. With a
+    cache, freshness is decided by blob id instead of size and mtime.
+    """
+    results: list = [None] * len(tasks)
+    groups: dict[tuple, list[int]] = {}
+    for i, (_, _, content_families, _) in enumerate(tasks):
+        if content_families:
+            groups.setdefault((blobs[i], content_families), []).append(i)
+        else:
+            results[i] = {}
+
+    pending = []
+    misses: dict[tuple, list[int]] = {}
+    for key, indexes in groups.items():
+        blob, content_families = key
+        findings = None
+        if cache is not None:
+            scope = ",".join(content_families)
+            for i in indexes:
+                cached = cache.get(tasks[i][1].relative_to(repo_root).as_posix(), 0, 0, scope, blob=blob)
+                if cached is None:
+                    misses.setdefault(key, []).append(i)
+                elif findings is None:
+                    findings = cached
+        if findings is None:
+            pending.append(key)
+        else:
+            for i in indexes:
+                results[i] = findings
+
+    for key, findings in zip(pending, run_blob_scans(repo_root, pending, jobs)):
+        for i in groups[key]:
+            results[i] = findings
 
-        for file in root_path.rglob("*.md"):
-            if "/tests/" in str(file).replace("\\", "/"):
+    if cache is not None:
+        for (blob, content_families), indexes in misses.items():
+            scope = ",".join(content_families)
+            for i in indexes:
+                cache.put(tasks[i][1].relative_to(repo_root).as_posix(), 0, 0, results[i], scope, blob=blob)
+        cache.save()
+    return results
+
+
+def run_profiled_scan_tasks(repo_root: Path, tasks: list[tuple], profile: ScanProfile) -> list[dict]:
+    """Scan planned files serially in-process, timing every rule and file.
+
+    Pattern families stop at their first matching pattern, as in
+    ``scan_file_content``, so the timings reflect the work a normal run does.
+    """
+    results = []
+    for root, file, content_families, _ in tasks:
+        if not content_families:
+            profile.skip()
+            results.append({})
+            continue
+        start = time.perf_counter()
+        try:
+            size = file.stat().st_size
+            content = file.read_text(encoding="utf-8", errors="ignore")
+        except Exception:
+            profile.skip()
+            results.append({})
+            continue
+        findings = {}
+        for family in content_families:
+            if family == "mainnet_claims":
+                t0 = time.perf_counter()
+                findings[family] = find_mainnet_claims(content)
+                profile.add_rule(family, time.perf_counter() - t0, bool(findings[family]))
                 continue
+            hit = False
+            for index, pattern in enumerate(_RULESET[family]):
+                t0 = time.perf_counter()
+                matched = pattern.search(content) is not None
+                profile.add_rule(f"{family}/{index}", time.perf_counter() - t0, matched, pattern.pattern)
+                if matched:
+                    hit = True
+                    break
+            findings[family] = hit
+        profile.add_file(file.relative_to(repo_root).as_posix(), root, time.perf_counter() - start, size)
+        results.append(findings)
+    return results
+
+
+# Bump when scan logic changes in a way the rule lists do not capture
+SCANNER_VERSION = 1
+
+
+def boundary_ruleset_hash() -> str:
+    """Hash of every content rule; cached findings are void when it changes."""
+    return ruleset_hash(
+        "validate_public_boundary",
+        SCANNER_VERSION,
+        PRIVATE_REPO_PATTERNS,
+        ABSOLUTE_PATH_PATTERNS,
+        SECRET_PATTERNS,
+        MAINNET_TRIGGER_WORDS,
+        MAINNET_ALLOWED_CONTEXT,
+    )
+
+
+def run_cached_scan_tasks(repo_root: Path, tasks: list[tuple], jobs: int, cache: ScanCache) -> list[dict]:
+    """Replay cached findings for unchanged files and scan only the rest."""
+    results: list = [None] * len(tasks)
+    pending = []
+    keys = {}
+    for i, task in enumerate(tasks):
+        _, file, content_families, _ = task
+        if not content_families:
+            results[i] = {}
+            continue
+        try:
+            st = file.stat()
+        except OSError:
+            results[i] = {}
+            continue
+        rel = file.relative_to(repo_root).as_posix()
+        scope = ",".join(content_families)
+        keys[i] = (rel, st.st_size, st.st_mtime_ns, scope)
+        cached = cache.get(rel, st.st_size, st.st_mtime_ns, scope)
+        if cached is None:
+            pending.append(i)
+        else:
+            results[i] = cached
+
+    scanned = run_scan_tasks([tasks[i] for i in pending], jobs)
+    for i, findings in zip(pending, scanned):
+        results[i] = findings
+        rel, size, mtime_ns, scope = keys[i]
+        cache.put(rel, size, mtime_ns, findings, scope)
+    cache.save()
+    return results
+
+
+def scan_exported_roots(
+    repo_root: Path,
+    families: tuple = RULE_FAMILIES,
+    jobs: int = 1,
+    cache_path: Path | str | None = None,
+    git_mode: bool = False,
+    profile: ScanProfile | None = None,
+) -> dict:
+    """Single-walk scan of the exported roots for the given rule families.
+
+    Each exported root is walked once and each file read at most once; its
+    content is dispatched to every applicable rule family. With ``jobs`` > 1
+    the files are partitioned across a process pool. With ``cache_path``,
+    unchanged files replay their findings from the on-disk scan cache.
+
+    With ``git_mode`` only files tracked in the index are scanned, their
+    content is read from git objects, and each unique blob is scanned once.
+
+    With ``profile`` every file is scanned serially and uncached while rule,
+    root and file timings are recorded into it.
+    """
+    if profile is not None:
+        tasks = collect_scan_tasks(repo_root, families)
+        results = run_profiled_scan_tasks(repo_root, tasks, profile)
+        return assemble_violations(repo_root, tasks, results, families)
+
+    if git_mode:
+        tasks, blobs = collect_git_scan_tasks(repo_root, families)
+        cache = ScanCache(cache_path, boundary_ruleset_hash()) if cache_path is not None else None
+        results = run_git_scan_tasks(repo_root, tasks, blobs, jobs, cache)
+        return assemble_violations(repo_root, tasks, results, families)
+
+    tasks = collect_scan_tasks(repo_root, families)
+    if cache_path is None:
+        results = run_scan_tasks(tasks, jobs)
+    else:
+        cache = ScanCache(cache_path, boundary_ruleset_hash())
+        results = run_cached_scan_tasks(repo_root, tasks, jobs, cache)
+    return assemble_violations(repo_root, tasks, results, families)
 
-            try:
-                content = file.read_text(encoding="utf-8", errors="ignore")
-                lines = content.split("\n")
 
-                for i, line in enumerate(lines):
-                    if not any(word in line.lower() for word in ["mainnet", "production", "live"]):
-                        continue
+def validate_no_private_repo_refs(repo_root: Path) -> list[str]:
+    """Check for private repo references (except in definition files)."""
+    return scan_exported_roots(repo_root, ("private_repo_refs",))["private_repo_refs"]
 
-                    # Check if this is properly contextualized
-                    context = "\n".join(lines[max(0, i - 2) : min(len(lines), i + 3)])
-
-                    # Allowed contexts
-                    if any(
-                        keyword in context.lower()
-                        for keyword in [
-                            "testnet",
-                            "readiness",
-                            "planned",
-                            "future",
-                            "will",
-                            "https://",
-                            "http://",
-                            "link",
-                            "reference",
-                        ]
-                    ):
-                        continue
 
-                    rel_path = file.resolve().relative_to(repo_abs)
-                    violations.append(f"{rel_path}:{i + 1}: unbacked mainnet claim")
+def validate_no_local_paths(repo_root: Path) -> list[str]:
+    """Check for absolute local paths (except in definition/test files)."""
+    return scan_exported_roots(repo_root, ("local_paths",))["local_paths"]
 
-            except Exception:
-                pass
 
-    return violations
+def validate_no_secrets(repo_root: Path) -> list[str]:
+    """Check for secret patterns and blocked file types."""
+    return scan_exported_roots(repo_root, ("secrets",))["secrets"]
+
+
+def validate_no_mainnet_false_claims(repo_root: Path) -> list[str]:
+    """Check for unbacked mainnet/production claims."""
+    return scan_exported_roots(repo_root, ("mainnet_claims",))["mainnet_claims"]
 
 
 def validate_denied_roots_empty(repo_root: Path) -> list[str]:
@@ -387,6 +692,33 @@ def validate_exported_roots_complete(repo_root: Path) -> dict:
     return {"status": overall, "details": completeness}
 
 
+SARIF_RULES = {
+    "private_repo_refs": "Private repo reference in an exported root",
+    "local_paths": "Absolute local path in an exported root",
+    "secrets": "Secret pattern or blocked file type in an exported root",
+    "mainnet_claims": "Unbacked mainnet/production claim",
+    "denied_roots": "Content in a denied root",
+}
+
+
+def boundary_sarif(violations_by_rule: dict) -> dict:
+    """Convert per-check violation strings into a SARIF log.
+
+    Violations read "<path>: <message>" or, for mainnet claims,
+    "<path>:<line>: <message>".
+    """
+    results = []
+    for rule_id, violations in violations_by_rule.items():
+        for violation in violations:
+            location, _, message = violation.rpartition(": ")
+            line = None
+            if rule_id == "mainnet_claims":
+                location, _, line_no = location.rpartition(":")
+                line = int(line_no)
+            results.append(sarif_result(rule_id, message, location.replace("\\", "/"), line))
+    return sarif_log("validate_public_boundary", VALIDATOR_VERSION, SARIF_RULES, results)
+
+
 def main():
     """Run boundary validation with FAIL-CLOSED enforcement."""
     import argparse
@@ -395,7 +727,14 @@ def main():
     parser = argparse.ArgumentParser(description="SSID Open-Core Public Boundary Validator")
     parser.add_argument("--verify-all", action="store_true", help="Run all checks")
     parser.add_argument("--private-mode", action="store_true", help="Skip denied roots checks for private repos")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for content scanning (default: 1)")
+    parser.add_argument("--cache", metavar="PATH", help="Incremental scan cache file (rescans only changed files)")
+    parser.add_argument("--git-mode", action="store_true", help="Scan tracked files from git objects, each unique blob once")
+    parser.add_argument("--profile", metavar="PATH", help="Write per-rule/root/file timings as JSON (serial, uncached scan)")
+    parser.add_argument("--sarif", metavar="PATH", help="Write findings as a SARIF 2.1.0 log")
     args = parser.parse_args()
+    if args.profile and args.git_mode:
+        parser.error("--profile scans the working tree and cannot be combined with --git-mode")
 
     print("=== SSID Open-Core Public Boundary Validator ===\n")
 
@@ -408,8 +747,16 @@ def main():
         "private_mode": args.private_mode,
     }
 
+    # One walk and one read per file feeds checks [1]-[4]
+    profile = ScanProfile() if args.profile else None
+    scanned = scan_exported_roots(
+        REPO_ROOT, jobs=args.jobs, cache_path=args.cache, git_mode=args.git_mode, profile=profile
+    )
+    if profile is not None:
+        write_json(args.profile, profile.to_dict())
+
     print("[1] Checking for private repo references...")
-    private_refs = validate_no_private_repo_refs(REPO_ROOT)
+    private_refs = scanned["private_repo_refs"]
     violations.extend(private_refs)
     if private_refs:
         print(f"    [CRITICAL] Found {len(private_refs)} private repo reference(s)")
@@ -419,7 +766,7 @@ def main():
         print("    [OK] No private repo references")
 
     print("[2] Checking for absolute local paths...")
-    local_paths = validate_no_local_paths(REPO_ROOT)
+    local_paths = scanned["local_paths"]
     violations.extend(local_paths)
     if local_paths:
         print(f"    [CRITICAL] Found {len(local_paths)} absolute path(s)")
@@ -429,7 +776,7 @@ def main():
         print("    [OK] No absolute local paths (excluding tests)")
 
     print("[3] Checking for secrets/keys/tokens...")
-    secrets = validate_no_secrets(REPO_ROOT)
+    secrets = scanned["secrets"]
     violations.extend(secrets)
     if secrets:
         print(f"    [CRITICAL] Found {len(secrets)} secret pattern(s)")
@@ -439,7 +786,7 @@ def main():
         print("    [OK] No secret patterns (excluding tests)")
 
     print("[4] Checking for unbacked mainnet claims...")
-    mainnet = validate_no_mainnet_false_claims(REPO_ROOT)
+    mainnet = scanned["mainnet_claims"]
     violations.extend(mainnet)
     if mainnet:
         print(f"    [CRITICAL] Found {len(mainnet)} mainnet claim(s)")
@@ -449,6 +796,7 @@ def main():
         print("    [OK] No unbacked mainnet claims")
 
     print("[5] Checking that denied roots are empty (FAIL-CLOSED)...")
+    denied_issues = []
     if args.private_mode:
         print("    [SKIP] Denied roots check skipped in private mode")
     else:
@@ -471,6 +819,10 @@ def main():
             print(f"      - {root}: {status}")
     report["exported_root_completeness"] = completeness["details"]
 
+    if args.sarif:
+        by_rule = dict(scanned, denied_roots=denied_issues)
+        write_json(args.sarif, boundary_sarif(by_rule))
+
     print("\n=== Boundary Validation Result ===")
     print(f"Total violations: {len(violations)}")
 
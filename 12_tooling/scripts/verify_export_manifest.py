@@ -3,8 +3,19 @@
 from __future__ import annotations
 
 import json
+import re
+import stat
 import sys
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+# Sibling helper modules live next to this script
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from export_registry_shards import LEGACY_REGISTRY, SHARD_DIR, iter_shard_lines, load_index  # noqa: E402
+from hash_engine import FileEntry, HashCache, hash_files  # noqa: E402
 
 
 REQUIRED_FIELDS = [
@@ -30,46 +41,353 @@ REQUIRED_FIELDS = [
 ]
 
 
-def verify_export_manifest(repo_root: Path | str = ".") -> dict:
+_REQUIRED = frozenset(REQUIRED_FIELDS)
+
+# Issues kept per shard; the full count is always reported
+MAX_ISSUES_PER_SHARD = 100
+
+
+def manifest_issues(m, label: str) -> list[str]:
+    """Return the schema issues of one manifest (empty if it is complete)."""
+    if not isinstance(m, dict):
+        return [f"{label} is not a JSON object"]
+    if _REQUIRED <= m.keys():
+        return []
+    export_id = m.get("export_id", "?")
+    return [f"Manifest {export_id} missing field: {field}" for field in REQUIRED_FIELDS if field not in m]
+
+
+def verify_shard(path: Path | str, max_issues: int = MAX_ISSUES_PER_SHARD) -> dict:
+    """Validate a JSONL shard one manifest at a time in constant memory."""
+    path = Path(path)
+    result = {"shard": path.name, "manifests": 0, "bytes": 0, "issue_count": 0, "issues": []}
+    try:
+        lines = iter_shard_lines(path)
+        for line_no, line in lines:
+            result["manifests"] += 1
+            try:
+                found = manifest_issues(json.loads(line), f"{path.name}:{line_no}")
+            except ValueError as e:
+                found = [f"{path.name}:{line_no}: invalid JSON: {e}"]
+            result["issue_count"] += len(found)
+            room = max_issues - len(result["issues"])
+            if room > 0:
+                result["issues"].extend(found[:room])
+        result["bytes"] = path.stat().st_size
+    except OSError as e:
+        result["issue_count"] += 1
+        result["issues"].append(f"{path.name}: unreadable shard: {e}")
+    return result
+
+
+def verify_shards(shard_dir: Path, index: dict, jobs: int = 1) -> tuple[list[dict], list[str]]:
+    """Verify every indexed shard, in parallel with ``jobs`` > 1.
+
+    Returns per-shard results plus index consistency issues (count or size
+    drift, missing shards, shard files the index does not list). Missing
+    shards are reported once, as index issues, and are not dispatched.
+    """
+    issues = []
+    entries = []
+    for entry in index.get("shards", []):
+        if (shard_dir / entry["name"]).exists():
+            entries.append(entry)
+        else:
+            issues.append(f"Shard {entry['name']} listed in index but missing")
+    paths = [shard_dir / entry["name"] for entry in entries]
+    if jobs > 1 and len(paths) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(verify_shard, paths))
+    else:
+        results = [verify_shard(path) for path in paths]
+
+    for entry, result in zip(entries, results):
+        if result["manifests"] != entry.get("manifests"):
+            issues.append(
+                f"Shard {entry['name']} has {result['manifests']} manifest(s), index records {entry.get('manifests')}"
+            )
+        if result["bytes"] != entry.get("bytes"):
+            issues.append(f"Shard {entry['name']} is {result['bytes']} bytes, index records {entry.get('bytes')}")
+    listed = {entry["name"] for entry in index.get("shards", [])}
+    for path in sorted(shard_dir.glob("*.jsonl")):
+        if path.name not in listed:
+            issues.append(f"Shard {path.name} not listed in index")
+    return results, issues
+
+
+# File-map fields checked by deep verification, with the tree each is relative to
+FILE_HASH_FIELDS = ("source_file_hashes", "generated_file_hashes")
+
+# Reported entries per category; totals are always complete
+MAX_REPORTED = 100
+
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+# Deep-verify finding lists and the keys of their full counts
+_FINDING_COUNTS = {
+    "mismatches": "mismatch_count",
+    "missing": "missing_count",
+    "unreadable": "unreadable_count",
+    "invalid": "invalid_count",
+}
+
+# Deep-verify finding lists with their singular and plural issue labels
+_FINDING_LABELS = (
+    ("mismatches", "hash mismatch", "hash mismatches"),
+    ("missing", "missing file", "missing files"),
+    ("unreadable", "unreadable file", "unreadable files"),
+    ("invalid", "invalid entry", "invalid entries"),
+)
+
+
+def expected_sha256(value) -> Optional[str]:
+    """Normalize a recorded hash ("<hex>" or "sha256:<hex>") or return None."""
+    if not isinstance(value, str):
+        return None
+    digest = value.strip().lower()
+    if digest.startswith("sha256:"):
+        digest = digest[len("sha256:"):]
+    return digest if _SHA256_RE.match(digest) else None
+
+
+def iter_registry_manifests(manifests: list, shard_dir: Path, index: Optional[dict]) -> Iterator[dict]:
+    """Stream legacy then sharded manifests, skipping lines that do not parse."""
+    for m in manifests:
+        if isinstance(m, dict):
+            yield m
+    if index is None:
+        return
+    for entry in index.get("shards", []):
+        path = shard_dir / entry["name"]
+        if not path.exists():
+            continue
+        for _, line in iter_shard_lines(path):
+            try:
+                m = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(m, dict):
+                yield m
+
+
+def deep_verify(
+    manifests: Iterable[dict],
+    repo_root: Path | str,
+    source_root: Optional[Path | str] = None,
+    workers: Optional[int] = None,
+    hash_cache: Optional[Path | str] = None,
+) -> dict:
+    """Recompute every hash listed in the manifests' file maps from disk.
+
+    ``generated_file_hashes`` are resolved against ``repo_root`` and
+    ``source_file_hashes`` against ``source_root`` (skipped without one).
+    Each distinct file is hashed once on the shared parallel hash engine,
+    optionally reusing the audit pack hash cache. Paths that are not regular
+    files or cannot be read are reported as unreadable.
+    """
+    bases = {
+        "source_file_hashes": Path(source_root) if source_root is not None else None,
+        "generated_file_hashes": Path(repo_root),
+    }
+    expected: dict[Path, list[tuple[str, str, str]]] = {}
+    report = {
+        "files_listed": 0,
+        "files_checked": 0,
+        "source_files_skipped": 0,
+        "mismatch_count": 0,
+        "missing_count": 0,
+        "unreadable_count": 0,
+        "invalid_count": 0,
+        "mismatches": [],
+        "missing": [],
+        "unreadable": [],
+        "invalid": [],
+    }
+
+    def note(kind: str, item: str) -> None:
+        report[_FINDING_COUNTS[kind]] += 1
+        if len(report[kind]) < MAX_REPORTED:
+            report[kind].append(item)
+
+    for m in manifests:
+        export_id = m.get("export_id", "?")
+        for field in FILE_HASH_FIELDS:
+            file_map = m.get(field)
+            if not isinstance(file_map, dict):
+                continue
+            report["files_listed"] += len(file_map)
+            base = bases[field]
+            if base is None:
+                report["source_files_skipped"] += len(file_map)
+                continue
+            for rel, value in file_map.items():
+                digest = expected_sha256(value)
+                rel_path = Path(rel)
+                if digest is None:
+                    note("invalid", f"{export_id} {field}: {rel}: unsupported hash value")
+                elif rel_path.is_absolute() or ".." in rel_path.parts:
+                    note("invalid", f"{export_id} {field}: {rel}: path escapes its root")
+                else:
+                    expected.setdefault(base / rel_path, []).append((export_id, field, digest))
+
+    entries = []
+    for path, claims in expected.items():
+        try:
+            st = path.stat()
+        except OSError:
+            for export_id, field, _ in claims:
+                note("missing", f"{export_id} {field}: {path}")
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            for export_id, field, _ in claims:
+                note("unreadable", f"{export_id} {field}: {path}: not a regular file")
+            continue
+        entries.append(FileEntry(path, st.st_size, st.st_mtime_ns))
+
+    cache = HashCache(hash_cache) if hash_cache is not None else None
+    errors: dict[Path, OSError] = {}
+    digests, stats = hash_files(entries, workers, cache, errors)
+    if cache is not None:
+        cache.save()
+    for entry, digest in zip(entries, digests):
+        error = errors.get(entry.path)
+        for export_id, field, want in expected[entry.path]:
+            if error is not None:
+                note("unreadable", f"{export_id} {field}: {entry.path}: {error.strerror or error}")
+            elif digest != want:
+                note("mismatches", f"{export_id} {field}: {entry.path}: expected {want}, found {digest}")
+    report["files_checked"] = len(entries) - len(errors)
+    report["hash_stats"] = stats.to_dict()
+    return report
+
+
+def verify_export_manifest(
+    repo_root: Path | str = ".",
+    jobs: int = 1,
+    deep: bool = False,
+    source_root: Optional[Path | str] = None,
+    workers: Optional[int] = None,
+    hash_cache: Optional[Path | str] = None,
+) -> dict:
+    """Validate the legacy registry document and, if present, its JSONL shards.
+
+    With ``deep`` the manifests' file hash maps are also checked against the
+    files on disk (see ``deep_verify``).
+    """
     root = Path(repo_root)
-    registry_path = root / "24_meta_orchestration" / "registry" / "opencore_export_registry.json"
+    registry_path = root / LEGACY_REGISTRY
+    shard_dir = root / SHARD_DIR
+
+    try:
+        index: Optional[dict] = load_index(shard_dir)
+    except (OSError, json.JSONDecodeError) as e:
+        return {"valid": False, "error": f"Invalid shard index: {e}", "status": "FAIL"}
 
-    if not registry_path.exists():
+    if not registry_path.exists() and index is None:
         return {"valid": False, "error": "Registry file missing", "status": "FAIL"}
 
-    try:
-        with open(registry_path, encoding="utf-8") as f:
-            registry = json.load(f)
-    except json.JSONDecodeError as e:
-        return {"valid": False, "error": f"Invalid JSON: {e}", "status": "FAIL"}
+    manifests = []
+    if registry_path.exists():
+        try:
+            with open(registry_path, encoding="utf-8") as f:
+                registry = json.load(f)
+        except json.JSONDecodeError as e:
+            return {"valid": False, "error": f"Invalid JSON: {e}", "status": "FAIL"}
+        manifests = registry.get("manifests", [])
 
-    manifests = registry.get("manifests", [])
     results = {
         "valid": True,
         "registry_exists": True,
+        "layout": "legacy" if index is None else "sharded",
         "manifest_count": len(manifests),
         "issues": [],
         "status": "PASS",
     }
 
-    if len(manifests) == 0:
+    for m in manifests:
+        found = manifest_issues(m, "Manifest")
+        if found:
+            results["issues"].extend(found)
+            results["valid"] = False
+
+    if index is not None:
+        shard_results, index_issues = verify_shards(shard_dir, index, jobs)
+        results["shards"] = [{k: r[k] for k in ("shard", "manifests", "bytes", "issue_count")} for r in shard_results]
+        for r in shard_results:
+            results["manifest_count"] += r["manifests"]
+            results["issues"].extend(r["issues"])
+            if r["issue_count"] > len(r["issues"]):
+                results["issues"].append(f"Shard {r['shard']}: {r['issue_count'] - len(r['issues'])} more issue(s)")
+            if r["issue_count"]:
+                results["valid"] = False
+        if index_issues:
+            results["issues"].extend(index_issues)
+            results["valid"] = False
+
+    if results["manifest_count"] == 0:
         results["issues"].append("No export manifests yet (expected for initial build)")
 
-    for m in manifests:
-        for field in REQUIRED_FIELDS:
-            if field not in m:
-                results["issues"].append(f"Manifest {m.get('export_id', '?')} missing field: {field}")
+    if deep:
+        report = deep_verify(
+            iter_registry_manifests(manifests, shard_dir, index), root, source_root, workers, hash_cache
+        )
+        results["deep_verify"] = report
+        for kind, label, plural in _FINDING_LABELS:
+            results["issues"].extend(f"{label}: {item}" for item in report[kind])
+            count = report[_FINDING_COUNTS[kind]]
+            if count > len(report[kind]):
+                more = count - len(report[kind])
+                results["issues"].append(f"... and {more} more {label if more == 1 else plural}")
+            if count:
                 results["valid"] = False
 
+    if not results["valid"]:
+        results["status"] = "FAIL"
     return results
 
 
 if __name__ == "__main__":
-    repo = sys.argv[1] if len(sys.argv) > 1 else "."
-    result = verify_export_manifest(repo)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate the OpenCore export registry")
+    parser.add_argument("repo", nargs="?", default=".", help="Repository root (default: .)")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for shard verification (default: 1)")
+    parser.add_argument("--deep", action="store_true", help="Recompute listed file hashes from disk")
+    parser.add_argument("--source-root", metavar="PATH", help="Checkout that source_file_hashes are relative to")
+    parser.add_argument("--workers", type=int, help="Hashing threads for --deep (default: CPU count + 4, max 32)")
+    parser.add_argument("--hash-cache", metavar="PATH", help="Hash sidecar shared with build_audit_pack")
+    args = parser.parse_args()
+
+    result = verify_export_manifest(
+        args.repo,
+        jobs=args.jobs,
+        deep=args.deep,
+        source_root=args.source_root,
+        workers=args.workers,
+        hash_cache=args.hash_cache,
+    )
     print(f"Status: {result['status']}")
+    if "error" in result:
+        print(f"Error: {result['error']}")
+        sys.exit(1)
     print(f"Registry exists: {result['registry_exists']}")
+    print(f"Layout: {result['layout']}")
     print(f"Manifests: {result['manifest_count']}")
     for issue in result["issues"]:
         print(f"  - {issue}")
+    if "deep_verify" in result:
+        deep_report = result["deep_verify"]
+        stats = deep_report["hash_stats"]
+        print(
+            f"Deep verify: {deep_report['files_checked']} file(s) checked, "
+            f"{deep_report['mismatch_count']} mismatch(es), {deep_report['missing_count']} missing, "
+            f"{deep_report['unreadable_count']} unreadable, "
+            f"{deep_report['source_files_skipped']} source file(s) skipped"
+        )
+        print(
+            f"Hashing: {stats['files']} file(s), {stats['bytes']} bytes, {stats['cache_hits']} cache hit(s), "
+            f"{stats['mb_per_second']} MB/s"
+        )
     sys.exit(0 if result["valid"] else 1)
@@ -2,10 +2,23 @@
 """Verify public mirror — checks that no private content leaked into OpenCore."""
 from __future__ import annotations
 
+import json
+import mmap
+import os
 import re
 import sys
+import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+# Sibling helper modules live next to this script
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from git_objects import BlobReader, decode_blob_text, iter_history_blobs, list_tracked_files  # noqa: E402
+from scan_cache import ScanCache, ruleset_hash  # noqa: E402
+from scan_report import ScanProfile, sarif_log, sarif_result, write_json  # noqa: E402
 
 
 PRIVATE_PATTERNS: List[Tuple[str, re.Pattern]] = [
@@ -32,49 +45,517 @@ EXEMPT_FILES = {
 }
 
 
-def verify_public_mirror(repo_root: Path | str = ".") -> dict:
+SKIPPED_SUFFIXES = {".pyc", ".exe", ".dll", ".so", ".bin"}
+
+# Matches kept per pattern and file
+MATCH_CAP = 3
+# Leading bytes checked for NUL when deciding a file is binary
+BINARY_SNIFF_BYTES = 8192
+# Files at least this large are scanned through mmap instead of being decoded
+DEFAULT_MMAP_THRESHOLD = 32 * 1024 * 1024
+
+# Bump when scan logic changes in a way the pattern table does not capture
+SCANNER_VERSION = 3
+
+# Byte-level twins of PRIVATE_PATTERNS for mmap scans; every pattern is ASCII
+_BYTES_PATTERNS = [
+    (name, re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE))
+    for name, pattern in PRIVATE_PATTERNS
+]
+
+
+def leakage_ruleset_hash() -> str:
+    """Hash of the pattern table; cached findings are void when it changes."""
+    return ruleset_hash(
+        "verify_private_leakage",
+        SCANNER_VERSION,
+        [(name, pattern.pattern, pattern.flags) for name, pattern in PRIVATE_PATTERNS],
+    )
+
+
+def findall_capped(pattern: re.Pattern, content, cap: int = MATCH_CAP) -> list:
+    """``pattern.findall(content)[:cap]`` that stops searching after ``cap`` matches.
+
+    Items follow findall's shape: the whole match without groups, the group
+    with one group, and a tuple of groups otherwise (unmatched groups as "").
+    """
+    empty = content[:0]
+    matches = []
+    for m in pattern.finditer(content):
+        if pattern.groups == 0:
+            matches.append(m.group(0))
+        elif pattern.groups == 1:
+            matches.append(m.group(1) or empty)
+        else:
+            matches.append(tuple(g or empty for g in m.groups()))
+        if len(matches) >= cap:
+            break
+    return matches
+
+
+def _timed_findall(name: str, pattern: re.Pattern, content, profile: Optional[ScanProfile]) -> list:
+    if profile is None:
+        return findall_capped(pattern, content)
+    start = time.perf_counter()
+    matches = findall_capped(pattern, content)
+    profile.add_rule(name, time.perf_counter() - start, bool(matches), pattern.pattern)
+    return matches
+
+
+def match_patterns(content: str, profile: Optional[ScanProfile] = None) -> List[dict]:
+    """Return the path-independent findings for one file's text."""
+    findings = []
+    for name, pattern in PRIVATE_PATTERNS:
+        matches = _timed_findall(name, pattern, content, profile)
+        if matches:
+            findings.append({"pattern": name, "matches": matches})
+    return findings
+
+
+def _decode_match(match):
+    if isinstance(match, tuple):
+        return tuple(_decode_match(g) for g in match)
+    return match.decode("utf-8", errors="ignore")
+
+
+def match_patterns_bytes(buf, profile: Optional[ScanProfile] = None) -> List[dict]:
+    """Findings for a raw byte buffer (e.g. an mmap), matched without decoding."""
+    findings = []
+    for name, pattern in _BYTES_PATTERNS:
+        matches = _timed_findall(name, pattern, buf, profile)
+        if matches:
+            findings.append({"pattern": name, "matches": [_decode_match(m) for m in matches]})
+    return findings
+
+
+def is_binary(data: bytes) -> bool:
+    """Sniff binary content by a NUL byte in the leading bytes."""
+    return b"\0" in data[:BINARY_SNIFF_BYTES]
+
+
+def scan_blob(data: bytes, profile: Optional[ScanProfile] = None) -> Optional[List[dict]]:
+    """Findings for in-memory file content, or None if it is binary."""
+    if is_binary(data):
+        return None
+    return match_patterns(decode_blob_text(data), profile)
+
+
+def scan_path(
+    path: Path,
+    size: int,
+    mmap_threshold: int = DEFAULT_MMAP_THRESHOLD,
+    profile: Optional[ScanProfile] = None,
+) -> Optional[List[dict]]:
+    """Findings for one file on disk, or None if it is binary or unreadable.
+
+    Files of at least ``mmap_threshold`` bytes are matched in place through
+    mmap, so memory stays bounded regardless of file size.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(BINARY_SNIFF_BYTES)
+            if is_binary(head):
+                return None
+            if size >= mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return match_patterns_bytes(mm, profile)
+            data = head + f.read()
+    except (OSError, ValueError):
+        return None
+    return match_patterns(decode_blob_text(data), profile)
+
+
+def _top_level(rel: str) -> str:
+    """Profile bucket for a relative path: its top-level directory."""
+    head, sep, _ = rel.replace("\\", "/").partition("/")
+    return head if sep else "."
+
+
+def scan_tracked_blobs(
+    root: Path,
+    cache: Optional[ScanCache] = None,
+    skip: Optional[Path] = None,
+    max_size: Optional[int] = None,
+    profile: Optional[ScanProfile] = None,
+) -> Tuple[List[dict], int, int]:
+    """Scan the files tracked in the index, reading each unique blob once.
+
+    Returns the violations, the number of tracked files listed and the
+    number of files skipped as binary or oversized.
+    """
+    tracked = list_tracked_files(root)
+    violations: List[dict] = []
+    skipped = 0
+    by_blob: dict = {}
+    with BlobReader(root) as reader:
+        for entry in tracked:
+            rel = entry.path
+            if rel in EXEMPT_FILES or Path(rel).suffix in SKIPPED_SUFFIXES:
+                continue
+            if skip is not None and (root / rel).resolve() == skip:
+                continue
+
+            if entry.blob in by_blob:
+                findings = by_blob[entry.blob]
+                if profile is not None and findings is not None:
+                    profile.cached()
+            else:
+                findings = cache.get(rel, 0, 0, blob=entry.blob) if cache is not None else None
+                if findings is not None:
+                    if profile is not None:
+                        profile.cached()
+                else:
+                    start = time.perf_counter()
+                    # Oversized blobs are drained unread, never held in memory
+                    content = reader.read_capped(entry.blob, max_size)
+                    if content is not None and content.data is not None:
+                        findings = scan_blob(content.data, profile)
+                        if profile is not None and findings is not None:
+                            profile.add_file(rel, _top_level(rel), time.perf_counter() - start, content.size)
+                by_blob[entry.blob] = findings
+            if findings is None:
+                skipped += 1
+                if profile is not None:
+                    profile.skip()
+                continue
+            if cache is not None:
+                cache.put(rel, 0, 0, findings, blob=entry.blob)
+            violations.extend({"file": rel, **finding} for finding in findings)
+    return violations, len(tracked), skipped
+
+
+def verify_public_mirror(
+    repo_root: Path | str = ".",
+    cache_path: Optional[Path | str] = None,
+    git_mode: bool = False,
+    max_size: Optional[int] = None,
+    mmap_threshold: int = DEFAULT_MMAP_THRESHOLD,
+    profile: Optional[ScanProfile] = None,
+) -> dict:
+    """Scan the mirror for private content in a single walk.
+
+    Each pattern stops after MATCH_CAP matches, binary files are skipped,
+    files above ``max_size`` bytes are skipped and large files are matched
+    through mmap. With ``profile``, per-pattern and per-file timings are
+    recorded into it.
+    """
     root = Path(repo_root)
     violations: List[dict] = []
+    skipped = 0
+    cache = ScanCache(cache_path, leakage_ruleset_hash()) if cache_path is not None else None
+    # The cache replays matched text, so it must never scan itself
+    cache_file = cache.path.resolve() if cache is not None else None
+
+    if git_mode:
+        violations, total_files, skipped = scan_tracked_blobs(
+            root, cache, skip=cache_file, max_size=max_size, profile=profile
+        )
+    else:
+        total_files = 0
+        for path in root.rglob("*"):
+            # Every walked entry counts, directories included
+            total_files += 1
+            if not path.is_file():
+                continue
+            if cache_file is not None and path.resolve() == cache_file:
+                continue
+            rel = str(path.relative_to(root))
+            if rel in EXEMPT_FILES:
+                continue
+            if path.suffix in SKIPPED_SUFFIXES:
+                continue
+
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if max_size is not None and st.st_size > max_size:
+                skipped += 1
+                if profile is not None:
+                    profile.skip()
+                continue
+            findings = cache.get(rel, st.st_size, st.st_mtime_ns) if cache is not None else None
+            if findings is not None:
+                if profile is not None:
+                    profile.cached()
+            else:
+                start = time.perf_counter()
+                findings = scan_path(path, st.st_size, mmap_threshold, profile)
+                if findings is None:
+                    skipped += 1
+                    if profile is not None:
+                        profile.skip()
+                    continue
+                if profile is not None:
+                    profile.add_file(rel, _top_level(rel), time.perf_counter() - start, st.st_size)
+                if cache is not None:
+                    cache.put(rel, st.st_size, st.st_mtime_ns, findings)
+            violations.extend({"file": rel, **finding} for finding in findings)
 
-    for path in root.rglob("*"):
-        if not path.is_file():
+    if cache is not None:
+        cache.save()
+
+    result = {
+        "verified_at_utc": __import__("datetime").datetime.now(__import__("datetime").timezone.utc).isoformat(),
+        "total_files_scanned": total_files,
+        "files_skipped": skipped,
+        "violations_found": len(violations),
+        "violations": violations,
+        "status": "PASS" if not violations else "FAIL",
+    }
+    return result
+
+
+def _rule_id(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def leakage_sarif(violations: List[dict]) -> dict:
+    """Convert leakage violations into a SARIF log; one rule per pattern."""
+    rules = {_rule_id(name): name for name, _ in PRIVATE_PATTERNS}
+    results = []
+    for v in violations:
+        result = sarif_result(_rule_id(v["pattern"]), f"{v['pattern']} -> {v['matches']}", v["file"].replace("\\", "/"))
+        if "commit" in v:
+            result["properties"] = {"introducedIn": v["commit"]}
+        results.append(result)
+    return sarif_log("verify_private_leakage", str(SCANNER_VERSION), rules, results)
+
+
+HISTORY_CHECKPOINT_VERSION = 2
+# Raw blob bytes gathered into one history batch before it is scanned
+HISTORY_BATCH_BYTES = 32 * 1024 * 1024
+
+
+def _load_checkpoint(path: Path, rules: str) -> Tuple[dict, Optional[int]]:
+    """Return blob id -> findings from a JSONL history checkpoint.
+
+    The second value is the byte offset where the valid records end, or
+    None when there is no usable checkpoint. A torn last line left by an
+    interrupted run ends the valid records.
+    """
+    scanned: dict = {}
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return scanned, None
+    with f:
+        header = f.readline()
+        try:
+            meta = json.loads(header) if header.endswith(b"\n") else None
+        except ValueError:
+            meta = None
+        if not isinstance(meta, dict) or meta.get("version") != HISTORY_CHECKPOINT_VERSION or meta.get("rules") != rules:
+            # Missing header or pattern table changed: earlier findings no longer apply
+            return scanned, None
+        end = len(header)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            scanned[record["blob"]] = record["findings"]
+            end += len(line)
+    return scanned, end
+
+
+def _open_checkpoint(path: Path, rules: str, valid_end: Optional[int]) -> BinaryIO:
+    """Open a checkpoint for appending; start it afresh when ``valid_end`` is None."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if valid_end is None:
+        f = open(path, "wb")
+        f.write(json.dumps({"version": HISTORY_CHECKPOINT_VERSION, "rules": rules}).encode() + b"\n")
+        return f
+    # Drop a torn last line so new records start on a line of their own
+    os.truncate(path, valid_end)
+    return open(path, "ab")
+
+
+def _append_checkpoint(f: BinaryIO, blobs: List[str], results: List[List[dict]]) -> None:
+    """Append one line per scanned blob; earlier lines are never rewritten."""
+    f.write(b"".join(
+        json.dumps({"blob": blob, "findings": findings}, separators=(",", ":")).encode() + b"\n"
+        for blob, findings in zip(blobs, results)
+    ))
+    f.flush()
+
+
+def _iter_text_batches(
+    reader: BlobReader,
+    blobs: List[str],
+    max_size: Optional[int],
+    batch_bytes: int,
+    oversized: set,
+    missing: set,
+) -> Iterator[Tuple[List[str], List[str]]]:
+    """Read blobs in order and group their text into batches of about ``batch_bytes``.
+
+    Yields (blob ids, texts). Binary blobs get empty text. Blobs that cannot
+    be read are added to ``missing`` and blobs above ``max_size`` are drained
+    unread and added to ``oversized``; neither kind is batched.
+    """
+    batch: List[str] = []
+    texts: List[str] = []
+    size = 0
+    for blob in blobs:
+        content = reader.read_capped(blob, max_size)
+        if content is None:
+            missing.add(blob)
             continue
-        rel = str(path.relative_to(root))
-        if rel in EXEMPT_FILES:
+        if content.data is None:
+            oversized.add(blob)
+            continue
+        else:
+            # Binary blobs are recorded as scanned with no findings
+            text = "" if is_binary(content.data) else decode_blob_text(content.data)
+            size += content.size
+        batch.append(blob)
+        texts.append(text)
+        if size >= batch_bytes:
+            yield batch, texts
+            batch, texts, size = [], [], 0
+    if batch:
+        yield batch, texts
+
+
+def verify_history(
+    repo_root: Path | str = ".",
+    jobs: int = 1,
+    checkpoint_path: Optional[Path | str] = None,
+    max_blobs: Optional[int] = None,
+    batch_bytes: int = HISTORY_BATCH_BYTES,
+    max_size: Optional[int] = None,
+) -> dict:
+    """Scan every blob reachable from any ref, each unique blob exactly once.
+
+    Findings are attributed to the commit that first introduced the blob.
+    Blobs are read and scanned in batches of about ``batch_bytes``. With
+    ``checkpoint_path``, each batch's results are appended to a JSONL
+    checkpoint, one line per blob, so an interrupted or ``max_blobs``-limited
+    run resumes where it stopped. Blobs above ``max_size`` bytes are skipped
+    without being read into memory, and blobs git cannot read are counted as
+    missing; neither is recorded in the checkpoint, and missing blobs keep
+    the status from being PASS.
+    """
+    root = Path(repo_root)
+    rules = leakage_ruleset_hash()
+    checkpoint = Path(checkpoint_path) if checkpoint_path is not None else None
+    scanned, valid_end = _load_checkpoint(checkpoint, rules) if checkpoint is not None else ({}, None)
+
+    first_seen = {}
+    commits = set()
+    for intro in iter_history_blobs(root):
+        commits.add(intro.commit)
+        if intro.blob in first_seen:
             continue
-        if path.suffix in {".pyc", ".exe", ".dll", ".so", ".bin"}:
+        if intro.path in EXEMPT_FILES or Path(intro.path).suffix in SKIPPED_SUFFIXES:
             continue
+        first_seen[intro.blob] = intro
+
+    todo = [blob for blob in first_seen if blob not in scanned]
+    if max_blobs is not None:
+        todo = todo[:max_blobs]
 
+    missing: set = set()
+    oversized: set = set()
+    with BlobReader(root) as reader:
+        ckpt = None
+        pool = None
         try:
-            content = path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
+            ckpt = _open_checkpoint(checkpoint, rules, valid_end) if checkpoint is not None else None
+            if jobs > 1 and len(todo) > 1:
+                from concurrent.futures import ProcessPoolExecutor
 
-        for name, pattern in PRIVATE_PATTERNS:
-            matches = pattern.findall(content)
-            if matches:
-                violations.append({
-                    "file": rel,
-                    "pattern": name,
-                    "matches": matches[:3],  # Cap at 3 matches
-                })
+                pool = ProcessPoolExecutor(max_workers=jobs)
+            for batch, texts in _iter_text_batches(reader, todo, max_size, batch_bytes, oversized, missing):
+                if pool is None:
+                    results = [match_patterns(text) for text in texts]
+                else:
+                    results = list(pool.map(match_patterns, texts, chunksize=max(1, len(texts) // (jobs * 4))))
+                scanned.update(zip(batch, results))
+                if ckpt is not None:
+                    _append_checkpoint(ckpt, batch, results)
+        finally:
+            if ckpt is not None:
+                ckpt.close()
+            # Workers inherit the cat-file pipes; stop them before the reader closes
+            if pool is not None:
+                pool.shutdown()
 
-    result = {
+    violations: List[dict] = []
+    pending = 0
+    for blob, intro in first_seen.items():
+        findings = scanned.get(blob)
+        if findings is None:
+            if blob not in oversized and blob not in missing:
+                pending += 1
+            continue
+        violations.extend({"file": intro.path, "commit": intro.commit, **finding} for finding in findings)
+
+    if violations:
+        status = "FAIL"
+    elif pending or missing:
+        status = "INCOMPLETE"
+    else:
+        status = "PASS"
+    return {
         "verified_at_utc": __import__("datetime").datetime.now(__import__("datetime").timezone.utc).isoformat(),
-        "total_files_scanned": len(list(root.rglob("*"))),
+        "mode": "history",
+        "commits_scanned": len(commits),
+        "unique_blobs": len(first_seen),
+        "blobs_scanned": len(todo) - len(oversized) - len(missing),
+        "blobs_missing": len(missing),
+        "blobs_skipped": len(oversized),
+        "blobs_pending": pending,
         "violations_found": len(violations),
         "violations": violations,
-        "status": "PASS" if not violations else "FAIL",
+        "status": status,
     }
-    return result
 
 
 if __name__ == "__main__":
-    repo = sys.argv[1] if len(sys.argv) > 1 else "."
-    result = verify_public_mirror(repo)
-    print(f"Status: {result['status']}")
-    print(f"Files scanned: {result['total_files_scanned']}")
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Verify that no private content leaked into the public mirror")
+    parser.add_argument("repo", nargs="?", default=".", help="Repository root to scan (default: .)")
+    parser.add_argument("--cache", metavar="PATH", help="Incremental scan cache file (rescans only changed files)")
+    parser.add_argument("--git-mode", action="store_true", help="Scan tracked files from git objects, each unique blob once")
+    parser.add_argument("--max-size", type=int, metavar="BYTES", help="Skip files (or --history blobs) larger than this many bytes")
+    parser.add_argument("--history", action="store_true", help="Scan every blob in the reachable history")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for --history scanning (default: 1)")
+    parser.add_argument("--checkpoint", metavar="PATH", help="Resumable --history checkpoint file")
+    parser.add_argument("--max-blobs", type=int, help="Stop --history after scanning this many new blobs")
+    parser.add_argument("--profile", metavar="PATH", help="Write per-pattern/root/file timings as JSON")
+    parser.add_argument("--sarif", metavar="PATH", help="Write findings as a SARIF 2.1.0 log")
+    args = parser.parse_args()
+    if args.profile and args.history:
+        parser.error("--profile is not supported with --history")
+
+    if args.history:
+        result = verify_history(
+            args.repo, jobs=args.jobs, checkpoint_path=args.checkpoint, max_blobs=args.max_blobs, max_size=args.max_size
+        )
+        print(f"Status: {result['status']}")
+        print(f"Commits: {result['commits_scanned']}")
+        print(f"Unique blobs: {result['unique_blobs']} (scanned now: {result['blobs_scanned']}, pending: {result['blobs_pending']})")
+        print(f"Blobs skipped: {result['blobs_skipped']}")
+        print(f"Blobs missing: {result['blobs_missing']}")
+    else:
+        profile = ScanProfile() if args.profile else None
+        result = verify_public_mirror(
+            args.repo, cache_path=args.cache, git_mode=args.git_mode, max_size=args.max_size, profile=profile
+        )
+        if profile is not None:
+            write_json(args.profile, profile.to_dict())
+        print(f"Status: {result['status']}")
+        print(f"Files scanned: {result['total_files_scanned']}")
+        print(f"Files skipped: {result['files_skipped']}")
+    if args.sarif:
+        write_json(args.sarif, leakage_sarif(result["violations"]))
     print(f"Violations: {result['violations_found']}")
     for v in result["violations"]:
-        print(f"  - {v['file']}: {v['pattern']} -> {v['matches']}")
+        introduced = f" (introduced in {v['commit'][:12]})" if "commit" in v else ""
+        print(f"  - {v['file']}: {v['pattern']} -> {v['matches']}{introduced}")
     sys.exit(0 if result["status"] == "PASS" else 1)
@@ -1 +0,0 @@
-"""Tests for public OpenCore modules."""
@@ -0,0 +1,20 @@
+"""Shared fixtures for the 12_tooling script tests."""
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from git_helpers import run_git  # noqa: E402
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """An empty git repository in a temporary directory."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    run_git(repo, "init", "-q")
+    return repo
@@ -0,0 +1,24 @@
+"""Git helpers for tests that build throwaway repositories."""
+import subprocess
+from pathlib import Path
+
+
+def run_git(repo: Path, *args: str) -> str:
+    """Run git in ``repo`` with a fixed identity and return its stdout."""
+    return subprocess.run(
+        [
+            "git", "-c", "user.name=test", "-c", "user.email=test@example.com",
+            "-c", "commit.gpgsign=false", *args,
+        ],
+        cwd=str(repo),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def commit_all(repo: Path, message: str) -> str:
+    """Stage everything in ``repo``, commit it and return the commit id."""
+    run_git(repo, "add", "-A")
+    run_git(repo, "commit", "-q", "--allow-empty", "-m", message)
+    return run_git(repo, "rev-parse", "HEAD").strip()
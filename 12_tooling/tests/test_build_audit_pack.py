@@ -0,0 +1,109 @@
+"""Tests for the audit pack builder."""
+import hashlib
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import build_audit_pack as bap
+
+
+@pytest.fixture
+def pack_tree(tmp_path):
+    """A tree with evidence and policy files, plus one in a pruned directory."""
+    root = tmp_path / "tree"
+    files = {
+        "23_compliance/evidence/a.json": '{"a": 1}\n',
+        "23_compliance/evidence/b.json": '{"b": 2}\n',
+        "23_compliance/policies/p.yaml": "rule: x\n",
+        "node_modules/pkg/ignored.json": "{}\n",
+    }
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+def test_pack_records_size_and_mtime(pack_tree):
+    pack = bap.build_audit_pack(pack_tree)
+    assert pack["total_files"] == 3
+    entry = pack["evidence_files"][0]
+    st = os.stat(pack_tree / entry["path"])
+    assert (entry["size"], entry["mtime_ns"]) == (st.st_size, st.st_mtime_ns)
+
+
+def test_since_reuses_previous_hashes_without_sidecar(pack_tree):
+    previous = bap.build_audit_pack(pack_tree)
+    (pack_tree / "23_compliance/evidence/b.json").write_text('{"b": 3, "x": 0}\n')
+    (pack_tree / "23_compliance/evidence/c.json").write_text('{"c": 1}\n')
+    (pack_tree / "23_compliance/policies/p.yaml").unlink()
+
+    current = bap.build_audit_pack(pack_tree, previous=previous)
+    # Only the modified and the new file are read
+    assert current["hash_stats"]["files"] == 2
+    fresh = bap.build_audit_pack(pack_tree)
+    for key in bap.PACK_SECTIONS + ("combined_hash",):
+        assert current[key] == fresh[key]
+
+    delta = bap.delta_pack(previous, current)
+    assert [e["path"] for e in delta["added"]] == [os.path.join("23_compliance", "evidence", "c.json")]
+    assert [e["path"] for e in delta["changed"]] == [os.path.join("23_compliance", "evidence", "b.json")]
+    assert [e["path"] for e in delta["removed"]] == [os.path.join("23_compliance", "policies", "p.yaml")]
+    assert delta["unchanged"] == 1
+    assert delta["combined_hash"] == current["combined_hash"]
+
+
+def test_since_rejects_tampered_previous_pack(pack_tree):
+    previous = bap.build_audit_pack(pack_tree)
+    previous["evidence_files"][0]["sha256"] = "0" * 64
+    with pytest.raises(ValueError):
+        bap.delta_pack(previous, bap.build_audit_pack(pack_tree))
+
+
+@pytest.mark.parametrize("compression", bap.ARCHIVE_COMPRESSIONS)
+def test_archive_is_byte_identical_across_builds(pack_tree, tmp_path, compression):
+    first = bap.build_audit_pack(pack_tree)
+    first_path = tmp_path / f"first.tar.{compression}"
+    bap.write_archive(first, pack_tree, first_path, compression)
+
+    # Same content, different file times and build time
+    time.sleep(0.001)
+    for entry in first["evidence_files"]:
+        os.utime(pack_tree / entry["path"], ns=(1, entry["mtime_ns"] + 10**9))
+    second = bap.build_audit_pack(pack_tree)
+    assert second["build_id"] != first["build_id"]
+    second_path = tmp_path / f"second.tar.{compression}"
+    info = bap.write_archive(second, pack_tree, second_path, compression)
+
+    assert first_path.read_bytes() == second_path.read_bytes()
+    assert info["archive_sha256"] == hashlib.sha256(second_path.read_bytes()).hexdigest()
+    result = bap.verify_archive(second_path)
+    assert (result["status"], result["members_checked"]) == ("PASS", 3)
+
+
+def test_archive_rejects_file_changed_after_indexing(pack_tree, tmp_path):
+    pack = bap.build_audit_pack(pack_tree)
+    (pack_tree / "23_compliance/evidence/a.json").write_text('{"a": 9}\n')
+    archive = tmp_path / "pack.tar.gz"
+    with pytest.raises(ValueError):
+        bap.write_archive(pack, pack_tree, archive)
+    assert not archive.exists()
+
+
+def test_script_runs_without_the_src_package(pack_tree, tmp_path):
+    # Only 12_tooling is exported; its scripts must not need the root src package
+    script = tmp_path / "exported" / "scripts"
+    script.mkdir(parents=True)
+    for name in ("build_audit_pack.py", "deterministic_tar.py", "hash_engine.py"):
+        (script / name).write_bytes((Path(bap.__file__).parent / name).read_bytes())
+    archive = tmp_path / "pack.tar.gz"
+    result = subprocess.run(
+        [sys.executable, str(script / "build_audit_pack.py"), str(pack_tree), "--archive", str(archive)],
+        capture_output=True, text=True, cwd=tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    assert bap.verify_archive(archive)["status"] == "PASS"
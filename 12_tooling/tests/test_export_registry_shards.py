@@ -0,0 +1,77 @@
+"""Tests for the sharded export registry layout."""
+import json
+
+import verify_export_manifest as vem
+from export_registry_shards import LEGACY_REGISTRY, SHARD_DIR, ShardedRegistry, load_index, migrate_legacy
+
+
+def _manifest(export_id, created=None):
+    m = {field: "x" for field in vem.REQUIRED_FIELDS}
+    m["export_id"] = export_id
+    if created is None:
+        del m["created_at_utc"]
+    else:
+        m["created_at_utc"] = created
+    return m
+
+
+def test_migrate_legacy_round_trip(tmp_path):
+    manifests = [
+        _manifest("a", "2026-01-05T00:00:00+00:00"),
+        _manifest("b", "2026-02-05T00:00:00+00:00"),
+        _manifest("c", "2026-01-20T00:00:00+00:00"),
+        _manifest("d"),
+    ]
+    legacy = tmp_path / LEGACY_REGISTRY
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(json.dumps({"registry_version": "1", "manifests": manifests}))
+
+    assert migrate_legacy(tmp_path) == 4
+    document = json.loads(legacy.read_text())
+    assert document["manifests"] == []
+    assert document["registry_version"] == "1"
+    assert document["manifest_shards"] == "export_shards/index.json"
+
+    registry = ShardedRegistry(tmp_path / SHARD_DIR)
+    assert [s["name"] for s in registry.index["shards"]] == ["2026-01.jsonl", "2026-02.jsonl", "undated.jsonl"]
+    assert [m["export_id"] for m in registry.iter_manifests()] == ["a", "c", "b", "d"]
+    assert sorted(registry.iter_manifests(), key=lambda m: m["export_id"]) == manifests
+    # The undated manifest lacks created_at_utc, so the verifier flags only that
+    result = vem.verify_export_manifest(tmp_path)
+    assert result["manifest_count"] == 4
+    assert result["issues"] == ["Manifest d missing field: created_at_utc"]
+
+
+def test_append_extends_shards_and_index(tmp_path):
+    shard_dir = tmp_path / SHARD_DIR
+    ShardedRegistry(shard_dir).append(_manifest("a", "2026-03-01T00:00:00+00:00"))
+    reopened = ShardedRegistry(shard_dir)
+    assert reopened.append_many([]) == 0
+    reopened.append(_manifest("b", "2026-03-02T00:00:00+00:00"))
+
+    index = load_index(shard_dir)
+    (entry,) = index["shards"]
+    assert (entry["name"], entry["manifests"], index["total_manifests"]) == ("2026-03.jsonl", 2, 2)
+    assert entry["bytes"] == (shard_dir / "2026-03.jsonl").stat().st_size
+    assert vem.verify_export_manifest(tmp_path)["status"] == "PASS"
+
+
+def test_reindex_repairs_a_stale_index_and_torn_line(tmp_path):
+    shard_dir = tmp_path / SHARD_DIR
+    registry = ShardedRegistry(shard_dir)
+    registry.append_many([_manifest("a", "2026-01-05T00:00:00+00:00"), _manifest("b", "2026-02-05T00:00:00+00:00")])
+    index_before = (shard_dir / "index.json").read_text()
+
+    # A crash after the shard append but before the index write, mid-line
+    with open(shard_dir / "2026-02.jsonl", "ab") as f:
+        f.write(json.dumps(_manifest("c", "2026-02-06T00:00:00+00:00")).encode() + b"\n")
+        f.write(b'{"export_id": "d", "sou')
+    (shard_dir / "index.json").write_text(index_before)
+    assert vem.verify_export_manifest(tmp_path)["status"] == "FAIL"
+
+    result = ShardedRegistry(shard_dir).reindex()
+    assert result == {"shards": 2, "total_manifests": 3, "truncated": ["2026-02.jsonl"]}
+    assert (shard_dir / "2026-02.jsonl").read_bytes().endswith(b"}\n")
+    verified = vem.verify_export_manifest(tmp_path)
+    assert verified["status"] == "PASS", verified["issues"]
+    assert verified["manifest_count"] == 3
@@ -0,0 +1,94 @@
+"""Tests for the git object helpers shared by the validators."""
+import os
+
+import pytest
+
+from git_objects import BlobReader, decode_blob_text, iter_history_blobs, list_tracked_files
+
+from git_helpers import commit_all, run_git
+
+
+def test_list_tracked_files_skips_symlinks_and_keeps_odd_names(git_repo):
+    (git_repo / "dir").mkdir()
+    (git_repo / "dir" / "tab\tname é.md").write_text("x\n")
+    (git_repo / "plain.md").write_text("y\n")
+    if hasattr(os, "symlink"):
+        os.symlink("plain.md", git_repo / "link.md")
+    commit_all(git_repo, "files")
+
+    tracked = list_tracked_files(git_repo)
+    assert [t.path for t in tracked] == ["dir/tab\tname é.md", "plain.md"]
+    assert [t.path for t in list_tracked_files(git_repo, ["dir"])] == ["dir/tab\tname é.md"]
+
+
+def test_blob_reader_reads_content_and_reports_missing(git_repo):
+    (git_repo / "a.txt").write_bytes(b"line\r\nnext\n")
+    commit_all(git_repo, "a")
+    blob = run_git(git_repo, "rev-parse", "HEAD:a.txt").strip()
+    with BlobReader(git_repo) as reader:
+        assert reader.read(blob) == b"line\r\nnext\n"
+        assert reader.read("0" * 40) is None
+        # The stream stays in sync after a missing object
+        assert decode_blob_text(reader.read(blob)) == "line\nnext\n"
+
+
+def test_history_yields_first_introduction_of_each_blob(git_repo):
+    (git_repo / "a.md").write_text("one\n")
+    first = commit_all(git_repo, "add")
+    run_git(git_repo, "mv", "a.md", "renamed file.md")
+    second = commit_all(git_repo, "rename")
+    (git_repo / "renamed file.md").write_text("two\n")
+    third = commit_all(git_repo, "edit")
+    (git_repo / "renamed file.md").unlink()
+    commit_all(git_repo, "delete")
+
+    intros = list(iter_history_blobs(git_repo))
+    assert [(i.commit, i.path) for i in intros] == [
+        (first, "a.md"), (second, "renamed file.md"), (third, "renamed file.md"),
+    ]
+    # The rename carries the blob of the first commit
+    assert intros[0].blob == intros[1].blob != intros[2].blob
+
+
+def test_read_capped_drains_oversized_blob_in_chunks(git_repo):
+    import git_objects
+
+    (git_repo / "big.txt").write_bytes(b"x" * (3 * git_objects._DRAIN_CHUNK + 5))
+    (git_repo / "small.txt").write_bytes(b"small")
+    commit_all(git_repo, "blobs")
+    big = run_git(git_repo, "rev-parse", "HEAD:big.txt").strip()
+    small = run_git(git_repo, "rev-parse", "HEAD:small.txt").strip()
+
+    with BlobReader(git_repo) as reader:
+        stdout = reader._proc.stdout
+        sizes = []
+
+        class RecordingStream:
+            def read(self, size=-1):
+                sizes.append(size)
+                return stdout.read(size)
+
+            def readline(self):
+                return stdout.readline()
+
+            def close(self):
+                stdout.close()
+
+        reader._proc.stdout = RecordingStream()
+        content = reader.read_capped(big, max_size=1024)
+        assert content.size == 3 * git_objects._DRAIN_CHUNK + 5
+        assert content.data is None
+        assert all(0 < size <= git_objects._DRAIN_CHUNK for size in sizes)
+        # The pipe is drained exactly, so the next object reads cleanly
+        assert reader.read_capped(small, max_size=1024).data == b"small"
+
+
+@pytest.mark.parametrize("data, text", [
+    (b"a\r\nb", "a\nb"),
+    (b"a\rb", "a\nb"),
+    (b"\xffok", "ok"),
+])
+def test_decode_blob_text_matches_read_text(tmp_path, data, text):
+    path = tmp_path / "f"
+    path.write_bytes(data)
+    assert decode_blob_text(data) == text == path.read_text(encoding="utf-8", errors="ignore")
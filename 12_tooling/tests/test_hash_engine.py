@@ -0,0 +1,82 @@
+"""Tests for the parallel hash engine shared by the audit tooling."""
+import hashlib
+import json
+import os
+
+import pytest
+
+import hash_engine
+from hash_engine import FileEntry, HashCache, hash_files, sha256_file
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Files of assorted sizes, including empty and multi-buffer ones."""
+    sizes = [0, 1, 4095, 4096, 70_000]
+    paths = []
+    for i, size in enumerate(sizes):
+        path = tmp_path / f"f{i}.bin"
+        path.write_bytes(bytes(range(256)) * (size // 256) + b"x" * (size % 256))
+        paths.append(path)
+    return paths
+
+
+def _expected(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_threaded_hashing_matches_serial(files):
+    entries = [FileEntry.from_path(p) for p in files]
+    serial, serial_stats = hash_files(entries, workers=1)
+    threaded, threaded_stats = hash_files(entries, workers=4)
+    assert serial == threaded == [_expected(p) for p in files]
+    assert serial_stats.files == threaded_stats.files == len(files)
+    assert threaded_stats.bytes == sum(e.size for e in entries)
+
+
+def test_mmap_path_matches_chunked_path(files, monkeypatch):
+    monkeypatch.setattr(hash_engine, "HASH_BUFFER_SIZE", 1000)
+    chunked = [sha256_file(p) for p in files]
+    monkeypatch.setattr(hash_engine, "MMAP_THRESHOLD", 1)
+    mapped = [sha256_file(p) for p in files]
+    assert chunked == mapped == [_expected(p) for p in files]
+
+
+def test_cache_reuses_digest_until_size_or_mtime_changes(files, tmp_path):
+    cache_path = tmp_path / "cache" / "hashes.json"
+    entries = [FileEntry.from_path(p) for p in files]
+    cache = HashCache(cache_path)
+    hash_files(entries, workers=2, cache=cache)
+    cache.save()
+
+    warm = HashCache(cache_path)
+    digests, stats = hash_files(entries, workers=2, cache=warm)
+    assert (stats.cache_hits, stats.files) == (len(files), 0)
+    assert digests == [_expected(p) for p in files]
+
+    # Same size, new mtime; and new size, same mtime
+    st = files[1].stat()
+    files[1].write_bytes(b"y")
+    os.utime(files[1], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    st = files[2].stat()
+    files[2].write_bytes(b"z" * 10)
+    os.utime(files[2], ns=(st.st_atime_ns, st.st_mtime_ns))
+    changed = [FileEntry.from_path(p) for p in files]
+    digests, stats = hash_files(changed, workers=2, cache=warm)
+    assert (stats.cache_hits, stats.files) == (len(files) - 2, 2)
+    assert digests == [_expected(p) for p in files]
+
+
+def test_cache_ignores_other_versions_and_memory_only_save(files, tmp_path):
+    cache_path = tmp_path / "hashes.json"
+    entry = FileEntry.from_path(files[0])
+    cache_path.write_text(json.dumps({
+        "version": hash_engine.HASH_CACHE_VERSION + 1,
+        "entries": {os.path.abspath(entry.path): [entry.size, entry.mtime_ns, "0" * 64]},
+    }))
+    assert HashCache(cache_path).get(entry) is None
+
+    memory = HashCache(None)
+    memory.put(entry, _expected(files[0]))
+    memory.save()
+    assert memory.get(entry) == _expected(files[0])
@@ -0,0 +1,210 @@
+"""Tests for the public boundary validator's scan modes."""
+import random
+
+import pytest
+
+import validate_public_boundary as vpb
+
+from git_helpers import commit_all, run_git
+
+# Built at runtime so this file does not trip the validator it tests
+PRIVATE_REF = "ssid-" + "private"
+LOCAL_PATH = "C:" + "/Users/dev/project"
+AWS_KEY = "AKIA" + "ABCDEFGHIJKLMNOP"
+
+
+@pytest.fixture
+def boundary_tree(tmp_path):
+    """A small tree with one violation per rule family across the exported roots."""
+    root = tmp_path / "tree"
+    files = {
+        "03_core/validators/refs.py": f"SOURCE = '{PRIVATE_REF}'\n",
+        "03_core/validators/copy_of_refs.py": f"SOURCE = '{PRIVATE_REF}'\n",
+        "03_core/validators/clean.py": "VALUE = 1\n",
+        "12_tooling/docs/status.md": "# Status\n\nplain\nplain\nWe are live on mainnet.\nplain\nplain\n",
+        "12_tooling/docs/roadmap.md": "# Roadmap\n\nMainnet launch is planned.\n",
+        "16_codex/decisions/paths.yaml": f"path: {LOCAL_PATH}\n",
+        "23_compliance/policies/keys.json": f'{{"key": "{AWS_KEY}"}}\n',
+        "24_meta_orchestration/dispatcher/.env": "TOKEN=x\n",
+        "24_meta_orchestration/dispatcher/notes.md": "Nothing here.\n",
+    }
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+def _sorted(report):
+    return {family: sorted(violations) for family, violations in report.items()}
+
+
+def test_tree_has_one_finding_per_family(boundary_tree):
+    report = vpb.scan_exported_roots(boundary_tree)
+    assert len(report["private_repo_refs"]) == 2
+    assert len(report["local_paths"]) == 1
+    assert len(report["secrets"]) == 2
+    assert report["mainnet_claims"] == ["12_tooling/docs/status.md:5: unbacked mainnet claim"]
+
+
+def test_single_walk_matches_per_check_validators(boundary_tree):
+    report = vpb.scan_exported_roots(boundary_tree)
+    assert report["private_repo_refs"] == vpb.validate_no_private_repo_refs(boundary_tree)
+    assert report["local_paths"] == vpb.validate_no_local_paths(boundary_tree)
+    assert report["secrets"] == vpb.validate_no_secrets(boundary_tree)
+    assert report["mainnet_claims"] == vpb.validate_no_mainnet_false_claims(boundary_tree)
+
+
+def test_jobs_report_matches_serial(boundary_tree):
+    serial = vpb.scan_exported_roots(boundary_tree)
+    assert vpb.scan_exported_roots(boundary_tree, jobs=2) == serial
+    assert vpb.scan_exported_roots(boundary_tree, jobs=4) == serial
+
+
+def test_cache_reports_match_serial(boundary_tree, tmp_path):
+    serial = vpb.scan_exported_roots(boundary_tree)
+    cache_path = tmp_path / "scan_cache.json"
+    cold = vpb.scan_exported_roots(boundary_tree, cache_path=cache_path)
+    assert cache_path.exists()
+    warm = vpb.scan_exported_roots(boundary_tree, jobs=2, cache_path=cache_path)
+    assert cold == serial
+    assert warm == serial
+
+
+def test_cache_rescans_changed_files(boundary_tree, tmp_path):
+    cache_path = tmp_path / "scan_cache.json"
+    vpb.scan_exported_roots(boundary_tree, cache_path=cache_path)
+    (boundary_tree / "03_core/validators/clean.py").write_text(f"SOURCE = '{PRIVATE_REF}-2'\n")
+    report = vpb.scan_exported_roots(boundary_tree, cache_path=cache_path)
+    assert report == vpb.scan_exported_roots(boundary_tree)
+    assert len(report["private_repo_refs"]) == 3
+
+
+def test_cache_is_invalidated_by_rule_edit(boundary_tree, tmp_path, monkeypatch):
+    cache_path = tmp_path / "scan_cache.json"
+    before = vpb.scan_exported_roots(boundary_tree, cache_path=cache_path)
+    assert before["mainnet_claims"]
+
+    monkeypatch.setattr(vpb, "MAINNET_ALLOWED_CONTEXT", vpb.MAINNET_ALLOWED_CONTEXT + ["we are"])
+    after = vpb.scan_exported_roots(boundary_tree, cache_path=cache_path)
+    assert after["mainnet_claims"] == []
+    assert after == vpb.scan_exported_roots(boundary_tree)
+
+
+def test_profile_does_not_change_report(boundary_tree):
+    profile = vpb.ScanProfile()
+    assert vpb.scan_exported_roots(boundary_tree, profile=profile) == vpb.scan_exported_roots(boundary_tree)
+    data = profile.to_dict()
+    # The .env file is blocked by type and never read
+    assert (data["files_scanned"], data["files_skipped"]) == (8, 1)
+    assert data["rules"]["mainnet_claims"]["hits"] == 1
+    assert set(data["roots"]) == {"03_core", "12_tooling", "16_codex", "23_compliance", "24_meta_orchestration"}
+
+
+def test_sarif_has_one_located_result_per_violation(boundary_tree):
+    report = vpb.scan_exported_roots(boundary_tree)
+    log = vpb.boundary_sarif(report)
+    run = log["runs"][0]
+    assert log["version"] == "2.1.0"
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == list(vpb.SARIF_RULES)
+
+    results = run["results"]
+    assert len(results) == sum(len(v) for v in report.values())
+    located = sorted(
+        (r["ruleId"], r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"]) for r in results
+    )
+    assert located == sorted(
+        (family, v.split(":")[0].replace("\\", "/")) for family, vs in report.items() for v in vs
+    )
+    (claim,) = [r for r in results if r["ruleId"] == "mainnet_claims"]
+    assert claim["locations"][0]["physicalLocation"] == {
+        "artifactLocation": {"uri": "12_tooling/docs/status.md"}, "region": {"startLine": 5},
+    }
+    assert claim["message"]["text"] == "unbacked mainnet claim"
+
+
+def test_git_mode_matches_working_tree_scan(boundary_tree):
+    run_git(boundary_tree, "init", "-q")
+    commit_all(boundary_tree, "tree")
+    working = vpb.scan_exported_roots(boundary_tree)
+    # Git mode reports in index order; the findings themselves are identical
+    assert _sorted(vpb.scan_exported_roots(boundary_tree, git_mode=True)) == _sorted(working)
+    assert _sorted(vpb.scan_exported_roots(boundary_tree, git_mode=True, jobs=2)) == _sorted(working)
+
+
+def test_git_mode_ignores_untracked_files(boundary_tree):
+    run_git(boundary_tree, "init", "-q")
+    commit_all(boundary_tree, "tree")
+    (boundary_tree / "03_core/validators/untracked.py").write_text(f"X = '{PRIVATE_REF}'\n")
+    report = vpb.scan_exported_roots(boundary_tree, git_mode=True)
+    assert len(report["private_repo_refs"]) == 2
+
+
+def test_git_mode_reads_each_blob_once(boundary_tree, monkeypatch):
+    run_git(boundary_tree, "init", "-q")
+    commit_all(boundary_tree, "tree")
+    reads = []
+
+    class CountingReader(vpb.BlobReader):
+        def read(self, blob):
+            reads.append(blob)
+            return super().read(blob)
+
+    monkeypatch.setattr(vpb, "BlobReader", CountingReader)
+    report = vpb.scan_exported_roots(boundary_tree, git_mode=True)
+    # refs.py and copy_of_refs.py share a blob: scanned once, reported twice
+    assert len(reads) == len(set(reads))
+    assert len(report["private_repo_refs"]) == 2
+
+
+def test_git_mode_cache_replays_by_blob(boundary_tree, tmp_path, monkeypatch):
+    run_git(boundary_tree, "init", "-q")
+    commit_all(boundary_tree, "tree")
+    cache_path = tmp_path / "git_cache.json"
+    cold = vpb.scan_exported_roots(boundary_tree, git_mode=True, cache_path=cache_path)
+
+    def no_blob_scans(repo_root, items, jobs=1):
+        assert not items, "a warm run must not read blobs"
+        return []
+
+    monkeypatch.setattr(vpb, "run_blob_scans", no_blob_scans)
+    assert vpb.scan_exported_roots(boundary_tree, git_mode=True, cache_path=cache_path) == cold
+
+
+def _reference_mainnet_claims(content):
+    """The original split-and-rejoin implementation, kept as the parity oracle."""
+    lines = content.split("\n")
+    claims = []
+    for i, line in enumerate(lines):
+        if not any(word in line.lower() for word in vpb.MAINNET_TRIGGER_WORDS):
+            continue
+        context = "\n".join(lines[max(0, i - 2) : min(len(lines), i + 3)])
+        if any(keyword in context.lower() for keyword in vpb.MAINNET_ALLOWED_CONTEXT):
+            continue
+        claims.append(i + 1)
+    return claims
+
+
+@pytest.mark.parametrize("content", [
+    "",
+    "mainnet",
+    "mainnet\n",
+    "\n\nlive\n\n",
+    "Production\nplanned",
+    "a\nb\nmainnet\nc\nd\ne\nreference",
+    "live\nx\nx\nx\nwill\nlive",
+])
+def test_mainnet_window_matches_reference(content):
+    assert vpb.find_mainnet_claims(content) == _reference_mainnet_claims(content)
+
+
+def test_mainnet_window_matches_reference_randomized():
+    words = ["mainnet", "Production", "live", "testnet", "will", "link", "plain", "", "text"]
+    rng = random.Random(16)
+    for _ in range(2000):
+        lines = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(0, 3)))
+            for _ in range(rng.randint(0, 12))
+        ]
+        content = "\n".join(lines) + rng.choice(["", "\n"])
+        assert vpb.find_mainnet_claims(content) == _reference_mainnet_claims(content), content
@@ -0,0 +1,145 @@
+"""Tests for the export manifest verifier's registry and --deep checks."""
+import hashlib
+import json
+
+import pytest
+
+import hash_engine
+import verify_export_manifest as vem
+from export_registry_shards import LEGACY_REGISTRY, SHARD_DIR, ShardedRegistry
+
+
+def _manifest(export_id, created):
+    m = {field: "x" for field in vem.REQUIRED_FIELDS}
+    m.update(export_id=export_id, created_at_utc=created)
+    return m
+
+
+@pytest.fixture
+def sharded_repo(tmp_path):
+    """A repository with a two-shard registry and no legacy document."""
+    ShardedRegistry(tmp_path / SHARD_DIR).append_many([
+        _manifest("a", "2026-01-05T00:00:00+00:00"),
+        _manifest("b", "2026-02-05T00:00:00+00:00"),
+        _manifest("c", "2026-02-06T00:00:00+00:00"),
+    ])
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_sharded_registry_passes(sharded_repo, jobs):
+    result = vem.verify_export_manifest(sharded_repo, jobs=jobs)
+    assert result["status"] == "PASS"
+    assert result["manifest_count"] == 3
+    assert [s["shard"] for s in result["shards"]] == ["2026-01.jsonl", "2026-02.jsonl"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_missing_shard_is_reported_once(sharded_repo, jobs):
+    (sharded_repo / SHARD_DIR / "2026-01.jsonl").unlink()
+    result = vem.verify_export_manifest(sharded_repo, jobs=jobs)
+    assert result["status"] == "FAIL"
+    assert result["issues"] == ["Shard 2026-01.jsonl listed in index but missing"]
+    assert [s["shard"] for s in result["shards"]] == ["2026-02.jsonl"]
+    assert result["manifest_count"] == 2
+
+
+def test_unlisted_and_drifted_shards_are_reported(sharded_repo):
+    shard_dir = sharded_repo / SHARD_DIR
+    (shard_dir / "stray.jsonl").write_text("")
+    with open(shard_dir / "2026-02.jsonl", "a") as f:
+        f.write("{}\n")
+    _, issues = vem.verify_shards(shard_dir, vem.load_index(shard_dir))
+    assert issues == [
+        "Shard 2026-02.jsonl has 3 manifest(s), index records 2",
+        "Shard 2026-02.jsonl is "
+        f"{(shard_dir / '2026-02.jsonl').stat().st_size} bytes, index records "
+        f"{(shard_dir / '2026-02.jsonl').stat().st_size - 3}",
+        "Shard stray.jsonl not listed in index",
+    ]
+
+
+def _sha(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def deep_repo(tmp_path):
+    """A legacy registry whose manifest lists generated files on disk."""
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "a.json").write_bytes(b"a")
+    (tmp_path / "out" / "b.json").write_bytes(b"b")
+    (tmp_path / "out" / "sub").mkdir()
+    return tmp_path
+
+
+def _write_registry(root, generated, source=None):
+    m = _manifest("e1", "2026-01-05T00:00:00+00:00")
+    m["generated_file_hashes"] = generated
+    m["source_file_hashes"] = source or {}
+    path = root / LEGACY_REGISTRY
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"manifests": [m]}))
+
+
+def test_deep_accepts_plain_and_prefixed_hashes(deep_repo):
+    _write_registry(deep_repo, {"out/a.json": _sha(b"a"), "out/b.json": "sha256:" + _sha(b"b").upper()},
+                    source={"src/a.json": _sha(b"a")})
+    result = vem.verify_export_manifest(deep_repo, deep=True)
+    assert result["status"] == "PASS", result["issues"]
+    report = result["deep_verify"]
+    assert (report["files_listed"], report["files_checked"], report["source_files_skipped"]) == (3, 2, 1)
+
+
+def test_deep_reports_mismatch_missing_and_invalid(deep_repo):
+    _write_registry(deep_repo, {
+        "out/a.json": _sha(b"other"),
+        "out/gone.json": _sha(b"x"),
+        "out/b.json": "md5:abc",
+        "../escape.json": _sha(b"x"),
+    })
+    result = vem.verify_export_manifest(deep_repo, deep=True)
+    assert result["status"] == "FAIL"
+    report = result["deep_verify"]
+    assert (report["mismatch_count"], report["missing_count"], report["invalid_count"]) == (1, 1, 2)
+    assert report["mismatches"][0].endswith(f"expected {_sha(b'other')}, found {_sha(b'a')}")
+    assert [i.split(":")[0] for i in result["issues"]] == [
+        "hash mismatch", "missing file", "invalid entry", "invalid entry",
+    ]
+
+
+def test_deep_reports_unreadable_paths_instead_of_crashing(deep_repo, monkeypatch):
+    _write_registry(deep_repo, {"out/sub": _sha(b"x"), "out/a.json": _sha(b"a"), "out/b.json": _sha(b"b")})
+    real_sha256_file = hash_engine.sha256_file
+
+    def deny_b(path, size=None):
+        if str(path).endswith("b.json"):
+            raise PermissionError(13, "Permission denied")
+        return real_sha256_file(path, size)
+
+    monkeypatch.setattr(hash_engine, "sha256_file", deny_b)
+    result = vem.verify_export_manifest(deep_repo, deep=True, workers=2)
+    report = result["deep_verify"]
+    assert result["status"] == "FAIL"
+    assert report["unreadable_count"] == 2
+    assert report["unreadable"][0].endswith("not a regular file")
+    assert report["unreadable"][1].endswith("b.json: Permission denied")
+    assert (report["files_checked"], report["mismatch_count"]) == (1, 0)
+
+
+def test_deep_overflow_uses_plural_labels(deep_repo, monkeypatch):
+    monkeypatch.setattr(vem, "MAX_REPORTED", 1)
+    _write_registry(deep_repo, {f"out/gone{i}.json": _sha(b"x") for i in range(3)}
+                    | {"a.json": "bad", "b.json": "bad", "c.json": "bad"})
+    issues = vem.verify_export_manifest(deep_repo, deep=True)["issues"]
+    assert "... and 2 more missing files" in issues
+    assert "... and 2 more invalid entries" in issues
+
+
+def test_deep_reuses_hash_cache(deep_repo, tmp_path):
+    _write_registry(deep_repo, {"out/a.json": _sha(b"a"), "out/b.json": _sha(b"b")})
+    cache = tmp_path / "hashes.json"
+    cold = vem.verify_export_manifest(deep_repo, deep=True, hash_cache=cache)["deep_verify"]["hash_stats"]
+    warm = vem.verify_export_manifest(deep_repo, deep=True, hash_cache=cache)["deep_verify"]["hash_stats"]
+    assert (cold["files"], cold["cache_hits"]) == (2, 0)
+    assert (warm["files"], warm["cache_hits"]) == (0, 2)
@@ -0,0 +1,223 @@
+"""Tests for the private leakage verifier's scan modes."""
+import json
+
+import pytest
+
+import verify_private_leakage as vpl
+
+from git_helpers import commit_all
+
+# Built at runtime so this file does not trip the verifier it tests
+LEAK = "Omni" + "Root"
+LEAK_PATTERN = LEAK + " internals"
+
+
+@pytest.fixture
+def leak_tree(git_repo):
+    """A committed tree with two leaking files (one duplicated) and a binary file."""
+    (git_repo / "docs").mkdir()
+    (git_repo / "docs" / "a.md").write_text(f"uses {LEAK} here\n")
+    (git_repo / "docs" / "a_copy.md").write_text(f"uses {LEAK} here\n")
+    (git_repo / "docs" / "clean.md").write_text("nothing to see\n")
+    (git_repo / "docs" / "image.dat").write_bytes(b"\0" + LEAK.encode())
+    commit_all(git_repo, "tree")
+    return git_repo
+
+
+def _findings(result):
+    return sorted((v["file"].replace("\\", "/"), v["pattern"]) for v in result["violations"])
+
+
+def test_cache_replays_identical_report(leak_tree, tmp_path):
+    plain = vpl.verify_public_mirror(leak_tree)
+    cache_path = tmp_path / "leak_cache.json"
+    cold = vpl.verify_public_mirror(leak_tree, cache_path=cache_path)
+    warm = vpl.verify_public_mirror(leak_tree, cache_path=cache_path)
+    assert cold["violations"] == plain["violations"] == warm["violations"]
+    # The NUL byte marks image.dat as binary, so it is skipped unscanned
+    assert _findings(plain) == [("docs/a.md", LEAK_PATTERN), ("docs/a_copy.md", LEAK_PATTERN)]
+
+
+def test_git_mode_matches_working_tree_scan(leak_tree):
+    working = vpl.verify_public_mirror(leak_tree)
+    tracked = vpl.verify_public_mirror(leak_tree, git_mode=True)
+    assert _findings(tracked) == _findings(working)
+    assert tracked["files_skipped"] == 1
+
+
+def test_mmap_scan_matches_decoded_scan(leak_tree):
+    decoded = vpl.verify_public_mirror(leak_tree)
+    mapped = vpl.verify_public_mirror(leak_tree, mmap_threshold=1)
+    assert mapped["violations"] == decoded["violations"]
+
+
+def test_profile_and_sarif_match_report(leak_tree):
+    profile = vpl.ScanProfile()
+    profiled = vpl.verify_public_mirror(leak_tree, profile=profile)
+    assert profiled["violations"] == vpl.verify_public_mirror(leak_tree)["violations"]
+    assert profile.to_dict()["files_scanned"] >= 3
+
+    results = vpl.leakage_sarif(profiled["violations"])["runs"][0]["results"]
+    assert sorted(r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] for r in results) == [
+        "docs/a.md", "docs/a_copy.md",
+    ]
+
+
+def test_findall_capped_matches_findall_prefix():
+    for pattern in (vpl.PRIVATE_PATTERNS[2][1], vpl.PRIVATE_PATTERNS[8][1]):
+        text = " ".join(["x", LEAK.lower(), LEAK.upper(), "apikey = " + "A" * 20] * 5)
+        assert vpl.findall_capped(pattern, text) == pattern.findall(text)[: vpl.MATCH_CAP]
+
+
+def test_git_mode_max_size_skips_without_reading(leak_tree):
+    (leak_tree / "docs" / "big.md").write_text(LEAK + "\n" + "x" * 4096)
+    commit_all(leak_tree, "big")
+    result = vpl.verify_public_mirror(leak_tree, git_mode=True, max_size=1024)
+    assert "docs/big.md" not in {v["file"] for v in result["violations"]}
+    assert result["files_skipped"] == 2
+
+
+def test_history_max_size_skips_without_recording(git_repo, tmp_path):
+    (git_repo / "big.md").write_text(LEAK + "\n" + "x" * 4096)
+    (git_repo / "small.md").write_text("clean\n")
+    commit_all(git_repo, "blobs")
+    checkpoint = tmp_path / "history.ckpt"
+
+    capped = vpl.verify_history(git_repo, checkpoint_path=checkpoint, max_size=1024)
+    assert (capped["blobs_scanned"], capped["blobs_skipped"], capped["blobs_pending"]) == (1, 1, 0)
+    assert capped["status"] == "PASS"
+
+    # Skipped blobs are not checkpointed, so an uncapped run still scans them
+    full = vpl.verify_history(git_repo, checkpoint_path=checkpoint)
+    assert full["blobs_scanned"] == 1
+    assert [v["file"] for v in full["violations"]] == ["big.md"]
+
+
+def test_history_attributes_findings_to_introducing_commit(git_repo):
+    (git_repo / "leak.md").write_text(f"{LEAK}\n")
+    introduced = commit_all(git_repo, "add leak")
+    (git_repo / "leak.md").rename(git_repo / "moved.md")
+    commit_all(git_repo, "rename")
+    (git_repo / "moved.md").unlink()
+    (git_repo / "clean.md").write_text("clean\n")
+    commit_all(git_repo, "remove leak")
+
+    result = vpl.verify_history(git_repo)
+    assert result["status"] == "FAIL"
+    assert result["commits_scanned"] == 3
+    # The rename reuses the blob, so it is scanned and reported once
+    assert [(v["file"], v["commit"]) for v in result["violations"]] == [("leak.md", introduced)]
+    assert vpl.verify_history(git_repo, jobs=2)["violations"] == result["violations"]
+
+
+def test_history_checkpoint_resumes(git_repo, tmp_path):
+    for i in range(5):
+        (git_repo / f"f{i}.md").write_text(f"file {i} {LEAK if i == 3 else ''}\n")
+        commit_all(git_repo, f"commit {i}")
+    full = vpl.verify_history(git_repo)
+    checkpoint = tmp_path / "history.ckpt"
+
+    first = vpl.verify_history(git_repo, checkpoint_path=checkpoint, max_blobs=2)
+    assert first["blobs_scanned"] == 2
+    assert first["blobs_pending"] == 3
+    assert first["status"] in ("INCOMPLETE", "FAIL")
+
+    second = vpl.verify_history(git_repo, checkpoint_path=checkpoint)
+    assert second["blobs_scanned"] == 3
+    assert second["blobs_pending"] == 0
+    assert second["violations"] == full["violations"]
+
+    # A completed checkpoint scans nothing new
+    third = vpl.verify_history(git_repo, checkpoint_path=checkpoint)
+    assert third["blobs_scanned"] == 0
+    assert third["violations"] == full["violations"]
+
+
+def test_history_checkpoint_is_append_only_jsonl(git_repo, tmp_path, monkeypatch):
+    for i in range(4):
+        (git_repo / f"f{i}.md").write_text(f"file {i} {LEAK if i == 1 else ''}\n")
+    commit_all(git_repo, "files")
+    full = vpl.verify_history(git_repo)
+    checkpoint = tmp_path / "history.ckpt"
+
+    appended = []
+    real_append = vpl._append_checkpoint
+
+    def counting_append(f, blobs, results):
+        appended.append(len(blobs))
+        real_append(f, blobs, results)
+
+    monkeypatch.setattr(vpl, "_append_checkpoint", counting_append)
+    # A one-byte budget puts every blob in a batch of its own
+    vpl.verify_history(git_repo, checkpoint_path=checkpoint, max_blobs=2, batch_bytes=1)
+    assert appended == [1, 1]
+    head = checkpoint.read_bytes()
+    assert len(head.splitlines()) == 3  # header and one line per blob
+
+    # Simulate a crash mid-write: the torn line is dropped, earlier lines are kept
+    checkpoint.write_bytes(head + b'{"blob": "trunc')
+    resumed = vpl.verify_history(git_repo, checkpoint_path=checkpoint, batch_bytes=1)
+    assert resumed["blobs_scanned"] == 2
+    assert resumed["violations"] == full["violations"]
+    data = checkpoint.read_bytes()
+    assert data.startswith(head)
+    blobs = [json.loads(line)["blob"] for line in data.splitlines()[1:]]
+    assert len(blobs) == len(set(blobs)) == 4
+
+
+def test_history_checkpoint_is_void_after_rule_change(git_repo, tmp_path, monkeypatch):
+    (git_repo / "a.md").write_text("clean\n")
+    commit_all(git_repo, "a")
+    checkpoint = tmp_path / "history.ckpt"
+    vpl.verify_history(git_repo, checkpoint_path=checkpoint)
+
+    monkeypatch.setattr(vpl, "SCANNER_VERSION", vpl.SCANNER_VERSION + 1)
+    assert vpl.verify_history(git_repo, checkpoint_path=checkpoint)["blobs_scanned"] == 1
+
+
+def test_history_missing_blob_is_not_checkpointed(git_repo, tmp_path, monkeypatch):
+    from git_objects import BlobIntroduction
+
+    (git_repo / "a.md").write_text("clean\n")
+    commit = commit_all(git_repo, "a")
+    real_iter = vpl.iter_history_blobs
+
+    def with_missing_blob(root):
+        yield from real_iter(root)
+        yield BlobIntroduction(commit, "gone.md", "0" * 40)
+
+    monkeypatch.setattr(vpl, "iter_history_blobs", with_missing_blob)
+    checkpoint = tmp_path / "history.ckpt"
+    result = vpl.verify_history(git_repo, checkpoint_path=checkpoint)
+    assert (result["blobs_scanned"], result["blobs_missing"], result["blobs_pending"]) == (1, 1, 0)
+    assert result["status"] == "INCOMPLETE"
+    assert "0" * 40 not in checkpoint.read_text()
+    # The missing blob is retried, not replayed as clean
+    assert vpl.verify_history(git_repo, checkpoint_path=checkpoint)["status"] == "INCOMPLETE"
+
+
+def test_history_pool_is_shut_down_when_checkpoint_fails(git_repo, tmp_path, monkeypatch):
+    import concurrent.futures
+
+    for i in range(2):
+        (git_repo / f"f{i}.md").write_text(f"{i}\n")
+    commit_all(git_repo, "files")
+    events = []
+
+    class TrackingPool(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            events.append("start")
+
+        def shutdown(self, *args, **kwargs):
+            events.append("shutdown")
+            super().shutdown(*args, **kwargs)
+
+    def fail_open(*args):
+        raise OSError("read-only")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", TrackingPool)
+    monkeypatch.setattr(vpl, "_open_checkpoint", fail_open)
+    with pytest.raises(OSError):
+        vpl.verify_history(git_repo, jobs=2, checkpoint_path=tmp_path / "history.ckpt")
+    assert events.count("start") == events.count("shutdown")
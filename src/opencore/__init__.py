@@ -5,13 +5,24 @@ One-way export: SSID -> OpenCore (never reverse).
 """
 from __future__ import annotations
 
-import hashlib
 import json
+import os
+import subprocess
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
+from .archive import DeterministicTarWriter
+from .cache import ExportCache
+from .merkle import MerkleTree
+from .policy import PathPolicy
+from .registry import ExportRegistry
+from .sanitize import hash_sanitized_file, iter_file_chunks, iter_sanitized
+from .store import ManifestStore
+
 
 __version__ = "1.0.0"
 
@@ -68,7 +79,7 @@ class ExportManifest:
     export_path: str
     content_hash: str
     exported_at: str
-    status: str = "EXPORTED"  # EXPORTED, VERIFIED, REVOKED
+    status: str = "EXPORTED"  # EXPORTED, VERIFIED, SUPERSEDED, REVOKED
 
 
 class OpenCoreCore:
@@ -91,10 +102,49 @@ class OpenCoreCore:
         "internal",
     }
 
-    def __init__(self, core_root: str = "..") -> None:
+    def __init__(
+        self,
+        core_root: str = "..",
+        cache_path: Optional[str] = None,
+        cache_max_entries: int = 100_000,
+        registry_path: Optional[str] = None,
+    ) -> None:
         self._core_root = Path(core_root)
-        self._exports: Dict[str, ExportManifest] = {}
-        self._manifests: List[Dict[str, Any]] = []
+        self._store = ManifestStore()
+        # Merkle snapshots of export_tree batches, keyed by root hash
+        self._snapshots: Dict[str, MerkleTree] = {}
+        self._policy = PathPolicy(self.ALLOWED_EXPORT_PATHS, self.EXCLUDED_PATHS)
+        # Skip cache for unchanged sources; disabled unless a path is given
+        self._cache: Optional[ExportCache] = (
+            ExportCache(cache_path, cache_max_entries) if cache_path else None
+        )
+        # Durable registry; existing manifests are loaded back on startup
+        self._registry: Optional[ExportRegistry] = None
+        if registry_path:
+            self._registry = ExportRegistry(registry_path)
+            for row in self._registry.iter_rows():
+                manifest = ExportManifest(
+                    manifest_id=row["manifest_id"],
+                    source_repo=row["source_repo"],
+                    export_path=row["dest_path"],
+                    content_hash=row["content_hash"],
+                    exported_at=row["exported_at"],
+                    status=row["status"],
+                )
+                self._store.add(manifest, row["source_path"], row["dest_path"])
+
+    def close(self) -> None:
+        """Flush the skip cache and close the durable registry, if configured."""
+        self.save_cache()
+        if self._registry is not None:
+            self._registry.close()
+            self._registry = None
+
+    def export_registry_json(self, json_path: str) -> int:
+        """Regenerate the JSON export registry from the durable registry."""
+        if self._registry is None:
+            raise RuntimeError("No registry_path configured")
+        return self._registry.export_json(json_path)
 
     def list_exportable(self) -> List[Dict[str, Any]]:
         """List content eligible for export."""
@@ -111,6 +161,10 @@ class OpenCoreCore:
 
     def export_content(self, source_path: str, dest_path: str) -> Optional[ExportManifest]:
         """Export content from core to OpenCore."""
+        return self._export_file(source_path, dest_path)
+
+    def _export_file(self, source_path: str, dest_path: str, persist: bool = True) -> Optional[ExportManifest]:
+        """Sanitize, hash and register one source file (cache-aware)."""
         if not self._is_allowed_path(source_path):
             return None
 
@@ -118,11 +172,398 @@ class OpenCoreCore:
         if not source.exists():
             return None
 
-        content = self._read_and_sanitize(source)
-        if content is None:
+        stat = source.stat()
+        if self._cache is not None:
+            cached = self._cache.get(source, stat)
+            if cached is not None:
+                return self._register_export(source_path, dest_path, cached["content_hash"], persist)
+
+        # Streamed in fixed-size chunks; the file is never held in memory whole
+        digest = hash_sanitized_file(source)
+        if digest is None:
             return None
 
-        content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
+        content_hash = digest[:16]
+        manifest = self._register_export(source_path, dest_path, content_hash, persist)
+        if self._cache is not None:
+            self._cache.put(source, stat, content_hash, manifest.manifest_id)
+        return manifest
+
+    def export_changes(
+        self,
+        changes: Union[str, Iterable[Tuple[str, ...]]],
+        dest_root: str = "",
+    ) -> Dict[str, Any]:
+        """Export only what a change list touched.
+
+        ``changes`` is either raw ``git diff --name-status`` output (with or
+        without ``-z``) or an iterable of ``(status, path)`` /
+        ``(status, old_path, new_path)`` tuples. Added, modified and
+        type-changed paths are exported; deleted paths have their manifests
+        revoked; renames do both. Earlier manifests of a re-exported source
+        are marked SUPERSEDED. Paths outside the export policy are skipped.
+        """
+        started = time.perf_counter()
+        entries = _parse_name_status(changes) if isinstance(changes, str) else list(changes)
+
+        to_export: List[str] = []
+        to_revoke: List[str] = []
+        for entry in entries:
+            kind = entry[0][:1]
+            if kind in ("A", "M", "T"):
+                to_export.append(entry[1])
+            elif kind == "D":
+                to_revoke.append(entry[1])
+            elif kind == "R":
+                to_revoke.append(entry[1])
+                to_export.append(entry[2])
+            elif kind == "C":
+                to_export.append(entry[2])
+
+        revoked: List[str] = []
+        for source_path in to_revoke:
+            for manifest_id in self._store.ids_for_source(source_path):
+                manifest = self._store.get(manifest_id)
+                if manifest is not None and manifest.status != "REVOKED":
+                    self._store.set_status(manifest_id, "REVOKED")
+                    revoked.append(manifest_id)
+        if self._registry is not None and revoked:
+            self._registry.set_status_many(revoked, "REVOKED")
+
+        exported: List[ExportManifest] = []
+        persisted: List[Tuple[ExportManifest, str, str]] = []
+        skipped: List[str] = []
+        for source_path in to_export:
+            dest_path = f"{dest_root.rstrip('/')}/{source_path}" if dest_root else source_path
+            manifest = self._export_file(source_path, dest_path, persist=False)
+            if manifest is None:
+                skipped.append(source_path)
+                continue
+            exported.append(manifest)
+            persisted.append((manifest, source_path, dest_path))
+        self._persist(persisted)
+        self.save_cache()
+
+        # The new manifest replaces every earlier export of the same source
+        superseded: List[str] = []
+        for manifest, source_path, _ in persisted:
+            for manifest_id in self._store.ids_for_source(source_path):
+                previous = self._store.get(manifest_id)
+                if manifest_id == manifest.manifest_id or previous is None:
+                    continue
+                if previous.status not in ("REVOKED", "SUPERSEDED"):
+                    self._store.set_status(manifest_id, "SUPERSEDED")
+                    superseded.append(manifest_id)
+        if self._registry is not None and superseded:
+            self._registry.set_status_many(superseded, "SUPERSEDED")
+
+        return {
+            "changes": len(entries),
+            "exported": exported,
+            "revoked": revoked,
+            "superseded": superseded,
+            "skipped": skipped,
+            "elapsed_seconds": time.perf_counter() - started,
+        }
+
+    def export_git_diff(
+        self,
+        base: str,
+        head: Optional[str] = None,
+        dest_root: str = "",
+    ) -> Dict[str, Any]:
+        """Incrementally export the changes between two commits of the core repo.
+
+        With ``head`` omitted, ``base`` is compared to the working tree, which
+        is what ``export_content`` reads from. Paths are reported relative to
+        ``core_root`` (``--relative``), so a core root below the repository
+        top level works and changes outside it are ignored.
+
+        Files are always read from the working tree, so with ``head`` the
+        checkout must be at ``head`` with no uncommitted changes to the paths
+        being exported; otherwise ValueError is raised and nothing is exported.
+        """
+        def git(*args: str) -> str:
+            return subprocess.run(
+                ["git", *args], cwd=str(self._core_root), capture_output=True, text=True, check=True
+            ).stdout
+
+        cmd = ["diff", "--relative", "--name-status", "-z", base]
+        if head is not None:
+            cmd.append(head)
+        entries = _parse_name_status(git(*cmd))
+        if head is not None:
+            if git("rev-parse", "--verify", f"{head}^{{commit}}") != git("rev-parse", "--verify", "HEAD^{commit}"):
+                raise ValueError(f"Working tree is not at {head}; check it out before exporting {base}..{head}")
+            exporting = {entry[-1] for entry in entries if entry[0][:1] != "D"}
+            dirty = sorted(exporting.intersection(git("diff", "--relative", "--name-only", "-z", "HEAD").split("\0")))
+            if dirty:
+                raise ValueError(f"Uncommitted changes to {len(dirty)} exported path(s), e.g. {dirty[0]}")
+        return self.export_changes(entries, dest_root)
+
+    def snapshot(self, snapshot_root: str) -> Optional[MerkleTree]:
+        """Return the Merkle snapshot recorded by an ``export_tree`` batch."""
+        return self._snapshots.get(snapshot_root)
+
+    def add_snapshot(self, tree: MerkleTree) -> str:
+        """Register a previously saved snapshot (see ``MerkleTree.from_dict``)."""
+        self._snapshots[tree.root] = tree
+        return tree.root
+
+    def verify_snapshot(
+        self,
+        snapshot_root: str,
+        source_paths: List[str],
+        workers: int = 4,
+    ) -> Dict[str, Any]:
+        """Re-hash a subset of source files and prove them against a snapshot.
+
+        Only the listed files are read; each is checked with an O(log n)
+        inclusion proof instead of rebuilding the whole tree.
+        """
+        tree = self._snapshots.get(snapshot_root)
+        if tree is None:
+            return {"verified": False, "status": "NOT_FOUND", "results": {}}
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            hashed = list(executor.map(
+                _hash_sanitized_file, [str(self._core_root / p) for p in source_paths]
+            ))
+        observed = {p: (h or "") for p, (h, _, _) in zip(source_paths, hashed)}
+        results = tree.verify(observed)
+        return {
+            "verified": all(results.values()),
+            "status": "VERIFIED" if all(results.values()) else "MISMATCH",
+            "results": results,
+        }
+
+    def compare_snapshots(self, old_root: str, new_root: str) -> List[str]:
+        """Return source paths that differ between two recorded snapshots."""
+        old, new = self._snapshots.get(old_root), self._snapshots.get(new_root)
+        if old is None or new is None:
+            raise KeyError(old_root if old is None else new_root)
+        return old.diff(new)
+
+    def save_cache(self) -> bool:
+        """Persist the export skip cache. Returns False if there is nothing to write."""
+        if self._cache is None:
+            return False
+        return self._cache.save()
+
+    def export_tree(
+        self,
+        source_root: str,
+        dest_root: str,
+        workers: int = 4,
+        use_processes: bool = False,
+    ) -> Dict[str, Any]:
+        """Export every allowed file below ``source_root`` using a worker pool.
+
+        The tree is walked once; reading, sanitizing and hashing run on a
+        thread pool (or a process pool with ``use_processes``). Manifests are
+        registered in sorted source-path order so repeated runs over the same
+        tree produce the same sequence. Files that hit the skip cache are not
+        read at all, and the cache is saved when the run completes.
+        """
+        source_paths = self._walk_allowed(source_root)
+        prefix = self._source_prefix(source_root)
+
+        started = time.perf_counter()
+        results: Dict[str, Tuple[Optional[str], int, float]] = {}
+        stats: Dict[str, os.stat_result] = {}
+        pending: List[str] = []
+        for source_path in source_paths:
+            source = self._core_root / source_path
+            if self._cache is None:
+                pending.append(source_path)
+                continue
+            try:
+                stat = source.stat()
+            except OSError:
+                results[source_path] = (None, 0, 0.0)
+                continue
+            cached = self._cache.get(source, stat)
+            if cached is None:
+                stats[source_path] = stat
+                pending.append(source_path)
+            else:
+                results[source_path] = (cached["content_hash"], stat.st_size, 0.0)
+        cache_hits = len(source_paths) - len(pending)
+
+        if pending:
+            executor: Executor
+            if use_processes:
+                executor = ProcessPoolExecutor(max_workers=max(1, workers))
+            else:
+                executor = ThreadPoolExecutor(max_workers=max(1, workers))
+            with executor:
+                chunksize = max(1, len(pending) // (max(1, workers) * 4))
+                hashed = executor.map(
+                    _hash_sanitized_file,
+                    [str(self._core_root / p) for p in pending],
+                    chunksize=chunksize,
+                )
+                results.update(zip(pending, hashed))
+        elapsed = time.perf_counter() - started
+
+        manifests: List[ExportManifest] = []
+        timings: List[Dict[str, Any]] = []
+        skipped: List[str] = []
+        total_bytes = 0
+        for source_path in source_paths:
+            content_hash, size, seconds = results[source_path]
+            if content_hash is None:
+                skipped.append(source_path)
+                continue
+            relative = source_path[len(prefix):].lstrip("/") if prefix else source_path
+            dest_path = f"{dest_root.rstrip('/')}/{relative}" if dest_root else relative
+            manifest = self._register_export(source_path, dest_path, content_hash, persist=False)
+            manifests.append(manifest)
+            if source_path in stats:
+                self._cache.put(self._core_root / source_path, stats[source_path], content_hash, manifest.manifest_id)
+            timings.append({
+                "source_path": source_path,
+                "dest_path": dest_path,
+                "bytes": size,
+                "seconds": seconds,
+            })
+            total_bytes += size
+        self._persist([(m, t["source_path"], t["dest_path"]) for m, t in zip(manifests, timings)])
+        self.save_cache()
+        snapshot = MerkleTree((t["source_path"], m.content_hash) for m, t in zip(manifests, timings))
+        self._snapshots[snapshot.root] = snapshot
+
+        return {
+            "manifests": manifests,
+            "timings": timings,
+            "skipped": skipped,
+            "cache_hits": cache_hits,
+            "snapshot_root": snapshot.root,
+            "files": len(manifests),
+            "bytes": total_bytes,
+            "workers": max(1, workers),
+            "elapsed_seconds": elapsed,
+            "files_per_second": len(manifests) / elapsed if elapsed > 0 else 0.0,
+            "mb_per_second": total_bytes / (1024 * 1024) / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def export_archive(
+        self,
+        source_root: str,
+        archive_path: str,
+        dest_root: str = "",
+        compression: str = "gz",
+        spool_limit: int = 8 * 1024 * 1024,
+    ) -> Dict[str, Any]:
+        """Stream every allowed file below ``source_root`` into one archive.
+
+        Members are sorted by name with fixed metadata, so the same tree
+        always yields the same bytes. Sanitized content is hashed while it is
+        written; files up to ``spool_limit`` bytes are sanitized in memory,
+        larger ones are streamed twice (size first, then data) rather than
+        spooled to disk. A ``<archive>.manifest.json`` sidecar lists each
+        member with its hash and offsets in the uncompressed tar stream.
+        """
+        started = time.perf_counter()
+        prefix = self._source_prefix(source_root)
+        members: List[Tuple[str, str]] = []
+        for source_path in self._walk_allowed(source_root):
+            relative = source_path[len(prefix):].lstrip("/") if prefix else source_path
+            members.append((f"{dest_root.rstrip('/')}/{relative}" if dest_root else relative, source_path))
+        members.sort()
+
+        writer = DeterministicTarWriter(archive_path, compression)
+        entries: List[Dict[str, Any]] = []
+        persisted: List[Tuple[ExportManifest, str, str]] = []
+        total_bytes = 0
+        try:
+            for dest_path, source_path in members:
+                source = self._core_root / source_path
+                if source.stat().st_size <= spool_limit:
+                    data = self._read_and_sanitize(source)
+                    if data is None:
+                        continue
+                    encoded = data.encode()
+                    member = writer.add(dest_path, len(encoded), [encoded])
+                else:
+                    size = sum(len(piece) for piece in _iter_sanitized_bytes(source))
+                    member = writer.add(dest_path, size, _iter_sanitized_bytes(source))
+                manifest = self._register_export(source_path, dest_path, member["sha256"][:16], persist=False)
+                member["source_path"] = source_path
+                member["manifest_id"] = manifest.manifest_id
+                entries.append(member)
+                persisted.append((manifest, source_path, dest_path))
+                total_bytes += member["size"]
+            archive_sha256 = writer.close()
+        except BaseException:
+            writer.abort()
+            Path(archive_path).unlink(missing_ok=True)
+            raise
+        self._persist(persisted)
+
+        sidecar_path = f"{archive_path}.manifest.json"
+        with open(sidecar_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "archive": Path(archive_path).name,
+                "archive_sha256": archive_sha256,
+                "compression": compression,
+                "tar_format": "gnu",
+                "offsets": "uncompressed tar stream",
+                "members": entries,
+            }, f, indent=2)
+            f.write("\n")
+
+        elapsed = time.perf_counter() - started
+        return {
+            "archive": archive_path,
+            "sidecar": sidecar_path,
+            "archive_sha256": archive_sha256,
+            "members": entries,
+            "files": len(entries),
+            "bytes": total_bytes,
+            "elapsed_seconds": elapsed,
+            "mb_per_second": total_bytes / (1024 * 1024) / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def _source_prefix(self, source_root: str) -> str:
+        """Core-relative POSIX form of ``source_root`` as ``_walk_allowed`` reports it.
+
+        ``"./schemas"``, ``"schemas/"`` and ``"schemas"`` all give ``"schemas"``;
+        the core root itself gives ``""``.
+        """
+        rel = (self._core_root / source_root.strip("/")).relative_to(self._core_root).as_posix()
+        return "" if rel == "." else rel
+
+    def _walk_allowed(self, source_root: str) -> List[str]:
+        """Return sorted core-relative paths of allowed files below ``source_root``."""
+        base = self._core_root / source_root.strip("/")
+        if base.is_file():
+            rel = base.relative_to(self._core_root).as_posix()
+            return [rel] if self._is_allowed_path(rel) else []
+
+        paths: List[str] = []
+        for dirpath, dirnames, filenames in os.walk(base):
+            rel_dir = Path(dirpath).relative_to(self._core_root).as_posix()
+            rel_dir = "" if rel_dir == "." else rel_dir
+            # Only descend into directories that can hold allowed files
+            dirnames[:] = [
+                d for d in dirnames
+                if self._policy.may_contain_allowed(f"{rel_dir}/{d}")
+            ]
+            for name in filenames:
+                rel = f"{rel_dir}/{name}".lstrip("/")
+                if self._is_allowed_path(rel):
+                    paths.append(rel)
+        paths.sort()
+        return paths
+
+    def _register_export(
+        self,
+        source_path: str,
+        dest_path: str,
+        content_hash: str,
+        persist: bool = True,
+    ) -> ExportManifest:
+        """Record a manifest for an already sanitized and hashed source file."""
         manifest_id = f"{source_path.replace('/', '-')}_{content_hash}"
 
         manifest = ExportManifest(
@@ -132,65 +573,153 @@ class OpenCoreCore:
             content_hash=content_hash,
             exported_at=datetime.now(timezone.utc).isoformat(),
         )
-        self._exports[manifest_id] = manifest
-        self._manifests.append({
-            "manifest_id": manifest_id,
-            "source_path": source_path,
-            "dest_path": dest_path,
-            "content_hash": content_hash,
-            "exported_at": manifest.exported_at,
-            "status": "EXPORTED",
-        })
+        self._store.add(manifest, source_path, dest_path)
+        if persist:
+            self._persist([(manifest, source_path, dest_path)])
         return manifest
 
+    def _persist(self, entries: List[Tuple[ExportManifest, str, str]]) -> None:
+        """Write manifests to the durable registry in one transaction."""
+        if self._registry is None or not entries:
+            return
+        self._registry.upsert_many(
+            (m.manifest_id, m.source_repo, source_path, dest_path, m.content_hash, m.exported_at, m.status)
+            for m, source_path, dest_path in entries
+        )
+
     def verify_export(self, manifest_id: str) -> Dict[str, Any]:
         """Verify an export by manifest ID."""
-        manifest = self._exports.get(manifest_id)
+        manifest = self._store.get(manifest_id)
         if manifest is None:
             return {"verified": False, "status": "NOT_FOUND"}
         return {"verified": True, "status": manifest.status}
 
+    def iter_verify(
+        self,
+        mirror_root: str,
+        workers: int = 4,
+    ) -> Iterator[Dict[str, Any]]:
+        """Re-hash the current export of every destination in ``mirror_root``.
+
+        Only the newest non-superseded manifest per ``dest_path`` is checked,
+        and destinations whose newest manifest is revoked are skipped; older
+        manifests describe content the mirror has since replaced. Destination
+        files are read on a thread pool (large files through mmap) and their
+        sanitized hash compared with the manifest's ``content_hash``. Results
+        are yielded in manifest order as they complete, each with a status of
+        OK, MISMATCH or MISSING.
+        """
+        records = [
+            r for r in self._store.iter_latest(skip_status=("SUPERSEDED",))
+            if r["status"] != "REVOKED"
+        ]
+        mirror = Path(mirror_root)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            checked = executor.map(
+                _verify_mirror_file,
+                [str(mirror / r["dest_path"]) for r in records],
+                [r["content_hash"] for r in records],
+                chunksize=max(1, len(records) // (max(1, workers) * 4)),
+            )
+            for record, (status, size, observed) in zip(records, checked):
+                yield {
+                    "manifest_id": record["manifest_id"],
+                    "dest_path": record["dest_path"],
+                    "expected": record["content_hash"],
+                    "observed": observed,
+                    "bytes": size,
+                    "status": status,
+                }
+
+    def verify_all(
+        self,
+        mirror_root: str,
+        workers: int = 4,
+        on_mismatch: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        progress_every: int = 1000,
+    ) -> Dict[str, Any]:
+        """Audit the whole mirror against the manifests' content hashes.
+
+        Every MISMATCH or MISSING result is passed to ``on_mismatch`` as soon
+        as it is known (and collected in the summary when no callback is
+        given); ``on_progress`` receives the running counters every
+        ``progress_every`` files.
+        """
+        started = time.perf_counter()
+        counters: Dict[str, Any] = {"checked": 0, "ok": 0, "mismatched": 0, "missing": 0, "bytes": 0}
+        mismatches: List[Dict[str, Any]] = []
+
+        def snapshot() -> Dict[str, Any]:
+            elapsed = time.perf_counter() - started
+            return {
+                **counters,
+                "elapsed_seconds": elapsed,
+                "files_per_second": counters["checked"] / elapsed if elapsed > 0 else 0.0,
+                "mb_per_second": counters["bytes"] / (1024 * 1024) / elapsed if elapsed > 0 else 0.0,
+            }
+
+        for result in self.iter_verify(mirror_root, workers):
+            counters["checked"] += 1
+            counters["bytes"] += result["bytes"]
+            if result["status"] == "OK":
+                counters["ok"] += 1
+            else:
+                counters["missing" if result["status"] == "MISSING" else "mismatched"] += 1
+                if on_mismatch is not None:
+                    on_mismatch(result)
+                else:
+                    mismatches.append(result)
+            if on_progress is not None and counters["checked"] % max(1, progress_every) == 0:
+                on_progress(snapshot())
+
+        summary = snapshot()
+        summary["verified"] = counters["mismatched"] == 0 and counters["missing"] == 0
+        summary["workers"] = max(1, workers)
+        summary["mismatches"] = mismatches
+        return summary
+
     def revoke_export(self, manifest_id: str) -> bool:
         """Revoke an export."""
-        manifest = self._exports.get(manifest_id)
-        if manifest is None:
+        if not self._store.set_status(manifest_id, "REVOKED"):
             return False
-        manifest.status = "REVOKED"
-        for m in self._manifests:
-            if m["manifest_id"] == manifest_id:
-                m["status"] = "REVOKED"
+        if self._registry is not None:
+            self._registry.set_status(manifest_id, "REVOKED")
         return True
 
     def list_exports(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """List all exports, optionally filtered by status."""
-        if status is None:
-            return list(self._manifests)
-        return [m for m in self._manifests if m["status"] == status]
+        return list(self._store.iter_records(status))
+
+    def iter_exports(self, status: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream exports, optionally filtered by status, without building a list."""
+        return self._store.iter_records(status)
+
+    def page_exports(
+        self,
+        status: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """Return one page of exports and the cursor for the next page."""
+        items, next_cursor = self._store.page(status, cursor or 0, limit)
+        return {"items": items, "next_cursor": next_cursor}
+
+    def classify_paths(self, paths: List[str]) -> List[bool]:
+        """Return the export decision for each path, in input order."""
+        return self._policy.classify(paths)
 
     def _is_allowed_path(self, path: str) -> bool:
         """Check if a path is allowed for export."""
-        for excluded in self.EXCLUDED_PATHS:
-            if path.startswith(excluded):
-                return False
-        for allowed in self.ALLOWED_EXPORT_PATHS:
-            if path.startswith(allowed):
-                return True
-        return False
+        return self._policy.is_allowed(path)
 
     def _read_and_sanitize(self, path: Path) -> Optional[str]:
         """Read a file and sanitize private content."""
         try:
-            content = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            try:
-                content = path.read_bytes().decode("utf-8", errors="replace")
-            except Exception:
-                return None
-        # Sanitize: remove absolute Windows paths
-        import re
-        sanitized = re.sub(r'C:\\Users\\[^\\]+\\SSID-Workspace\\[^\\]+', '[REDACTED_WORKSPACE]', content)
-        sanitized = re.sub(r'C:\\Users\\[^\\]+\\Documents\\Github\\[^\\]+', '[REDACTED_DOCS]', sanitized)
-        return sanitized
+            with path.open("rb") as f:
+                return "".join(iter_sanitized(iter_file_chunks(f)))
+        except OSError:
+            return None
 
     def validate_root_24(self) -> Dict[str, Any]:
         """Validate that all 24 roots exist with required files."""
@@ -207,3 +736,60 @@ class OpenCoreCore:
                 results["valid"] = False
                 results["errors"].append(f"{root}: {status}")
         return results
+
+
+def _parse_name_status(output: str) -> List[Tuple[str, ...]]:
+    """Parse ``git diff --name-status`` output into (status, path[, new_path]) tuples."""
+    if "\0" not in output:
+        return [tuple(line.split("\t")) for line in output.splitlines() if line.strip()]
+    entries: List[Tuple[str, ...]] = []
+    tokens = output.split("\0")
+    i = 0
+    while i < len(tokens) and tokens[i]:
+        status = tokens[i]
+        if status[:1] in ("R", "C"):
+            entries.append((status, tokens[i + 1], tokens[i + 2]))
+            i += 3
+        else:
+            entries.append((status, tokens[i + 1]))
+            i += 2
+    return entries
+
+
+def _iter_sanitized_bytes(path: Path) -> Iterator[bytes]:
+    """Stream a file's sanitized content as UTF-8 bytes."""
+    with path.open("rb") as f:
+        for piece in iter_sanitized(iter_file_chunks(f)):
+            yield piece.encode()
+
+
+def _verify_mirror_file(path: str, expected: str) -> Tuple[str, int, Optional[str]]:
+    """Pool worker: return (status, bytes, observed_hash) for one mirrored file."""
+    target = Path(path)
+    try:
+        size = target.stat().st_size
+    except OSError:
+        return "MISSING", 0, None
+    digest = hash_sanitized_file(target)
+    if digest is None:
+        return "MISSING", 0, None
+    observed = digest[:16]
+    return ("OK" if observed == expected else "MISMATCH"), size, observed
+
+
+def _hash_sanitized_file(path: str) -> Tuple[Optional[str], int, float]:
+    """Pool worker: return (content_hash, source_bytes, seconds) for one file.
+
+    Module-level so it can be pickled for ``ProcessPoolExecutor``.
+    """
+    started = time.perf_counter()
+    source = Path(path)
+    digest = hash_sanitized_file(source)
+    if digest is None:
+        return None, 0, time.perf_counter() - started
+    content_hash = digest[:16]
+    try:
+        size = source.stat().st_size
+    except OSError:
+        size = 0
+    return content_hash, size, time.perf_counter() - started
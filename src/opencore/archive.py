@@ -0,0 +1,124 @@
+"""OpenCore export archives — deterministic, single-pass tar.gz / tar.xz output.
+
+Members are written straight into the compressor: tar headers come from
+``tarfile.TarInfo`` with fixed mtime, owner and mode, member data is hashed as
+it is written, and no temporary files are created. Identical input trees
+produce byte-identical archives.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import lzma
+import tarfile
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Union
+
+
+COMPRESSIONS = ("gz", "xz")
+
+
+class _HashingWriter:
+    """Pass-through writer that hashes the compressed archive bytes."""
+
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        return self._raw.write(data)
+
+    def flush(self) -> None:
+        self._raw.flush()
+
+
+class DeterministicTarWriter:
+    """Streaming tar writer with reproducible headers.
+
+    Offsets reported by ``add`` are positions in the uncompressed tar stream.
+    """
+
+    def __init__(
+        self,
+        archive_path: Union[str, Path],
+        compression: str = "gz",
+        mtime: int = 0,
+    ) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        self._raw = open(archive_path, "wb")
+        self._hashing = _HashingWriter(self._raw)
+        self._stream: BinaryIO
+        if compression == "gz":
+            # Fixed gzip header mtime and no embedded filename
+            self._stream = gzip.GzipFile(filename="", mode="wb", fileobj=self._hashing, mtime=0)
+        else:
+            self._stream = lzma.LZMAFile(self._hashing, "wb", format=lzma.FORMAT_XZ)
+        self._mtime = mtime
+        self._offset = 0
+        self.archive_sha256 = ""
+
+    def add(self, name: str, size: int, pieces: Iterable[bytes]) -> Dict[str, Any]:
+        """Write one regular-file member of exactly ``size`` bytes.
+
+        Returns the member's sha256, size and header/data offsets.
+        """
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = self._mtime
+        info.mode = 0o644
+        info.uid = info.gid = 0
+        info.uname = info.gname = ""
+        header = info.tobuf(tarfile.GNU_FORMAT, "utf-8", "surrogateescape")
+        header_offset = self._offset
+        self._write(header)
+        data_offset = self._offset
+
+        h = hashlib.sha256()
+        written = 0
+        for piece in pieces:
+            h.update(piece)
+            written += len(piece)
+            if written > size:
+                raise ValueError(f"{name}: content grew beyond {size} bytes while archiving")
+            self._write(piece)
+        if written != size:
+            raise ValueError(f"{name}: expected {size} bytes, got {written}")
+        remainder = size % tarfile.BLOCKSIZE
+        if remainder:
+            self._write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+
+        return {
+            "name": name,
+            "size": size,
+            "sha256": h.hexdigest(),
+            "header_offset": header_offset,
+            "data_offset": data_offset,
+        }
+
+    def close(self) -> str:
+        """Write the end-of-archive marker and return the archive's sha256."""
+        if self._raw.closed:
+            return self.archive_sha256
+        try:
+            self._write(tarfile.NUL * (tarfile.BLOCKSIZE * 2))
+            remainder = self._offset % tarfile.RECORDSIZE
+            if remainder:
+                self._write(tarfile.NUL * (tarfile.RECORDSIZE - remainder))
+            self._stream.close()
+        finally:
+            self._raw.close()
+        self.archive_sha256 = self._hashing.sha256.hexdigest()
+        return self.archive_sha256
+
+    def abort(self) -> None:
+        """Close the underlying file without finishing the archive."""
+        try:
+            self._stream.close()
+        finally:
+            self._raw.close()
+
+    def _write(self, data: bytes) -> None:
+        self._stream.write(data)
+        self._offset += len(data)
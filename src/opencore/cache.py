@@ -0,0 +1,99 @@
+"""OpenCore export cache — skip unchanged files on repeated exports.
+
+Entries are keyed by (path, size, mtime_ns, sanitizer rules hash) and hold the
+sanitized content hash and manifest id of the last export. A hit means the
+file can be re-registered without reading or sanitizing it again.
+"""
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .sanitize import RULES_HASH
+
+
+class ExportCache:
+    """Size-bounded LRU cache persisted as a JSON document."""
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: int = 100_000,
+        rules_hash: str = RULES_HASH,
+    ) -> None:
+        self._path = Path(path) if path is not None else None
+        self._max_entries = max(1, max_entries)
+        self._rules_hash = rules_hash
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if self._path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, source: Path, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``source`` if size, mtime and rules match."""
+        key = os.path.abspath(source)
+        entry = self._entries.get(key)
+        if (
+            entry is None
+            or entry["size"] != stat.st_size
+            or entry["mtime_ns"] != stat.st_mtime_ns
+            or entry["rules_hash"] != self._rules_hash
+        ):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, source: Path, stat: os.stat_result, content_hash: str, manifest_id: str) -> None:
+        """Record the export result for ``source``, evicting the oldest entries if full."""
+        key = os.path.abspath(source)
+        self._entries[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "rules_hash": self._rules_hash,
+            "content_hash": content_hash,
+            "manifest_id": manifest_id,
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def save(self) -> bool:
+        """Write the cache to disk atomically. Returns False if nothing was written."""
+        if self._path is None or not self._dirty:
+            return False
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": self.VERSION,
+                "rules_hash": self._rules_hash,
+                "entries": list(self._entries.items()),
+            }, f)
+        os.replace(tmp, self._path)
+        self._dirty = False
+        return True
+
+    def _load(self) -> None:
+        """Load persisted entries; a missing, corrupt or stale file starts empty."""
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != self.VERSION or data.get("rules_hash") != self._rules_hash:
+            return
+        for key, entry in data.get("entries", [])[-self._max_entries:]:
+            self._entries[key] = entry
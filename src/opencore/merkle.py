@@ -0,0 +1,129 @@
+"""OpenCore export snapshots — Merkle trees over sanitized file hashes.
+
+Leaves are (path, content_hash) pairs sorted by path. A subset of k files is
+verified against the root with k inclusion proofs of O(log n) hashes each, and
+two snapshots are compared by descending only into subtrees whose hashes
+differ.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+def leaf_hash(path: str, content_hash: str) -> bytes:
+    """Hash one (path, content_hash) leaf; domain-separated from inner nodes."""
+    return hashlib.sha256(b"\x00" + path.encode() + b"\x00" + content_hash.encode()).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Hash two child nodes into their parent."""
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+class MerkleTree:
+    """Merkle tree over sorted (path, content_hash) leaves.
+
+    An unpaired node at the end of a level is promoted unchanged.
+    """
+
+    def __init__(self, leaves: Iterable[Tuple[str, str]]) -> None:
+        self.leaves: List[Tuple[str, str]] = sorted(dict(leaves).items())
+        self._index = {path: i for i, (path, _) in enumerate(self.leaves)}
+        level = [leaf_hash(path, content_hash) for path, content_hash in self.leaves]
+        self._levels: List[List[bytes]] = [level]
+        while len(level) > 1:
+            level = [
+                node_hash(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ]
+            self._levels.append(level)
+
+    def __len__(self) -> int:
+        return len(self.leaves)
+
+    @property
+    def root(self) -> str:
+        """Hex root hash; the hash of the empty string for an empty tree."""
+        if not self.leaves:
+            return hashlib.sha256(b"").hexdigest()
+        return self._levels[-1][0].hex()
+
+    def content_hash(self, path: str) -> str:
+        """Return the recorded content hash for ``path``."""
+        return self.leaves[self._index[path]][1]
+
+    def proof(self, path: str) -> List[Tuple[str, str]]:
+        """Return the inclusion proof for ``path`` as (side, sibling hex) pairs."""
+        index = self._index[path]
+        proof: List[Tuple[str, str]] = []
+        for level in self._levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                proof.append(("L" if sibling < index else "R", level[sibling].hex()))
+            index //= 2
+        return proof
+
+    @staticmethod
+    def verify_proof(path: str, content_hash: str, proof: List[Tuple[str, str]], root: str) -> bool:
+        """Check that (path, content_hash) is included under ``root``."""
+        current = leaf_hash(path, content_hash)
+        for side, sibling in proof:
+            other = bytes.fromhex(sibling)
+            current = node_hash(other, current) if side == "L" else node_hash(current, other)
+        return current.hex() == root
+
+    def verify(self, observed: Dict[str, str]) -> Dict[str, bool]:
+        """Verify observed content hashes for a subset of paths against the root.
+
+        Costs O(k log n) hashes for k paths. Unknown paths verify as False.
+        """
+        root = self.root
+        results: Dict[str, bool] = {}
+        for path, content_hash in observed.items():
+            if path not in self._index:
+                results[path] = False
+                continue
+            results[path] = self.verify_proof(path, content_hash, self.proof(path), root)
+        return results
+
+    def diff(self, other: "MerkleTree") -> List[str]:
+        """Return sorted paths whose leaves differ between two snapshots.
+
+        Trees with the same leaf count are compared top-down, skipping equal
+        subtrees. Otherwise the recorded leaf hashes are compared directly;
+        file contents are never read in either case.
+        """
+        if self.root == other.root:
+            return []
+        if len(self.leaves) != len(other.leaves):
+            mine, theirs = dict(self.leaves), dict(other.leaves)
+            return sorted(p for p in mine.keys() | theirs.keys() if mine.get(p) != theirs.get(p))
+
+        changed: set = set()
+        stack = [(len(self._levels) - 1, 0)]
+        while stack:
+            depth, index = stack.pop()
+            if self._levels[depth][index] == other._levels[depth][index]:
+                continue
+            if depth == 0:
+                changed.add(self.leaves[index][0])
+                changed.add(other.leaves[index][0])
+                continue
+            for child in (2 * index, 2 * index + 1):
+                if child < len(self._levels[depth - 1]):
+                    stack.append((depth - 1, child))
+        mine, theirs = dict(self.leaves), dict(other.leaves)
+        return sorted(p for p in changed if mine.get(p) != theirs.get(p))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the snapshot; inner nodes are rebuilt on load."""
+        return {"root": self.root, "leaves": [list(leaf) for leaf in self.leaves]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MerkleTree":
+        """Rebuild a snapshot and check it against its recorded root."""
+        tree = cls((path, content_hash) for path, content_hash in data["leaves"])
+        if data.get("root") not in (None, tree.root):
+            raise ValueError("Snapshot root does not match its leaves")
+        return tree
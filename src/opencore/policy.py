@@ -0,0 +1,107 @@
+"""OpenCore path policy — compiled allow/deny matcher for export paths.
+
+Allowed and excluded prefixes are compiled once into a trie keyed by path
+segment, so ``public`` matches ``public/x`` but not ``publicity/x``. Excluded
+prefixes always win over allowed ones, and decisions are memoized.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class _Node:
+    __slots__ = ("children", "decision")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        # True = allowed prefix ends here, False = excluded prefix ends here
+        self.decision: Optional[bool] = None
+
+
+class PathPolicy:
+    """Segment-aware prefix matcher built from allowed and excluded path sets."""
+
+    def __init__(
+        self,
+        allowed: Iterable[str],
+        excluded: Iterable[str],
+        memo_size: int = 65536,
+    ) -> None:
+        self._root = _Node()
+        for prefix in allowed:
+            self._insert(prefix, True)
+        # Inserted last so an exclusion overrides an identical allowed prefix
+        for prefix in excluded:
+            self._insert(prefix, False)
+        self._memo: Dict[str, bool] = {}
+        self._memo_size = max(0, memo_size)
+
+    def is_allowed(self, path: str) -> bool:
+        """Return True if ``path`` lies under an allowed prefix and no excluded one."""
+        decision = self._memo.get(path)
+        if decision is None:
+            decision = self._decide(path)
+            if len(self._memo) >= self._memo_size:
+                self._memo.clear()
+            self._memo[path] = decision
+        return decision
+
+    def classify(self, paths: Iterable[str]) -> List[bool]:
+        """Return one allow decision per path, in input order."""
+        memo = self._memo
+        is_allowed = self.is_allowed
+        return [memo[p] if p in memo else is_allowed(p) for p in paths]
+
+    def may_contain_allowed(self, directory: str) -> bool:
+        """Return True if any allowed path could lie at or below ``directory``.
+
+        Used to prune directory walks before descending.
+        """
+        segments = _segments(directory)
+        if segments is None:
+            return False
+        node = self._root
+        allowed = False
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return allowed
+            if node.decision is False:
+                return False
+            if node.decision is True:
+                allowed = True
+        return True
+
+    def _decide(self, path: str) -> bool:
+        segments = _segments(path)
+        if not segments:
+            return False
+        node = self._root
+        allowed = False
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.decision is False:
+                return False
+            if node.decision is True:
+                allowed = True
+        return allowed
+
+    def _insert(self, prefix: str, decision: bool) -> None:
+        segments = _segments(prefix)
+        if not segments:
+            return
+        node = self._root
+        for segment in segments:
+            node = node.children.setdefault(segment, _Node())
+        if node.decision is not False:
+            node.decision = decision
+
+
+def _segments(path: str) -> Optional[Tuple[str, ...]]:
+    """Split a relative path into segments; None if it escapes via ``..``."""
+    parts = tuple(p for p in path.replace("\\", "/").split("/") if p and p != ".")
+    if ".." in parts:
+        return None
+    return parts
@@ -0,0 +1,147 @@
+"""OpenCore export registry — durable manifest storage on SQLite.
+
+The database runs in WAL mode so readers never block the exporter. Manifests
+are written in batched transactions and looked up through indexes on
+manifest_id and content_hash. The JSON registry document is a derived view
+that can be regenerated from the database at any time.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS manifests (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    manifest_id  TEXT NOT NULL UNIQUE,
+    source_repo  TEXT NOT NULL,
+    source_path  TEXT NOT NULL,
+    dest_path    TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    exported_at  TEXT NOT NULL,
+    status       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_manifests_content_hash ON manifests (content_hash);
+CREATE INDEX IF NOT EXISTS idx_manifests_source_path ON manifests (source_path);
+"""
+
+_UPSERT = """
+INSERT INTO manifests (manifest_id, source_repo, source_path, dest_path, content_hash, exported_at, status)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (manifest_id) DO UPDATE SET
+    source_repo = excluded.source_repo,
+    source_path = excluded.source_path,
+    dest_path = excluded.dest_path,
+    content_hash = excluded.content_hash,
+    exported_at = excluded.exported_at,
+    status = excluded.status
+"""
+
+_COLUMNS = "manifest_id, source_repo, source_path, dest_path, content_hash, exported_at, status"
+
+# Row shape accepted by upsert_many, in _UPSERT column order
+ManifestRow = Tuple[str, str, str, str, str, str, str]
+
+
+class ExportRegistry:
+    """SQLite-backed store of export manifests."""
+
+    def __init__(self, db_path: Union[str, Path]) -> None:
+        self._path = Path(db_path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path))
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ExportRegistry":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def upsert_many(self, rows: Iterable[ManifestRow]) -> int:
+        """Insert or replace manifests in a single transaction. Returns the row count."""
+        rows = list(rows)
+        if not rows:
+            return 0
+        with self._conn:
+            self._conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def set_status(self, manifest_id: str, status: str) -> bool:
+        """Update the status of one manifest. Returns False if it does not exist."""
+        with self._conn:
+            cur = self._conn.execute(
+                "UPDATE manifests SET status = ? WHERE manifest_id = ?", (status, manifest_id)
+            )
+        return cur.rowcount > 0
+
+    def set_status_many(self, manifest_ids: Iterable[str], status: str) -> int:
+        """Update the status of several manifests in one transaction."""
+        with self._conn:
+            cur = self._conn.executemany(
+                "UPDATE manifests SET status = ? WHERE manifest_id = ?",
+                [(status, manifest_id) for manifest_id in manifest_ids],
+            )
+        return cur.rowcount
+
+    def get(self, manifest_id: str) -> Optional[Dict[str, Any]]:
+        """Return one manifest row by id, or None."""
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM manifests WHERE manifest_id = ?", (manifest_id,)
+        ).fetchone()
+        return dict(row) if row is not None else None
+
+    def find_by_hash(self, content_hash: str) -> List[Dict[str, Any]]:
+        """Return all manifest rows with the given content hash."""
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM manifests WHERE content_hash = ? ORDER BY seq", (content_hash,)
+        )
+        return [dict(row) for row in rows]
+
+    def count(self) -> int:
+        """Number of manifests in the registry."""
+        return self._conn.execute("SELECT COUNT(*) FROM manifests").fetchone()[0]
+
+    def iter_rows(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream all manifest rows in insertion order."""
+        cur = self._conn.execute(f"SELECT {_COLUMNS} FROM manifests ORDER BY seq")
+        while True:
+            batch = cur.fetchmany(batch_size)
+            if not batch:
+                return
+            for row in batch:
+                yield dict(row)
+
+    def export_json(self, json_path: Union[str, Path]) -> int:
+        """Regenerate the JSON registry document from the database.
+
+        Header fields of an existing document are preserved; the per-file
+        rows are written under ``exports``. Returns the number of rows written.
+        """
+        json_path = Path(json_path)
+        document: Dict[str, Any] = {}
+        if json_path.exists():
+            try:
+                with open(json_path, encoding="utf-8") as f:
+                    document = json.load(f)
+            except json.JSONDecodeError:
+                document = {}
+        exports = list(self.iter_rows())
+        document["exports"] = exports
+        tmp = json_path.with_name(json_path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+            f.write("\n")
+        os.replace(tmp, json_path)
+        return len(exports)
@@ -0,0 +1,198 @@
+"""OpenCore sanitizer — redaction rules and bounded-memory streaming.
+
+All redaction rules are compiled once into a single alternation, so each file
+is scanned in one pass however many rules exist. Files are decoded
+incrementally and redacted in fixed-size chunks. A tail of ``overlap``
+characters is carried into the next chunk so that a private path crossing a
+chunk boundary is still redacted; the sanitized output is hashed as it is
+produced, so peak memory does not depend on the file size.
+"""
+from __future__ import annotations
+
+import codecs
+import hashlib
+import io
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+
+# (rule name, pattern, replacement) — earlier rules win at the same offset.
+# Path components are bounded at 255 characters (the Windows limit) so that no
+# match can be longer than the streaming overlap; an unbounded tail would let
+# a streamed match stop at the chunk window while the in-memory one runs on.
+REDACTION_RULES: List[Tuple[str, str, str]] = [
+    ("workspace_path", r'C:\\Users\\[^\\]{1,255}\\SSID-Workspace\\[^\\]{1,255}', "[REDACTED_WORKSPACE]"),
+    ("docs_path", r'C:\\Users\\[^\\]{1,255}\\Documents\\Github\\[^\\]{1,255}', "[REDACTED_DOCS]"),
+]
+
+# Identifies the active rule set; persisted results keyed on it go stale when
+# any rule changes.
+RULES_HASH = hashlib.sha256(json.dumps(REDACTION_RULES).encode()).hexdigest()[:16]
+
+# Bytes read per chunk
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# Characters carried across a chunk boundary; matches shorter than this are
+# redacted exactly as if the whole file had been processed at once. Every
+# rule in REDACTION_RULES is bounded well below it.
+DEFAULT_OVERLAP = 64 * 1024
+# Files at least this large are read through mmap instead of read() calls
+DEFAULT_MMAP_THRESHOLD = 64 * 1024 * 1024
+
+
+class RedactionHit(NamedTuple):
+    """One redaction: the rule that fired and its span in the decoded input."""
+    rule: str
+    start: int
+    end: int
+
+
+class RedactionEngine:
+    """All redaction rules compiled into one alternation, applied in one pass.
+
+    Each rule becomes a named group of a single regex, so the input is scanned
+    once no matter how many rules exist. Rule patterns must not define named
+    groups of their own.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, str, str]]) -> None:
+        self.rules = list(rules)
+        self._pattern = re.compile(
+            "|".join(f"(?P<r{i}>{pattern})" for i, (_, pattern, _) in enumerate(self.rules))
+        )
+        self._names = {f"r{i}": name for i, (name, _, _) in enumerate(self.rules)}
+        self._replacements = {f"r{i}": replacement for i, (_, _, replacement) in enumerate(self.rules)}
+
+    def sanitize(self, text: str) -> str:
+        """Return ``text`` with every rule match replaced."""
+        replacements = self._replacements
+        return self._pattern.sub(lambda m: replacements[m.lastgroup], text)
+
+    def redact(self, text: str) -> Tuple[str, List[RedactionHit]]:
+        """Return the sanitized text and the rule hits, with offsets into ``text``."""
+        sanitized, hits, _ = self._redact_until(text, len(text))
+        return sanitized, hits
+
+    def _redact_until(self, text: str, cut: int, base: int = 0) -> Tuple[str, List[RedactionHit], int]:
+        """Redact ``text`` up to ``cut``, extending it past a straddling match.
+
+        Returns (sanitized prefix, hits offset by ``base``, final cut).
+        """
+        pieces: List[str] = []
+        hits: List[RedactionHit] = []
+        position = 0
+        for m in self._pattern.finditer(text):
+            if m.start() >= cut:
+                break
+            group = m.lastgroup
+            pieces.append(text[position:m.start()])
+            pieces.append(self._replacements[group])
+            hits.append(RedactionHit(self._names[group], base + m.start(), base + m.end()))
+            position = m.end()
+            if position > cut:
+                cut = position
+        pieces.append(text[position:cut])
+        return "".join(pieces), hits, cut
+
+
+DEFAULT_ENGINE = RedactionEngine(REDACTION_RULES)
+
+
+def sanitize_text(text: str) -> str:
+    """Apply all redaction rules to an in-memory string."""
+    return DEFAULT_ENGINE.sanitize(text)
+
+
+def iter_file_chunks(stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield fixed-size byte chunks from a binary stream."""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_mmap_chunks(mapped: mmap.mmap, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[memoryview]:
+    """Yield zero-copy chunk views over a memory-mapped file."""
+    view = memoryview(mapped)
+    try:
+        for start in range(0, len(view), chunk_size):
+            chunk = view[start:start + chunk_size]
+            try:
+                yield chunk
+            finally:
+                chunk.release()
+    finally:
+        view.release()
+
+
+def iter_sanitized(
+    chunks: Iterable[bytes],
+    overlap: int = DEFAULT_OVERLAP,
+    engine: RedactionEngine = DEFAULT_ENGINE,
+    hits: Optional[List[RedactionHit]] = None,
+) -> Iterator[str]:
+    """Decode and sanitize a byte stream, yielding sanitized text pieces.
+
+    Decoding is UTF-8 with replacement characters and universal newlines, the
+    same as ``Path.read_text`` for valid input. If ``hits`` is given, every
+    redaction is appended to it with offsets into the decoded stream.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+    )
+    carry = ""
+    base = 0
+    for raw in chunks:
+        carry += decoder.decode(raw)
+        if len(carry) <= overlap:
+            continue
+        piece, found, cut = engine._redact_until(carry, len(carry) - overlap, base)
+        if hits is not None:
+            hits.extend(found)
+        yield piece
+        carry = carry[cut:]
+        base += cut
+    carry += decoder.decode(b"", final=True)
+    if carry:
+        piece, found, _ = engine._redact_until(carry, len(carry), base)
+        if hits is not None:
+            hits.extend(found)
+        yield piece
+
+
+def hash_sanitized_file(
+    path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    overlap: int = DEFAULT_OVERLAP,
+    engine: RedactionEngine = DEFAULT_ENGINE,
+    hits: Optional[List[RedactionHit]] = None,
+    mmap_threshold: int = DEFAULT_MMAP_THRESHOLD,
+) -> Optional[str]:
+    """Return the SHA-256 hex digest of a file's sanitized UTF-8 content.
+
+    Files of at least ``mmap_threshold`` bytes are memory-mapped. Returns None
+    if the file cannot be read.
+    """
+    h = hashlib.sha256()
+    try:
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size and size >= mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    chunks = iter_mmap_chunks(mapped, chunk_size)
+                    try:
+                        for piece in iter_sanitized(chunks, overlap, engine, hits):
+                            h.update(piece.encode())
+                    finally:
+                        # Release the views before the mapping is closed
+                        chunks.close()
+            else:
+                for piece in iter_sanitized(iter_file_chunks(f, chunk_size), overlap, engine, hits):
+                    h.update(piece.encode())
+    except (OSError, ValueError):
+        return None
+    return h.hexdigest()
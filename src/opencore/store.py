@@ -0,0 +1,198 @@
+"""OpenCore manifest store — single source of truth for export manifests.
+
+Every manifest is held once, with secondary indexes by status, source path and
+destination path. Status changes only move an id between two index buckets, so
+revocation is O(1) regardless of how many exports exist. Listing streams from
+the indexes instead of copying a full list, and filtered pages are served from
+a per-status list of insertion positions instead of a scan of every record.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from . import ExportManifest
+
+
+class ManifestStore:
+    """Indexed in-memory store of export manifests."""
+
+    def __init__(self) -> None:
+        self._manifests: Dict[str, "ExportManifest"] = {}
+        self._records: Dict[str, Dict[str, Any]] = {}
+        # Append-only insertion order; a cursor is a position in this list
+        self._order: List[str] = []
+        self._position: Dict[str, int] = {}
+        # Sorted insertion positions per status for ``page``. Ids that left
+        # a status stay behind as stale entries until the list is dropped
+        # and rebuilt; a missing list is rebuilt from the status bucket.
+        self._status_positions: Dict[str, List[int]] = {}
+        self._status_stale: Dict[str, int] = {}
+        self._by_status: Dict[str, Dict[str, None]] = {}
+        self._by_source: Dict[str, Dict[str, None]] = {}
+        self._by_dest: Dict[str, Dict[str, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, manifest_id: object) -> bool:
+        return manifest_id in self._records
+
+    def add(self, manifest: "ExportManifest", source_path: str, dest_path: str) -> None:
+        """Insert a manifest, replacing any previous record with the same id."""
+        manifest_id = manifest.manifest_id
+        previous = self._records.get(manifest_id)
+        if previous is None:
+            self._position[manifest_id] = len(self._order)
+            self._order.append(manifest_id)
+        else:
+            self._unindex(previous)
+        record = {
+            "manifest_id": manifest_id,
+            "source_path": source_path,
+            "dest_path": dest_path,
+            "content_hash": manifest.content_hash,
+            "exported_at": manifest.exported_at,
+            "status": manifest.status,
+        }
+        self._manifests[manifest_id] = manifest
+        self._records[manifest_id] = record
+        self._index(record)
+
+    def get(self, manifest_id: str) -> Optional["ExportManifest"]:
+        """Return the manifest with ``manifest_id``, or None."""
+        return self._manifests.get(manifest_id)
+
+    def set_status(self, manifest_id: str, status: str) -> bool:
+        """Change a manifest's status in O(1). Returns False if it does not exist."""
+        record = self._records.get(manifest_id)
+        if record is None:
+            return False
+        self._by_status[record["status"]].pop(manifest_id, None)
+        self._leave_status(record["status"])
+        record["status"] = status
+        self._manifests[manifest_id].status = status
+        self._by_status.setdefault(status, {})[manifest_id] = None
+        self._enter_status(manifest_id, status)
+        return True
+
+    def ids_for_source(self, source_path: str) -> List[str]:
+        """Return ids of all manifests exported from ``source_path``."""
+        return list(self._by_source.get(source_path, ()))
+
+    def ids_for_dest(self, dest_path: str) -> List[str]:
+        """Return ids of all manifests exported to ``dest_path``."""
+        return list(self._by_dest.get(dest_path, ()))
+
+    def iter_latest(self, skip_status: Iterable[str] = ()) -> Iterator[Dict[str, Any]]:
+        """Stream the newest record per destination path, in insertion order.
+
+        Manifests whose status is in ``skip_status`` are passed over when
+        picking the newest one for a destination.
+        """
+        skip = set(skip_status)
+        latest = set()
+        for bucket in self._by_dest.values():
+            for manifest_id in reversed(bucket):
+                if self._records[manifest_id]["status"] not in skip:
+                    latest.add(manifest_id)
+                    break
+        for manifest_id in self._records:
+            if manifest_id in latest:
+                yield dict(self._records[manifest_id])
+
+    def count(self, status: Optional[str] = None) -> int:
+        """Number of manifests, optionally only those with ``status``."""
+        if status is None:
+            return len(self._records)
+        return len(self._by_status.get(status, ()))
+
+    def iter_records(self, status: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream record copies, optionally filtered by status.
+
+        Unfiltered records come in insertion order; filtered records in the
+        order they entered ``status``. Statuses must not change while the
+        iterator is live; use ``page`` for read-modify sweeps.
+        """
+        ids = self._records if status is None else self._by_status.get(status, {})
+        for manifest_id in ids:
+            yield dict(self._records[manifest_id])
+
+    def page(
+        self,
+        status: Optional[str] = None,
+        cursor: int = 0,
+        limit: int = 100,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Return up to ``limit`` records in insertion order starting at ``cursor``.
+
+        The returned cursor resumes after the last record, or is None once the
+        store is exhausted. Cursors stay valid across status changes. With
+        ``status``, only positions of that status are visited.
+        """
+        items: List[Dict[str, Any]] = []
+        if status is None:
+            position = max(0, cursor)
+            order = self._order
+            while position < len(order) and len(items) < limit:
+                items.append(dict(self._records[order[position]]))
+                position += 1
+            return items, (position if position < len(order) else None)
+
+        positions = self._positions_for(status)
+        i = bisect_left(positions, max(0, cursor))
+        while i < len(positions) and len(items) < limit:
+            record = self._records[self._order[positions[i]]]
+            i += 1
+            if record["status"] == status:
+                items.append(dict(record))
+        return items, (positions[i - 1] + 1 if i < len(positions) else None)
+
+    def _positions_for(self, status: str) -> List[int]:
+        positions = self._status_positions.get(status)
+        if positions is None:
+            positions = sorted(self._position[i] for i in self._by_status.get(status, ()))
+            self._status_positions[status] = positions
+            self._status_stale[status] = 0
+        return positions
+
+    def _enter_status(self, manifest_id: str, status: str) -> None:
+        positions = self._status_positions.get(status)
+        if positions is None:
+            return
+        position = self._position[manifest_id]
+        if positions and position <= positions[-1]:
+            # Out of order (or re-entering): rebuild on the next page
+            del self._status_positions[status]
+        else:
+            positions.append(position)
+
+    def _leave_status(self, status: str) -> None:
+        positions = self._status_positions.get(status)
+        if positions is None:
+            return
+        self._status_stale[status] += 1
+        if self._status_stale[status] * 2 > len(positions):
+            del self._status_positions[status]
+
+    def _index(self, record: Dict[str, Any]) -> None:
+        manifest_id = record["manifest_id"]
+        self._by_status.setdefault(record["status"], {})[manifest_id] = None
+        self._enter_status(manifest_id, record["status"])
+        self._by_source.setdefault(record["source_path"], {})[manifest_id] = None
+        self._by_dest.setdefault(record["dest_path"], {})[manifest_id] = None
+
+    def _unindex(self, record: Dict[str, Any]) -> None:
+        manifest_id = record["manifest_id"]
+        self._leave_status(record["status"])
+        for index, key in (
+            (self._by_status, record["status"]),
+            (self._by_source, record["source_path"]),
+            (self._by_dest, record["dest_path"]),
+        ):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(manifest_id, None)
+                if not bucket:
+                    del index[key]
@@ -36,6 +36,172 @@ class TestExport:
             assert manifest is None
 
 
+class TestExportTree:
+    """Test parallel bulk tree export."""
+
+    def _make_tree(self, tmpdir):
+        schema_dir = Path(tmpdir) / "schemas"
+        (schema_dir / "nested").mkdir(parents=True)
+        (schema_dir / "b.json").write_text('{"b": 1}')
+        (schema_dir / "a.json").write_text('{"a": 1}')
+        (schema_dir / "nested" / "c.json").write_text('{"c": 1}')
+        (Path(tmpdir) / "private").mkdir()
+        (Path(tmpdir) / "private" / "x.json").write_text("{}")
+
+    def test_export_tree_deterministic_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._make_tree(tmpdir)
+            core = OpenCoreCore(tmpdir)
+            result = core.export_tree("schemas", "public/schemas", workers=3)
+            paths = [t["source_path"] for t in result["timings"]]
+            assert paths == ["schemas/a.json", "schemas/b.json", "schemas/nested/c.json"]
+            assert [m.export_path for m in result["manifests"]] == [
+                "public/schemas/a.json", "public/schemas/b.json", "public/schemas/nested/c.json",
+            ]
+            assert result["files"] == 3
+            assert result["files_per_second"] >= 0
+            assert len(core.list_exports()) == 3
+
+    def test_export_tree_matches_single_export(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._make_tree(tmpdir)
+            single = OpenCoreCore(tmpdir).export_content("schemas/a.json", "public/schemas/a.json")
+            result = OpenCoreCore(tmpdir).export_tree("", "", workers=2)
+            by_id = {m.manifest_id for m in result["manifests"]}
+            assert single.manifest_id in by_id
+            assert all(not t["source_path"].startswith("private") for t in result["timings"])
+
+    @pytest.mark.parametrize("source_root", ["./schemas", "schemas/", "/schemas/", "./schemas/"])
+    def test_export_tree_normalizes_source_root(self, source_root):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._make_tree(tmpdir)
+            result = OpenCoreCore(tmpdir).export_tree(source_root, "out", workers=2)
+            assert [m.export_path for m in result["manifests"]] == [
+                "out/a.json", "out/b.json", "out/nested/c.json",
+            ]
+
+    def test_export_tree_from_dot_root(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._make_tree(tmpdir)
+            result = OpenCoreCore(tmpdir).export_tree(".", "out", workers=2)
+            assert "out/schemas/a.json" in [m.export_path for m in result["manifests"]]
+
+
+class TestStreamingSanitizer:
+    """Test chunked sanitization."""
+
+    def test_redacts_across_chunk_boundary(self):
+        import io
+        from src.opencore.sanitize import iter_file_chunks, iter_sanitized, sanitize_text
+        text = "head " + "C:\\Users\\dev\\SSID-Workspace\\repo" + " tail\\" * 3
+        data = text.encode()
+        expected = sanitize_text(text)
+        assert "[REDACTED_WORKSPACE]" in expected
+        for chunk_size in (1, 5, 17):
+            pieces = iter_sanitized(iter_file_chunks(io.BytesIO(data), chunk_size), overlap=64)
+            assert "".join(pieces) == expected
+
+    def test_hash_matches_in_memory_sanitize(self):
+        import hashlib
+        from src.opencore.sanitize import hash_sanitized_file, sanitize_text
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "big.txt"
+            text = "C:\\Users\\a\\Documents\\Github\\b\\" + "x" * 5000
+            path.write_text(text)
+            expected = hashlib.sha256(sanitize_text(text).encode()).hexdigest()
+            assert hash_sanitized_file(path, chunk_size=100, overlap=64) == expected
+
+    def test_long_component_matches_in_memory_sanitize(self):
+        import io
+        from src.opencore.sanitize import iter_file_chunks, iter_sanitized, sanitize_text
+        # No backslash after the workspace: the tail must stop at 255 chars
+        text = "C:\\Users\\dev\\SSID-Workspace\\" + "p" * 3000 + "\nend"
+        expected = sanitize_text(text)
+        assert expected.startswith("[REDACTED_WORKSPACE]" + "p" * (3000 - 255))
+        pieces = iter_sanitized(iter_file_chunks(io.BytesIO(text.encode()), 256), overlap=1024)
+        assert "".join(pieces) == expected
+
+
+class TestRedactionEngine:
+    """Test the single-pass multi-rule redaction engine."""
+
+    def test_reports_rule_and_offsets(self):
+        from src.opencore.sanitize import RedactionEngine
+        engine = RedactionEngine([
+            ("token", r"tok_[a-z]+", "[TOKEN]"),
+            ("host", r"internal\.example\.com", "[HOST]"),
+        ])
+        text = "a tok_abc b internal.example.com c tok_z"
+        sanitized, hits = engine.redact(text)
+        assert sanitized == "a [TOKEN] b [HOST] c [TOKEN]"
+        assert [(h.rule, text[h.start:h.end]) for h in hits] == [
+            ("token", "tok_abc"), ("host", "internal.example.com"), ("token", "tok_z"),
+        ]
+        assert engine.sanitize(text) == sanitized
+
+
+class TestExportCache:
+    """Test the persistent export skip cache."""
+
+    def test_unchanged_files_skip_sanitize(self, monkeypatch):
+        import src.opencore as opencore
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir) / "schemas"
+            schema_dir.mkdir()
+            (schema_dir / "a.json").write_text('{"a": 1}')
+            cache_path = str(Path(tmpdir) / "cache" / "export_cache.json")
+
+            first = OpenCoreCore(tmpdir, cache_path=cache_path).export_tree("schemas", "public")
+            assert first["cache_hits"] == 0
+
+            def fail(*args, **kwargs):
+                raise AssertionError("cached file was re-read")
+
+            monkeypatch.setattr(opencore, "_hash_sanitized_file", fail)
+            monkeypatch.setattr(opencore, "hash_sanitized_file", fail)
+            core = OpenCoreCore(tmpdir, cache_path=cache_path)
+            second = core.export_tree("schemas", "public")
+            assert second["cache_hits"] == 1
+            assert second["manifests"][0].manifest_id == first["manifests"][0].manifest_id
+            assert core.export_content("schemas/a.json", "public/a.json") is not None
+
+    def test_eviction_bounds_size(self):
+        import os
+        from src.opencore.cache import ExportCache
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = ExportCache(max_entries=2)
+            for name in ("a", "b", "c"):
+                path = Path(tmpdir) / name
+                path.write_text(name)
+                cache.put(path, os.stat(path), name, name)
+            assert len(cache) == 2
+            assert cache.get(Path(tmpdir) / "a", os.stat(Path(tmpdir) / "a")) is None
+
+
+class TestPathPolicy:
+    """Test the compiled path-policy matcher."""
+
+    def test_prefix_must_match_whole_segments(self):
+        core = OpenCoreCore(".")
+        assert core.classify_paths([
+            "public/a.json",
+            "publicity/a.json",
+            "docs/public/guide.md",
+            "docs/publications/guide.md",
+            "README.md",
+        ]) == [True, False, True, False, True]
+
+    def test_excluded_and_escaping_paths(self):
+        from src.opencore.policy import PathPolicy
+        policy = PathPolicy({"docs", "schemas"}, {"docs/private"})
+        assert policy.is_allowed("docs/guide.md")
+        assert not policy.is_allowed("docs/private/notes.md")
+        assert not policy.is_allowed("schemas/../config/secrets/env")
+        assert policy.may_contain_allowed("docs")
+        assert not policy.may_contain_allowed("docs/private")
+        assert not policy.may_contain_allowed("src")
+
+
 class TestVerification:
     """Test export verification."""
 
@@ -57,6 +223,52 @@ class TestVerification:
         assert result["verified"] is False
 
 
+class TestVerifyAll:
+    """Test on-disk re-verification of exported mirror files."""
+
+    def test_reports_mismatch_and_missing(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir) / "schemas"
+            schema_dir.mkdir()
+            for name in ("a", "b", "c"):
+                (schema_dir / f"{name}.json").write_text(f'{{"{name}": 1}}')
+            core = OpenCoreCore(tmpdir)
+            core.export_tree("schemas", "schemas")
+            mirror = Path(tmpdir) / "mirror"
+            (mirror / "schemas").mkdir(parents=True)
+            (mirror / "schemas" / "a.json").write_text('{"a": 1}')
+            (mirror / "schemas" / "b.json").write_text('{"b": "tampered"}')
+
+            reported = []
+            summary = core.verify_all(str(mirror), workers=2, on_mismatch=reported.append)
+            assert summary["verified"] is False
+            assert (summary["ok"], summary["mismatched"], summary["missing"]) == (1, 1, 1)
+            assert {r["dest_path"]: r["status"] for r in reported} == {
+                "schemas/b.json": "MISMATCH", "schemas/c.json": "MISSING",
+            }
+
+    def test_only_newest_manifest_per_dest_is_checked(self):
+        import shutil
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir) / "schemas"
+            schema_dir.mkdir()
+            (schema_dir / "a.json").write_text('{"a": 1}')
+            (schema_dir / "b.json").write_text('{"b": 1}')
+            core = OpenCoreCore(tmpdir)
+            core.export_tree("schemas", "mirror/schemas")
+
+            (schema_dir / "a.json").write_text('{"a": 2}')
+            core.export_changes("M\tschemas/a.json\n", "mirror")
+            (schema_dir / "b.json").write_text('{"b": 2}')
+            core.export_tree("schemas", "mirror/schemas")
+            out = Path(tmpdir) / "out"
+            shutil.copytree(schema_dir, out / "mirror" / "schemas")
+
+            summary = core.verify_all(str(out))
+            assert summary["verified"] is True
+            assert (summary["checked"], summary["ok"]) == (2, 2)
+
+
 class TestRevoke:
     """Test export revocation."""
 
@@ -105,6 +317,325 @@ class TestListExports:
             assert len(revoked) == 1
 
 
+class TestManifestStore:
+    """Test indexed manifest storage and paginated listing."""
+
+    def _core_with_exports(self, tmpdir, count):
+        schema_dir = Path(tmpdir) / "schemas"
+        schema_dir.mkdir()
+        for i in range(count):
+            (schema_dir / f"s{i}.json").write_text(f'{{"i": {i}}}')
+        core = OpenCoreCore(tmpdir)
+        ids = [core.export_content(f"schemas/s{i}.json", f"public/s{i}.json").manifest_id for i in range(count)]
+        return core, ids
+
+    def test_page_exports_with_cursor(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            core, ids = self._core_with_exports(tmpdir, 5)
+            core.revoke_export(ids[1])
+            seen = []
+            cursor = None
+            while True:
+                page = core.page_exports(status="EXPORTED", cursor=cursor, limit=2)
+                seen.extend(item["manifest_id"] for item in page["items"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+            assert seen == [ids[0], ids[2], ids[3], ids[4]]
+
+    def test_revoke_updates_indexes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            core, ids = self._core_with_exports(tmpdir, 3)
+            assert core.revoke_export(ids[0])
+            assert not core.revoke_export("missing")
+            assert [m["manifest_id"] for m in core.iter_exports("REVOKED")] == [ids[0]]
+            assert len(core.list_exports("EXPORTED")) == 2
+
+    def test_filtered_pages_match_full_scan(self):
+        import random
+        from src.opencore import ExportManifest
+        from src.opencore.store import ManifestStore
+
+        def scan(store, status, cursor, limit):
+            # The plain insertion-order scan the status index replaces
+            order = store._order
+            matching = [p for p in range(cursor, len(order)) if store._records[order[p]]["status"] == status]
+            return [store._records[order[p]]["manifest_id"] for p in matching[:limit]]
+
+        rng = random.Random(5)
+        store = ManifestStore()
+        statuses = ["EXPORTED", "REVOKED", "SUPERSEDED"]
+        for step in range(400):
+            if step % 3 == 0 or not len(store):
+                manifest_id = f"m{step}"
+                store.add(ExportManifest(manifest_id, "core", f"d{step % 7}", "h", "t"), f"s{step}", f"d{step % 7}")
+            else:
+                store.set_status(rng.choice(store._order), rng.choice(statuses))
+            status = rng.choice(statuses)
+            cursor, limit = rng.randrange(len(store._order) + 1), rng.randint(1, 5)
+            items, _ = store.page(status, cursor, limit)
+            assert [r["manifest_id"] for r in items] == scan(store, status, cursor, limit)
+
+    def test_filtered_page_sweep_while_revoking(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            core, ids = self._core_with_exports(tmpdir, 7)
+            swept = []
+            cursor = None
+            while True:
+                page = core.page_exports(status="EXPORTED", cursor=cursor, limit=2)
+                for item in page["items"]:
+                    core.revoke_export(item["manifest_id"])
+                    swept.append(item["manifest_id"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+            assert swept == ids
+            assert core.list_exports("EXPORTED") == []
+
+
+class TestMerkleSnapshots:
+    """Test Merkle snapshots of export batches."""
+
+    def test_verify_subset_and_compare(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir) / "schemas"
+            schema_dir.mkdir()
+            for i in range(7):
+                (schema_dir / f"s{i}.json").write_text(f'{{"i": {i}}}')
+            core = OpenCoreCore(tmpdir)
+            before = core.export_tree("schemas", "public")["snapshot_root"]
+
+            result = core.verify_snapshot(before, ["schemas/s2.json", "schemas/s5.json"])
+            assert result["verified"] is True
+
+            (schema_dir / "s5.json").write_text('{"i": "changed"}')
+            result = core.verify_snapshot(before, ["schemas/s2.json", "schemas/s5.json"])
+            assert result["results"] == {"schemas/s2.json": True, "schemas/s5.json": False}
+
+            after = core.export_tree("schemas", "public")["snapshot_root"]
+            assert core.compare_snapshots(before, after) == ["schemas/s5.json"]
+
+    def test_proofs_and_round_trip(self):
+        from src.opencore.merkle import MerkleTree
+        leaves = [(f"p{i}", f"h{i}") for i in range(5)]
+        tree = MerkleTree(leaves)
+        for path, content_hash in leaves:
+            assert MerkleTree.verify_proof(path, content_hash, tree.proof(path), tree.root)
+        assert not MerkleTree.verify_proof("p1", "bad", tree.proof("p1"), tree.root)
+        assert MerkleTree.from_dict(tree.to_dict()).root == tree.root
+        assert tree.diff(MerkleTree(leaves[:4])) == ["p4"]
+
+
+class TestExportArchive:
+    """Test deterministic streaming archive export."""
+
+    def _make_tree(self, tmpdir):
+        schema_dir = Path(tmpdir) / "schemas"
+        schema_dir.mkdir()
+        (schema_dir / "b.json").write_text("path: C:\\Users\\dev\\SSID-Workspace\\x\\y")
+        (schema_dir / "a.json").write_text("a" * 3000)
+
+    def test_archive_is_deterministic_and_sorted(self):
+        import tarfile
+        import time as _time
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._make_tree(tmpdir)
+            first = Path(tmpdir) / "one.tar.gz"
+            second = Path(tmpdir) / "two.tar.gz"
+            result = OpenCoreCore(tmpdir).export_archive("schemas", str(first), "public")
+            _time.sleep(0.01)
+            OpenCoreCore(tmpdir).export_archive("schemas", str(second), "public", spool_limit=0)
+            assert first.read_bytes() == second.read_bytes()
+
+            with tarfile.open(first) as tar:
+                assert tar.getnames() == ["public/a.json", "public/b.json"]
+                member = tar.getmember("public/b.json")
+                assert member.mtime == 0 and member.uid == 0
+                assert b"[REDACTED_WORKSPACE]" in tar.extractfile(member).read()
+            sidecar = json.loads(Path(result["sidecar"]).read_text())
+            assert [m["name"] for m in sidecar["members"]] == ["public/a.json", "public/b.json"]
+            assert sidecar["members"][0]["data_offset"] == 512
+
+    def test_archive_manifests_match_export_content(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._make_tree(tmpdir)
+            expected = OpenCoreCore(tmpdir).export_content("schemas/b.json", "public/b.json")
+            result = OpenCoreCore(tmpdir).export_archive(
+                "schemas", str(Path(tmpdir) / "out.tar.xz"), "public", compression="xz"
+            )
+            assert expected.manifest_id in {m["manifest_id"] for m in result["members"]}
+
+    @pytest.mark.parametrize("source_root", ["./schemas", "schemas/", "/schemas/"])
+    def test_archive_normalizes_source_root(self, source_root):
+        import tarfile
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._make_tree(tmpdir)
+            archive = Path(tmpdir) / "out.tar.gz"
+            OpenCoreCore(tmpdir).export_archive(source_root, str(archive), "public")
+            with tarfile.open(archive) as tar:
+                assert tar.getnames() == ["public/a.json", "public/b.json"]
+
+
+class TestIncrementalExport:
+    """Test change-list driven incremental export."""
+
+    def test_export_changes_from_name_status(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir) / "schemas"
+            schema_dir.mkdir()
+            (schema_dir / "old.json").write_text('{"v": 1}')
+            (schema_dir / "gone.json").write_text('{"v": 2}')
+            core = OpenCoreCore(tmpdir)
+            core.export_tree("schemas", "public")
+
+            (schema_dir / "gone.json").unlink()
+            (schema_dir / "new.json").write_text('{"v": 3}')
+            (Path(tmpdir) / "internal").mkdir()
+            (Path(tmpdir) / "internal" / "x.json").write_text("{}")
+            diff = "D\0schemas/gone.json\0A\0schemas/new.json\0A\0internal/x.json\0"
+
+            result = core.export_changes(diff, "public")
+            assert [m.export_path for m in result["exported"]] == ["public/schemas/new.json"]
+            assert result["skipped"] == ["internal/x.json"]
+            assert len(result["revoked"]) == 1
+            revoked = core.list_exports(status="REVOKED")
+            assert [m["source_path"] for m in revoked] == ["schemas/gone.json"]
+
+    def test_rename_revokes_old_and_exports_new(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir) / "schemas"
+            schema_dir.mkdir()
+            (schema_dir / "a.json").write_text("{}")
+            core = OpenCoreCore(tmpdir)
+            core.export_content("schemas/a.json", "schemas/a.json")
+            (schema_dir / "a.json").rename(schema_dir / "b.json")
+
+            result = core.export_changes([("R100", "schemas/a.json", "schemas/b.json")])
+            assert len(result["revoked"]) == 1
+            assert [m.export_path for m in result["exported"]] == ["schemas/b.json"]
+
+    def test_modify_supersedes_previous_manifest(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir) / "schemas"
+            schema_dir.mkdir()
+            (schema_dir / "a.json").write_text('{"v": 1}')
+            db_path = str(Path(tmpdir) / "registry.db")
+            core = OpenCoreCore(tmpdir, registry_path=db_path)
+            old_id = core.export_content("schemas/a.json", "schemas/a.json").manifest_id
+
+            (schema_dir / "a.json").write_text('{"v": 2}')
+            result = core.export_changes("M\tschemas/a.json\n")
+            new_id = result["exported"][0].manifest_id
+            assert result["superseded"] == [old_id]
+            assert core.verify_export(old_id)["status"] == "SUPERSEDED"
+            assert core.verify_export(new_id)["status"] == "EXPORTED"
+            core.close()
+
+            restarted = OpenCoreCore(tmpdir, registry_path=db_path)
+            assert restarted.verify_export(old_id)["status"] == "SUPERSEDED"
+            restarted.close()
+
+    def test_git_diff_from_subdirectory_core_root(self):
+        import subprocess
+        with tempfile.TemporaryDirectory() as tmpdir:
+            core_root = Path(tmpdir) / "core"
+            (core_root / "schemas").mkdir(parents=True)
+            (core_root / "schemas" / "a.json").write_text("{}")
+
+            def git(*args):
+                subprocess.run(
+                    ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+                    cwd=tmpdir, check=True, capture_output=True,
+                )
+
+            git("init", "-q")
+            git("add", "-A")
+            git("commit", "-q", "-m", "base")
+            (core_root / "schemas" / "b.json").write_text("{}")
+            git("add", "-A")
+
+            result = OpenCoreCore(str(core_root)).export_git_diff("HEAD")
+            assert [m.export_path for m in result["exported"]] == ["schemas/b.json"]
+            assert result["skipped"] == []
+
+    def test_git_diff_refuses_working_tree_not_at_head(self):
+        import subprocess
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema = Path(tmpdir) / "schemas" / "a.json"
+            schema.parent.mkdir()
+
+            def git(*args):
+                return subprocess.run(
+                    ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+                    cwd=tmpdir, check=True, capture_output=True, text=True,
+                ).stdout.strip()
+
+            git("init", "-q")
+            schema.write_text('{"v": 1}')
+            git("add", "-A")
+            git("commit", "-q", "-m", "v1")
+            base = git("rev-parse", "HEAD")
+            schema.write_text('{"v": 2}')
+            git("commit", "-q", "-am", "v2")
+            head = git("rev-parse", "HEAD")
+            schema.write_text('{"v": 3}')
+            git("commit", "-q", "-am", "v3")
+
+            core = OpenCoreCore(tmpdir)
+            # The checkout holds v3, not the v2 being diffed
+            with pytest.raises(ValueError):
+                core.export_git_diff(base, head)
+            git("checkout", "-q", head)
+            schema.write_text('{"v": 9}')
+            with pytest.raises(ValueError):
+                core.export_git_diff(base, head)
+            assert core.list_exports() == []
+
+            git("checkout", "-q", "--", ".")
+            result = core.export_git_diff(base, head)
+            expected = OpenCoreCore(tmpdir).export_content("schemas/a.json", "x").content_hash
+            assert [m.content_hash for m in result["exported"]] == [expected]
+
+
+class TestExportRegistry:
+    """Test the durable SQLite export registry."""
+
+    def test_state_survives_restart(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir) / "schemas"
+            schema_dir.mkdir()
+            (schema_dir / "a.json").write_text('{"a": 1}')
+            (schema_dir / "b.json").write_text('{"b": 1}')
+            db_path = str(Path(tmpdir) / "registry.db")
+
+            core = OpenCoreCore(tmpdir, registry_path=db_path)
+            result = core.export_tree("schemas", "public")
+            revoked = result["manifests"][0].manifest_id
+            core.revoke_export(revoked)
+            core.close()
+
+            restarted = OpenCoreCore(tmpdir, registry_path=db_path)
+            assert len(restarted.list_exports()) == 2
+            assert restarted.verify_export(revoked)["status"] == "REVOKED"
+            restarted.close()
+
+    def test_export_json_and_hash_lookup(self):
+        from src.opencore.registry import ExportRegistry
+        with tempfile.TemporaryDirectory() as tmpdir:
+            json_path = Path(tmpdir) / "registry.json"
+            json_path.write_text(json.dumps({"registry_version": "1.0.0", "manifests": []}))
+            with ExportRegistry(Path(tmpdir) / "registry.db") as registry:
+                registry.upsert_many([
+                    ("m1", "SSID", "schemas/a.json", "public/a.json", "abc", "t0", "EXPORTED"),
+                    ("m2", "SSID", "schemas/b.json", "public/b.json", "abc", "t1", "EXPORTED"),
+                ])
+                assert [r["manifest_id"] for r in registry.find_by_hash("abc")] == ["m1", "m2"]
+                assert registry.export_json(json_path) == 2
+            data = json.loads(json_path.read_text())
+            assert data["registry_version"] == "1.0.0"
+            assert [e["manifest_id"] for e in data["exports"]] == ["m1", "m2"]
+
+
 class TestListExportable:
     """Test listing exportable content."""
 